@@ -1,5 +1,10 @@
 
-from itertools import combinations
+import heapq
+import time
+
+from eclat import eclat
+from fp_growth import fp_growth
+from support_counting import calculate_support_bitset, vertical_bitsets
 
 transactions = [
     ['milk', 'bread', 'butter'],
@@ -11,26 +16,124 @@ transactions = [
 
 min_support = 0.6  
 min_confidence = 0.7  
+def item_order(itemsets):
+    """Rank every item of itemsets, so itemsets can be kept as sorted tuples of any hashable items"""
+    order = {}
+    for itemset in itemsets:
+        for item in itemset:
+            if item not in order:
+                order[item] = len(order)
+    return order
+
 def create_candidates(frequent_itemsets, k):
+    """Apriori-gen: join the frequent (k-1)-itemsets sharing their first k-2 items, then prune.
+
+    A candidate survives the prune only if every (k-1)-subset of it is
+    frequent, since an itemset can't be more frequent than its subsets.
+    """
+    order = item_order(frequent_itemsets)
+    rank = order.__getitem__
+    previous = sorted(
+        (tuple(sorted(itemset, key=rank)) for itemset in frequent_itemsets if len(itemset) == k - 1),
+        key=lambda itemset: [rank(item) for item in itemset],
+    )
+    frequent = set(previous)
+
     candidates = []
-    items = set()
-    for itemset in frequent_itemsets:
-        for item in itemset:
-            items.add(item)
-    items = list(items)
-    for combination in combinations(items, k):
-        candidates.append(set(combination))
+    for i, first in enumerate(previous):
+        for second in previous[i + 1:]:
+            # previous is sorted, so itemsets sharing a prefix are adjacent
+            if first[:-1] != second[:-1]:
+                break
+            candidate = first + second[-1:]
+            if all(candidate[:j] + candidate[j + 1:] in frequent for j in range(k - 2)):
+                candidates.append(set(candidate))
     return candidates
 
-def calculate_support(transactions, candidates):
-    support_count = {}
+class HashTree:
+    """Hash tree of k-itemsets, counting all of them in one pass over the transactions.
+
+    Interior nodes hash the item at their depth into one of `branches`
+    children; leaves hold up to `max_leaf_size` candidates. A transaction
+    only visits the leaves reachable through its own items, and only
+    candidates in those leaves are checked against it.
+    """
+
+    def __init__(self, candidates, order, max_leaf_size=8, branches=16):
+        self.order = order
+        self.max_leaf_size = max_leaf_size
+        self.branches = branches
+        self.k = len(candidates[0]) if candidates else 0
+        self.counts = {candidate: 0 for candidate in candidates}
+        self.root = []
+        for candidate in candidates:
+            self.root = self._insert(self.root, candidate, 0)
+
+    def _bucket(self, item):
+        return self.order[item] % self.branches
+
+    def _insert(self, node, candidate, depth):
+        if isinstance(node, list):
+            node.append(candidate)
+            if len(node) <= self.max_leaf_size or depth == self.k:
+                return node
+            # Leaf overflow: turn it into an interior node
+            node, leaf = {}, node
+            for candidate in leaf:
+                bucket = self._bucket(candidate[depth])
+                node[bucket] = self._insert(node.get(bucket, []), candidate, depth + 1)
+            return node
+        bucket = self._bucket(candidate[depth])
+        node[bucket] = self._insert(node.get(bucket, []), candidate, depth + 1)
+        return node
+
+    def add_transaction(self, transaction):
+        """Count every candidate contained in transaction (a set)"""
+        items = sorted((item for item in transaction if item in self.order), key=self.order.__getitem__)
+        if len(items) >= self.k:
+            self._walk(self.root, items, 0, 0, transaction, set())
+
+    def _walk(self, node, items, start, depth, transaction, seen):
+        if isinstance(node, list):
+            # Hash collisions can lead to the same leaf along several paths
+            if id(node) not in seen:
+                seen.add(id(node))
+                for candidate in node:
+                    if transaction.issuperset(candidate):
+                        self.counts[candidate] += 1
+            return
+        for i in range(start, len(items) - (self.k - depth) + 1):
+            child = node.get(self._bucket(items[i]))
+            if child is not None:
+                self._walk(child, items, i + 1, depth + 1, transaction, seen)
+
+def count_support(transactions, candidates):
+    """Number of transactions (sets, read once) containing each candidate, keyed by frozenset"""
+    order = item_order(candidates)
+    by_size = {}
     for candidate in candidates:
-        count = 0
-        for transaction in transactions:
-            if candidate.issubset(transaction):
-                count += 1
-        support_count[frozenset(candidate)] = count / len(transactions)
-    return support_count
+        by_size.setdefault(len(candidate), []).append(tuple(sorted(candidate, key=order.__getitem__)))
+
+    singles = {candidate: 0 for candidate in by_size.pop(1, [])}
+    trees = [HashTree(group, order) for group in by_size.values()]
+    for transaction in transactions:
+        if singles:
+            for item in transaction:
+                if (item,) in singles:
+                    singles[(item,)] += 1
+        for tree in trees:
+            tree.add_transaction(transaction)
+
+    counts = {frozenset(candidate): count for candidate, count in singles.items()}
+    for tree in trees:
+        for candidate, count in tree.counts.items():
+            counts[frozenset(candidate)] = count
+    return counts
+
+def calculate_support(transactions, candidates):
+    """Support of every candidate, counted with one hash tree per candidate size"""
+    counts = count_support(transactions, candidates)
+    return {itemset: count / len(transactions) for itemset, count in counts.items()}
 
 def filter_itemsets(support_count, min_support):
     frequent_itemsets = []
@@ -39,48 +142,143 @@ def filter_itemsets(support_count, min_support):
             frequent_itemsets.append(set(itemset))
     return frequent_itemsets
 
-def apriori(transactions, min_support):
-    transactions = list(map(set, transactions))
-    
-    items = set()
-    for transaction in transactions:
-        for item in transaction:
-            items.add(item)
+def apriori(transactions, min_support, counting='scan', stats=None, return_support=False):
+    """Frequent itemsets, level by level.
+
+    counting='scan' walks every transaction through a hash tree of the
+    candidates; counting='bitset' counts on vertical bitsets (one AND +
+    popcount per candidate) and gives the same result. If stats is a
+    list, one dict per level is appended to it with the number of
+    candidates, the number found frequent and the seconds spent counting
+    and generating the next level's candidates.
+
+    transactions may also be a TransactionStore; the itemsets found then
+    hold item IDs, which store.decode() maps back to items. Only bitset
+    counting reads the store's CSR arrays directly: scan counting copies
+    every basket into a Python set first, which gives up the store's
+    memory saving.
+
+    With return_support=True the result is (itemsets, support), where
+    support maps every frequent itemset (as a frozenset) to its support.
+    """
+    if counting not in ('scan', 'bitset'):
+        raise ValueError(f"unknown counting: {counting}")
+    if counting == 'bitset':
+        # Counting only needs the bitsets, so the transactions are never copied
+        bitsets, n_transactions = vertical_bitsets(transactions)
+        items = set(bitsets)
+    else:
+        transactions = list(map(set, transactions))
+        items = set()
+        for transaction in transactions:
+            for item in transaction:
+                items.add(item)
     candidates = [set([item]) for item in items]
     
     all_frequent_itemsets = []
+    support = {}
     k = 1
     while candidates:
-        support_count = calculate_support(transactions, candidates)
+        start = time.perf_counter()
+        if counting == 'bitset':
+            support_count = calculate_support_bitset(bitsets, n_transactions, candidates)
+        else:
+            support_count = calculate_support(transactions, candidates)
         frequent_itemsets = filter_itemsets(support_count, min_support)
         if frequent_itemsets:
             all_frequent_itemsets.extend(frequent_itemsets)
+            for itemset in frequent_itemsets:
+                itemset = frozenset(itemset)
+                support[itemset] = support_count[itemset]
+        next_candidates = create_candidates(frequent_itemsets, k + 1)
+        if stats is not None:
+            stats.append({
+                'level': k,
+                'candidates': len(candidates),
+                'frequent': len(frequent_itemsets),
+                'seconds': time.perf_counter() - start,
+            })
         k += 1
-        candidates = create_candidates(frequent_itemsets, k)
+        candidates = next_candidates
+    if return_support:
+        return all_frequent_itemsets, support
     return all_frequent_itemsets
 
-def generate_rules(frequent_itemsets, transactions, min_confidence):
+ENGINES = {
+    'apriori': apriori,
+    'fp-growth': fp_growth,
+    'eclat': eclat,
+}
+
+def find_frequent_itemsets(transactions, min_support, engine='apriori', return_support=False):
+    """Frequent itemsets as a list of sets, mined by the engine named in ENGINES"""
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine: {engine}")
+    return ENGINES[engine](transactions, min_support, return_support=return_support)
+
+def _support_map(frequent_itemsets, transactions, support):
+    # Count the supports in one pass only when no engine supplied them
+    if support is not None:
+        return support
+    if transactions is None:
+        raise ValueError("generate_rules needs either transactions or a support map")
     transactions = list(map(set, transactions))
-    rules = []
-    for itemset in frequent_itemsets:
-        if len(itemset) > 1:
-            for i in range(1, len(itemset)):
-                for antecedent in combinations(itemset, i):
-                    antecedent = set(antecedent)
-                    consequent = itemset - antecedent
-                    support_count_itemset = sum(1 for t in transactions if itemset.issubset(t)) / len(transactions)
-                    support_count_antecedent = sum(1 for t in transactions if antecedent.issubset(t)) / len(transactions)
-                    confidence = support_count_itemset / support_count_antecedent
-                    if confidence >= min_confidence:
-                        rules.append((antecedent, consequent, confidence))
-    return rules
-
-frequent_itemsets = apriori(transactions, min_support)
-print("Frequent Itemsets:")
-for itemset in frequent_itemsets:
-    print(itemset)
-
-rules = generate_rules(frequent_itemsets, transactions, min_confidence)
-print("\nAssociation Rules:")
-for antecedent, consequent, confidence in rules:
-    print(f"{set(antecedent)} -> {set(consequent)} (Confidence: {confidence:.2f})")
+    return calculate_support(transactions, list(map(set, frequent_itemsets)))
+
+def iter_rules(frequent_itemsets, transactions, min_confidence, support=None):
+    """Yield (antecedent, consequent, confidence) for every rule reaching min_confidence.
+
+    Confidences are read from the support map (itemset -> support) that
+    the engines return with return_support=True; without it the supports
+    of the frequent itemsets are counted once. Consequents grow as in
+    ap-genrules: a consequent of m + 1 items is only tried if all its
+    m-item subsets gave confident rules, because moving an item from the
+    antecedent to the consequent never raises the confidence.
+    """
+    support = _support_map(frequent_itemsets, transactions, support)
+    for itemset in map(frozenset, frequent_itemsets):
+        if len(itemset) < 2:
+            continue
+        itemset_support = support[itemset]
+        consequents = [{item} for item in itemset]
+        m = 1
+        while consequents and m < len(itemset):
+            confident = []
+            for consequent in consequents:
+                antecedent = itemset - consequent
+                confidence = itemset_support / support[antecedent]
+                if confidence >= min_confidence:
+                    confident.append(consequent)
+                    yield set(antecedent), set(consequent), confidence
+            m += 1
+            consequents = create_candidates(confident, m)
+
+def generate_rules(frequent_itemsets, transactions, min_confidence, support=None, top_k=None):
+    """List the rules of iter_rules, or only the top_k most confident ones"""
+    rules = iter_rules(frequent_itemsets, transactions, min_confidence, support)
+    if top_k is not None:
+        return heapq.nlargest(top_k, rules, key=lambda rule: rule[2])
+    return list(rules)
+
+if __name__ == "__main__":
+    stats = []
+    apriori(transactions, min_support, stats=stats)
+    print("Apriori levels:")
+    for level in stats:
+        print(f"  k={level['level']}: {level['candidates']} candidates, "
+              f"{level['frequent']} frequent, {level['seconds'] * 1000:.2f} ms")
+    print()
+
+    for engine in ENGINES:
+        frequent_itemsets, support = find_frequent_itemsets(
+            transactions, min_support, engine, return_support=True
+        )
+        print(f"Frequent Itemsets ({engine}):")
+        for itemset in frequent_itemsets:
+            print(itemset)
+
+        rules = generate_rules(frequent_itemsets, None, min_confidence, support=support)
+        print("\nAssociation Rules:")
+        for antecedent, consequent, confidence in rules:
+            print(f"{set(antecedent)} -> {set(consequent)} (Confidence: {confidence:.2f})")
+        print()
@@ -0,0 +1,88 @@
+
+import argparse
+import math
+import random
+from itertools import accumulate
+
+
+def _poisson(rng, mean):
+    # Knuth's method; the means used here are small
+    limit = math.exp(-mean)
+    count = 0
+    product = rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def generate_patterns(rng, n_patterns, avg_pattern_size, n_items, correlation):
+    """Potentially frequent itemsets, each with a pick weight and a corruption level"""
+    patterns = []
+    previous = []
+    for _ in range(n_patterns):
+        size = min(max(_poisson(rng, avg_pattern_size - 1) + 1, 1), n_items)
+        # Part of every pattern is drawn from the one before it
+        shared = min(int(rng.expovariate(1 / correlation) * size), size, len(previous))
+        items = set(rng.sample(previous, shared))
+        while len(items) < size:
+            items.add(rng.randrange(n_items))
+        weight = rng.expovariate(1)
+        corruption = min(max(rng.gauss(0.5, 0.1), 0.0), 1.0)
+        patterns.append((sorted(items), weight, corruption))
+        previous = sorted(items)
+    return patterns
+
+
+def generate_baskets(n_transactions, avg_size=10, n_items=1000, n_patterns=200,
+                     avg_pattern_size=4, correlation=0.5, seed=0):
+    """Synthetic market baskets in the style of the IBM Quest generator.
+
+    Transactions are built from a pool of n_patterns potentially frequent
+    itemsets (average size avg_pattern_size) over n_items items. Each
+    basket has a Poisson-distributed size with mean avg_size and is
+    filled with patterns picked by weight; every pattern loses some of its
+    items according to its corruption level, so patterns show up partly.
+    Returns a list of baskets, each a list of item names.
+    """
+    rng = random.Random(seed)
+    patterns = generate_patterns(rng, n_patterns, avg_pattern_size, n_items, correlation)
+    cum_weights = list(accumulate(weight for _, weight, _ in patterns))
+
+    baskets = []
+    carried = None
+    for _ in range(n_transactions):
+        size = max(_poisson(rng, avg_size), 1)
+        basket = set()
+        while len(basket) < size:
+            if carried is not None:
+                items, carried = carried, None
+            else:
+                items, _, corruption = rng.choices(patterns, cum_weights=cum_weights)[0]
+                items = [item for item in items if rng.random() >= corruption] or items[:1]
+            if len(basket) + len(items) > size and basket and rng.random() < 0.5:
+                # Too big: keep the pattern for the next basket
+                carried = items
+                break
+            basket.update(items)
+        baskets.append([f"item{item}" for item in sorted(basket)])
+    return baskets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic baskets, one per line")
+    parser.add_argument("path")
+    parser.add_argument("--transactions", type=lambda text: int(float(text)), default=100000)
+    parser.add_argument("--avg-size", type=float, default=10)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--patterns", type=int, default=200)
+    parser.add_argument("--avg-pattern-size", type=float, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    baskets = generate_baskets(args.transactions, args.avg_size, args.items, args.patterns,
+                               args.avg_pattern_size, seed=args.seed)
+    with open(args.path, 'w') as f:
+        for basket in baskets:
+            f.write(','.join(basket) + '\n')
+    print(f"Wrote {len(baskets)} baskets to {args.path}")
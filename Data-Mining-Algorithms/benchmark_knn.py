@@ -0,0 +1,151 @@
+"""Prediction benchmark for the KNN search paths.
+
+Generates labelled Gaussian clusters and, for each (training size,
+dimension) pair, fits every method and predicts the same queries. Each
+run records the fit time, the predict time, queries per second, the
+accuracy on held-out labels, and how close the results are to the exact
+brute-force path: how often the predictions agree, and recall@k (the
+share of the exact k nearest neighbours found). The report is JSON, like
+the one benchmark_mining.py writes.
+
+Usage (from this folder):
+
+    python benchmark_knn.py --sizes 1e4,1e5 --dims 2,8,32 --queries 200 --output knn.json
+    python benchmark_knn.py --sizes 1e6 --dims 64 --methods brute,rp_forest --trees 20 --probes 4
+    python benchmark_knn.py --sizes 1e6 --dims 64 --methods brute --queries 5000 --jobs 8
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from knn import KNN
+
+METHODS = {
+    'brute': {'algorithm': 'brute'},
+    'kd_tree': {'algorithm': 'kd_tree'},
+    'ball_tree': {'algorithm': 'ball_tree'},
+    'rp_forest': {'algorithm': 'rp_forest'},
+}
+
+
+def make_clusters(n_samples, n_features, n_classes=10, spread=1.0, seed=0):
+    """Points around n_classes random centres, labelled by their centre"""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-10, 10, size=(n_classes, n_features))
+    y = rng.integers(n_classes, size=n_samples)
+    X = centers[y] + rng.normal(scale=spread, size=(n_samples, n_features))
+    return X, y
+
+
+def recall_at_k(indices, exact_indices):
+    """Mean share of each row's exact neighbours that also appear in indices"""
+    found = sum(len(set(row) & set(exact)) for row, exact in zip(indices.tolist(), exact_indices.tolist()))
+    return found / exact_indices.size if exact_indices.size else 1.0
+
+
+def run_method(method, X_train, y_train, X_test, y_test, k, options, reference=None):
+    """Fit and predict with one method.
+
+    reference is the (predictions, neighbour indices) of the exact path;
+    without it the agreement and recall columns are left out.
+    """
+    model = KNN(k=k, **options, **METHODS[method])
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fitted = time.perf_counter()
+    predictions = model.predict(X_test)
+    done = time.perf_counter()
+    # Outside the timing: a second search just to see which neighbours were found
+    _, indices = model.kneighbors(X_test)
+    model.close()
+
+    row = {
+        'method': method,
+        'fit_seconds': fitted - start,
+        'predict_seconds': done - fitted,
+        'queries_per_sec': len(X_test) / (done - fitted),
+        'accuracy': float(np.mean(predictions == y_test)),
+    }
+    if reference is not None:
+        row['agreement'] = float(np.mean(predictions == reference[0]))
+        row['recall'] = recall_at_k(indices, reference[1])
+    return row, (predictions, indices)
+
+
+def run_benchmark(sizes, dims, methods, queries=200, k=5, options=None, seed=0, log=None):
+    """options holds KNN keyword arguments shared by every method (leaf_size, n_trees, ...)"""
+    options = options or {}
+    results = []
+    for size in sizes:
+        for n_features in dims:
+            X, y = make_clusters(size + queries, n_features, seed=seed)
+            X_train, y_train, X_test, y_test = X[:size], y[:size], X[size:], y[size:]
+            # Every method is checked against the exact brute-force answers
+            _, reference = run_method('brute', X_train, y_train, X_test, y_test, k, options)
+            for method in methods:
+                row = {'train': size, 'features': n_features, 'queries': queries, 'k': k}
+                row.update(run_method(method, X_train, y_train, X_test, y_test, k, options, reference)[0])
+                results.append(row)
+                if log is not None:
+                    log(format_row(row))
+    return results
+
+
+def format_row(row):
+    return (f"{row['method']:<12} n={row['train']:<9} d={row['features']:<5} "
+            f"{row['fit_seconds']:8.3f} s fit {row['predict_seconds']:8.3f} s predict "
+            f"{row['queries_per_sec']:10.1f} queries/s {row['accuracy']:7.2%} accuracy "
+            f"{row['agreement']:7.2%} agreement {row['recall']:7.2%} recall@k")
+
+
+def _numbers(cast):
+    return lambda text: [cast(float(part)) for part in text.split(',') if part]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=_numbers(int), default=[10000, 100000],
+                        help='comma separated training set sizes')
+    parser.add_argument('--dims', type=_numbers(int), default=[2, 8, 32],
+                        help='comma separated feature counts')
+    parser.add_argument('--methods', default=','.join(METHODS),
+                        help='comma separated method names')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('-k', type=int, default=5)
+    parser.add_argument('--leaf-size', type=int, default=40)
+    parser.add_argument('--trees', type=int, default=10, help='trees in the rp_forest method')
+    parser.add_argument('--probes', type=int, default=2, help='extra rp_forest leaves visited per tree')
+    parser.add_argument('--jobs', type=int, help='worker processes per method (-1 for every core)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the JSON report to this file')
+    args = parser.parse_args(argv)
+
+    methods = args.methods.split(',')
+    unknown = [method for method in methods if method not in METHODS]
+    if unknown:
+        parser.error(f"unknown methods: {', '.join(unknown)}")
+
+    options = {'leaf_size': args.leaf_size, 'n_trees': args.trees, 'n_probes': args.probes,
+               'n_jobs': args.jobs}
+    results = run_benchmark(args.sizes, args.dims, methods, args.queries, args.k, options,
+                            args.seed, log=print)
+    report = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'options': options,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
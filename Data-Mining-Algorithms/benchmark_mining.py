@@ -0,0 +1,163 @@
+"""Scaling benchmark for the frequent itemset engines.
+
+Generates synthetic baskets with basket_generator.py and runs every engine
+for each (transaction count, min_support) pair, recording the time, the
+peak traced memory and the number of itemsets and rules found. The report
+is JSON, so runs of two versions can be diffed or compared with
+--baseline.
+
+Usage (from this folder):
+
+    python benchmark_mining.py --sizes 1e4,1e5 --min-supports 0.01,0.005 --output mining.json
+    python benchmark_mining.py --sizes 1e4,1e5 --min-supports 0.01,0.005 --baseline mining.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from apriori_algorithm import apriori, generate_rules
+from basket_generator import generate_baskets
+from eclat import eclat
+from fp_growth import fp_growth
+from transaction_store import TransactionStore
+
+ENGINES = {
+    'apriori': lambda transactions, min_support: apriori(transactions, min_support, return_support=True),
+    'apriori-bitset': lambda transactions, min_support: apriori(
+        transactions, min_support, counting='bitset', return_support=True
+    ),
+    'eclat': lambda transactions, min_support: eclat(transactions, min_support, return_support=True),
+    'fp-growth': lambda transactions, min_support: fp_growth(transactions, min_support, return_support=True),
+    'eclat-store': lambda transactions, min_support: eclat(
+        TransactionStore.from_transactions(transactions), min_support, return_support=True
+    ),
+}
+
+
+def run_engine(engine, transactions, min_support, min_confidence, measure_memory=True):
+    """Time one engine plus rule generation; optionally rerun it under tracemalloc for peak memory"""
+    start = time.perf_counter()
+    itemsets, support = ENGINES[engine](transactions, min_support)
+    mined = time.perf_counter()
+    rules = generate_rules(itemsets, None, min_confidence, support=support)
+    done = time.perf_counter()
+
+    row = {
+        'engine': engine,
+        'itemsets': len(itemsets),
+        'rules': len(rules),
+        'largest_itemset': max(map(len, itemsets), default=0),
+        'mining_seconds': mined - start,
+        'rules_seconds': done - mined,
+    }
+    if measure_memory:
+        # Tracing slows everything down, so memory gets a run of its own
+        tracemalloc.start()
+        ENGINES[engine](transactions, min_support)
+        row['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return row
+
+
+def run_benchmark(sizes, min_supports, engines, min_confidence=0.5, avg_size=10, n_items=1000,
+                  n_patterns=200, seed=0, measure_memory=True, log=None):
+    results = []
+    for size in sizes:
+        transactions = generate_baskets(size, avg_size, n_items, n_patterns, seed=seed)
+        for min_support in min_supports:
+            for engine in engines:
+                row = {'transactions': size, 'min_support': min_support}
+                row.update(run_engine(engine, transactions, min_support, min_confidence, measure_memory))
+                results.append(row)
+                if log is not None:
+                    log(format_row(row))
+    return results
+
+
+def format_row(row):
+    line = (f"{row['engine']:<15} n={row['transactions']:<9} min_support={row['min_support']:<7} "
+            f"{row['mining_seconds']:8.2f} s mining {row['rules_seconds']:7.2f} s rules "
+            f"{row['itemsets']:>7} itemsets {row['rules']:>7} rules")
+    if 'peak_bytes' in row:
+        line += f" {row['peak_bytes'] / 2 ** 20:8.1f} MiB peak"
+    return line
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25):
+    """Describe every run that got slower than tolerance allows or found different counts"""
+    def key(row):
+        return row['engine'], row['transactions'], row['min_support']
+
+    previous = {key(row): row for row in baseline}
+    problems = []
+    for row in results:
+        old = previous.get(key(row))
+        if old is None:
+            continue
+        name = '/'.join(map(str, key(row)))
+        if row['mining_seconds'] > old['mining_seconds'] * (1 + tolerance):
+            problems.append(f"{name}: {row['mining_seconds']:.2f} s vs baseline {old['mining_seconds']:.2f} s")
+        if (row['itemsets'], row['rules']) != (old['itemsets'], old['rules']):
+            problems.append(f"{name}: {row['itemsets']} itemsets / {row['rules']} rules "
+                            f"vs baseline {old['itemsets']} / {old['rules']}")
+    return problems
+
+
+def _numbers(cast):
+    return lambda text: [cast(float(part)) for part in text.split(',') if part]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=_numbers(int), default=[10000, 100000],
+                        help='comma separated transaction counts')
+    parser.add_argument('--min-supports', type=_numbers(float), default=[0.02, 0.01, 0.005])
+    parser.add_argument('--engines', default=','.join(ENGINES),
+                        help='comma separated engine names')
+    parser.add_argument('--min-confidence', type=float, default=0.5)
+    parser.add_argument('--avg-size', type=float, default=10)
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--patterns', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc runs')
+    parser.add_argument('--output', help='write the JSON report to this file')
+    parser.add_argument('--baseline', help='JSON report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    engines = args.engines.split(',')
+    unknown = [engine for engine in engines if engine not in ENGINES]
+    if unknown:
+        parser.error(f"unknown engines: {', '.join(unknown)}")
+
+    results = run_benchmark(args.sizes, args.min_supports, engines, args.min_confidence, args.avg_size,
+                            args.items, args.patterns, args.seed, not args.no_memory, log=print)
+    report = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'generator': {'avg_size': args.avg_size, 'items': args.items,
+                      'patterns': args.patterns, 'seed': args.seed},
+        'min_confidence': args.min_confidence,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        problems = compare_to_baseline(results, baseline, args.tolerance)
+        for line in problems:
+            print('REGRESSION', line)
+        if problems:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
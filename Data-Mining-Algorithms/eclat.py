@@ -0,0 +1,53 @@
+
+from support_counting import min_support_count, popcount, vertical_bitsets
+
+
+def _eclat(prefix, columns, min_count, results):
+    # columns: (item, bitset of prefix + item) for items after the prefix
+    for i, (item, bits) in enumerate(columns):
+        itemset = prefix | {item}
+        results.append((itemset, popcount(bits)))
+        extensions = []
+        for other, other_bits in columns[i + 1:]:
+            both = bits & other_bits
+            if popcount(both) >= min_count:
+                extensions.append((other, both))
+        if extensions:
+            _eclat(itemset, extensions, min_count, results)
+
+
+def eclat(transactions, min_support, return_support=False):
+    """Frequent itemsets by depth-first Eclat; same inputs and output as apriori()"""
+    bitsets, n = vertical_bitsets(transactions)
+    if not n:
+        return ([], {}) if return_support else []
+    min_count = min_support_count(n, min_support)
+
+    # Rarest items first keeps the intersections small early on
+    columns = sorted(
+        ((item, bits) for item, bits in bitsets.items() if popcount(bits) >= min_count),
+        key=lambda column: popcount(column[1]),
+    )
+    results = []
+    _eclat(frozenset(), columns, min_count, results)
+
+    # Same order as apriori: all 1-itemsets, then 2-itemsets, ...
+    results.sort(key=lambda result: len(result[0]))
+    itemsets = [set(itemset) for itemset, count in results]
+    if return_support:
+        return itemsets, {itemset: count / n for itemset, count in results}
+    return itemsets
+
+
+if __name__ == "__main__":
+    transactions = [
+        ['milk', 'bread', 'butter'],
+        ['beer', 'bread'],
+        ['milk', 'bread', 'butter', 'beer'],
+        ['bread', 'butter'],
+        ['milk', 'bread', 'beer']
+    ]
+
+    print("Frequent Itemsets (Eclat):")
+    for itemset in eclat(transactions, 0.4):
+        print(itemset)
@@ -0,0 +1,125 @@
+
+from itertools import combinations
+
+from support_counting import min_support_count
+
+
+class FPNode:
+    """One node of an FP-tree: an item and the number of transactions sharing the path to it"""
+    __slots__ = ("item", "count", "parent", "children")
+
+    def __init__(self, item, parent):
+        self.item = item
+        self.count = 0
+        self.parent = parent
+        self.children = {}
+
+
+def build_fp_tree(weighted_transactions, min_count):
+    """Build an FP-tree from (items, count) pairs in two passes.
+
+    Returns (root, header, counts): header maps every frequent item to the
+    list of its nodes, counts maps it to its support count. Items are
+    inserted in descending support order so common prefixes are shared.
+    """
+    counts = {}
+    for items, weight in weighted_transactions:
+        for item in items:
+            counts[item] = counts.get(item, 0) + weight
+    counts = {item: count for item, count in counts.items() if count >= min_count}
+    rank = {item: i for i, item in enumerate(sorted(counts, key=lambda item: -counts[item]))}
+
+    root = FPNode(None, None)
+    header = {item: [] for item in rank}
+    for items, weight in weighted_transactions:
+        path = sorted((item for item in set(items) if item in rank), key=rank.__getitem__)
+        node = root
+        for item in path:
+            child = node.children.get(item)
+            if child is None:
+                child = FPNode(item, node)
+                node.children[item] = child
+                header[item].append(child)
+            child.count += weight
+            node = child
+    return root, header, counts
+
+
+def _single_path(root):
+    path = []
+    node = root
+    while node.children:
+        if len(node.children) > 1:
+            return None
+        node = next(iter(node.children.values()))
+        path.append(node)
+    return path
+
+
+def mine_fp_tree(root, header, counts, min_count, suffix, results):
+    """Append every frequent itemset of the tree, extended by suffix, to results as (set, count)"""
+    path = _single_path(root)
+    if path is not None:
+        # Every combination of a single path is frequent with the count of its deepest node
+        for size in range(1, len(path) + 1):
+            for nodes in combinations(path, size):
+                itemset = suffix | {node.item for node in nodes}
+                results.append((itemset, min(node.count for node in nodes)))
+        return
+
+    # Least frequent items first, so each conditional tree stays small
+    for item in sorted(header, key=lambda item: counts[item]):
+        itemset = suffix | {item}
+        results.append((itemset, counts[item]))
+
+        # Conditional pattern base: the prefix path of every node of the item
+        pattern_base = []
+        for node in header[item]:
+            prefix = []
+            parent = node.parent
+            while parent.item is not None:
+                prefix.append(parent.item)
+                parent = parent.parent
+            if prefix:
+                pattern_base.append((prefix, node.count))
+
+        tree, tree_header, tree_counts = build_fp_tree(pattern_base, min_count)
+        if tree_header:
+            mine_fp_tree(tree, tree_header, tree_counts, min_count, itemset, results)
+
+
+def fp_growth(transactions, min_support, return_support=False):
+    """Frequent itemsets by FP-Growth; same inputs and output as apriori().
+
+    A TransactionStore is read into one Python set per basket before the
+    tree is built, so it takes as much memory as a list of transactions.
+    """
+    transactions = [set(transaction) for transaction in transactions]
+    if not transactions:
+        return ([], {}) if return_support else []
+    min_count = min_support_count(len(transactions), min_support)
+
+    root, header, counts = build_fp_tree([(t, 1) for t in transactions], min_count)
+    results = []
+    mine_fp_tree(root, header, counts, min_count, frozenset(), results)
+
+    # Same order as apriori: all 1-itemsets, then 2-itemsets, ...
+    results.sort(key=lambda result: len(result[0]))
+    itemsets = [set(itemset) for itemset, count in results]
+    if return_support:
+        return itemsets, {itemset: count / len(transactions) for itemset, count in results}
+    return itemsets
+
+
+if __name__ == "__main__":
+    transactions = [
+        ['milk', 'bread', 'butter'],
+        ['beer', 'bread'],
+        ['milk', 'bread', 'butter', 'beer'],
+        ['bread', 'butter'],
+        ['milk', 'bread', 'beer']
+    ]
+
+    print("Frequent Itemsets (FP-Growth):")
+    for itemset in fp_growth(transactions, 0.4):
+        print(itemset)
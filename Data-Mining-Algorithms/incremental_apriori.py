@@ -0,0 +1,182 @@
+
+import argparse
+import csv
+import json
+import os
+import time
+
+from apriori_algorithm import count_support, create_candidates
+from son_apriori import parse_line
+
+
+class IncrementalMiner:
+    """Frequent itemsets of a growing transaction log, kept up to date with FUP.
+
+    The state file (JSON) holds min_support, the number of transactions
+    mined so far, every frequent itemset with its count and the size of
+    the data file; the data file holds the transactions themselves, one
+    CSV row each, so items are stored as strings. update() mines only the
+    new transactions and re-reads the old ones just for candidates that
+    became promising, then appends the increment and saves the state.
+
+    The state is the record of what was mined: rows past its data size
+    (left by a run that stopped between writing the data and saving the
+    state) are cut off before the next update reads the file.
+    """
+
+    def __init__(self, state_path, data_path, min_support=None):
+        self.state_path = state_path
+        self.data_path = data_path
+        if os.path.exists(state_path):
+            with open(state_path) as f:
+                state = json.load(f)
+            if min_support is not None and min_support != state['min_support']:
+                raise ValueError("min_support differs from the saved state")
+            self.min_support = state['min_support']
+            self.n_transactions = state['n_transactions']
+            self.counts = {frozenset(items): count for items, count in state['itemsets']}
+            # States saved before the size was recorded trust the whole file
+            self.data_bytes = state.get('data_bytes', os.path.getsize(data_path) if os.path.exists(data_path) else 0)
+        else:
+            if min_support is None:
+                raise ValueError("min_support is needed to start a new state")
+            self.min_support = min_support
+            self.n_transactions = 0
+            self.counts = {}
+            self.data_bytes = 0
+
+    def save(self):
+        state = {
+            'min_support': self.min_support,
+            'n_transactions': self.n_transactions,
+            'itemsets': [[sorted(itemset, key=str), count] for itemset, count in self.counts.items()],
+            'data_bytes': self.data_bytes,
+        }
+        # Write then rename, so a crash never leaves a half-written state
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _truncate_data(self):
+        # Drop rows the saved state doesn't count
+        if os.path.exists(self.data_path) and os.path.getsize(self.data_path) > self.data_bytes:
+            with open(self.data_path, 'r+b') as f:
+                f.truncate(self.data_bytes)
+
+    def _old_transactions(self):
+        if not os.path.exists(self.data_path):
+            return
+        with open(self.data_path, newline='') as f:
+            for row in csv.reader(f):
+                yield set(row)
+
+    def _frequent(self, count, total):
+        return count / total >= self.min_support
+
+    def update(self, new_transactions):
+        """Add new transactions and update the frequent itemsets (FUP).
+
+        Level by level, itemsets that were frequent before only need their
+        count in the increment. Any other candidate can only be frequent
+        now if it is frequent within the increment, so the rest are dropped
+        before the old transactions are read to count the survivors.
+        Returns per-run statistics.
+        """
+        start = time.perf_counter()
+        increment = [set(map(str, transaction)) for transaction in new_transactions]
+        old_total = self.n_transactions
+        total = old_total + len(increment)
+        stats = {'increment': len(increment), 'old_scans': 0, 'rescanned_candidates': 0}
+        self._truncate_data()
+        if not increment:
+            self.save()
+            stats['seconds'] = time.perf_counter() - start
+            return stats
+
+        counts = {}
+        # Items of the increment, plus old frequent items it doesn't contain
+        items = set().union(*increment)
+        items.update(item for itemset in self.counts if len(itemset) == 1 for item in itemset)
+        candidates = [{item} for item in items]
+        k = 1
+        while candidates:
+            increment_counts = count_support(increment, candidates)
+            frequent_before = {}
+            rescan = []
+            for itemset, count in increment_counts.items():
+                if itemset in self.counts:
+                    frequent_before[itemset] = self.counts[itemset] + count
+                elif self._frequent(count, len(increment)):
+                    rescan.append(itemset)
+
+            level = {itemset: count for itemset, count in frequent_before.items()
+                     if self._frequent(count, total)}
+            if rescan and old_total:
+                stats['old_scans'] += 1
+                stats['rescanned_candidates'] += len(rescan)
+                old_counts = count_support(self._old_transactions(), rescan)
+            else:
+                old_counts = {}
+            for itemset in rescan:
+                count = old_counts.get(itemset, 0) + increment_counts[itemset]
+                if self._frequent(count, total):
+                    level[itemset] = count
+
+            counts.update(level)
+            k += 1
+            candidates = create_candidates(list(map(set, level)), k)
+
+        # csv quotes items holding the delimiter, so they read back whole
+        with open(self.data_path, 'a', newline='') as f:
+            csv.writer(f).writerows(increment)
+        self.data_bytes = os.path.getsize(self.data_path)
+        self.counts = counts
+        self.n_transactions = total
+        self.save()
+
+        stats['frequent'] = len(counts)
+        stats['seconds'] = time.perf_counter() - start
+        return stats
+
+    def itemsets(self, return_support=False):
+        """Current frequent itemsets, in the same form apriori() returns"""
+        itemsets = sorted(map(set, self.counts), key=len)
+        if return_support:
+            support = {itemset: count / self.n_transactions for itemset, count in self.counts.items()}
+            return itemsets, support
+        return itemsets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add transactions to an incrementally mined log (FUP)")
+    parser.add_argument("increment", nargs="?", help="file with the new transactions, one per line")
+    parser.add_argument("--state", default="itemsets_state.json")
+    parser.add_argument("--data", default="transactions.csv")
+    parser.add_argument("--min-support", type=float)
+    args = parser.parse_args()
+
+    if args.increment:
+        with open(args.increment) as f:
+            new_transactions = [parse_line(line) for line in f]
+        miner = IncrementalMiner(args.state, args.data, args.min_support)
+        print(miner.update(new_transactions))
+        for itemset in miner.itemsets():
+            print(itemset)
+    else:
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            state = os.path.join(tmp, "state.json")
+            data = os.path.join(tmp, "transactions.csv")
+            miner = IncrementalMiner(state, data, min_support=0.6)
+            print("Day 1:", miner.update([
+                ['milk', 'bread', 'butter'],
+                ['beer', 'bread'],
+                ['milk', 'bread', 'butter', 'beer'],
+            ]))
+            # A new run picks the state up from disk
+            miner = IncrementalMiner(state, data)
+            print("Day 2:", miner.update([['bread', 'butter'], ['milk', 'bread', 'beer']]))
+            for itemset in miner.itemsets():
+                print(itemset)
@@ -1,34 +1,276 @@
+import copy
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
 import numpy as np
-from collections import Counter
 from sklearn.datasets import load_iris
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score
 
+from rp_forest import RandomProjectionForest
+from spatial_index import INDEXES
+
+# 'auto' switches from KD-tree to ball tree above this many features
+KD_TREE_MAX_DIMENSIONS = 15
+
+# Default cap, in bytes, on the distance block brute-force search holds at once
+MEMORY_BUDGET = 256 * 2 ** 20
+
+# Shards per worker in a parallel query, so uneven shards even out
+SHARDS_PER_JOB = 4
+
+# Model of a worker process, set once by _init_worker over the shared arrays
+_worker_model = None
+_worker_memory = []
+
+
+def _share(array):
+    """Copy array into a new shared memory block; returns the block and what workers need to attach"""
+    memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=memory.buf)[...] = array
+    return memory, (memory.name, array.shape, array.dtype.str)
+
+
+def _attach(model, name, array):
+    """Set the attribute or item at a dotted path such as 'index_.trees.0.order'"""
+    *path, last = name.split('.')
+    target = model
+    for key in path:
+        target = target[int(key)] if isinstance(target, list) else getattr(target, key)
+    if isinstance(target, dict):
+        target[last] = array
+    else:
+        setattr(target, last, array)
+
+
+def _init_worker(model, specs):
+    global _worker_model
+    arrays = {}
+    for name, (block, shape, dtype) in specs.items():
+        if block not in arrays:
+            memory = shared_memory.SharedMemory(name=block)
+            # The mapping must stay open for as long as the array is used
+            _worker_memory.append(memory)
+            arrays[block] = np.ndarray(shape, dtype, buffer=memory.buf)
+        _attach(model, name, arrays[block])
+    _worker_model = model
+
+
+def _ready():
+    return os.getpid()
+
+
+def _kneighbors_shard(X, k):
+    return _worker_model.kneighbors(X, k)
+
+
+def distance_weights(distances):
+    """Vote weights 1/d for neighbour distances; rows with exact matches count only those"""
+    with np.errstate(divide='ignore'):
+        weights = 1 / distances
+    exact = distances == 0
+    has_exact = exact.any(axis=1)
+    weights[has_exact] = exact[has_exact]
+    return weights
+
+
+def _release(pool, blocks):
+    pool.shutdown(wait=True, cancel_futures=True)
+    for memory in blocks:
+        memory.close()
+        memory.unlink()
+
 
 class KNN:
-    def __init__(self, k=5):
+    def __init__(self, k=5, algorithm='brute', leaf_size=40, memory_budget=MEMORY_BUDGET,
+                 n_trees=10, n_probes=2, random_state=0, n_jobs=None, weights='uniform'):
+        """algorithm: 'brute', 'kd_tree', 'ball_tree', 'auto' (a tree picked by dimension)
+        or 'rp_forest' (approximate; recall grows with n_trees and n_probes)
+
+        n_jobs > 1 (or -1 for every core) answers queries in a pool of
+        worker processes that read the training data from shared memory;
+        memory_budget is then split between the workers.
+        weights='distance' weighs every neighbour's vote by 1/distance.
+        """
+        if algorithm not in ('brute', 'auto', 'rp_forest', *INDEXES):
+            raise ValueError(f"unknown algorithm: {algorithm}")
+        if weights not in ('uniform', 'distance'):
+            raise ValueError(f"unknown weights: {weights}")
         self.k = k
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.memory_budget = memory_budget
+        self.n_trees = n_trees
+        self.n_probes = n_probes
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.weights = weights
+        self._pool = None
 
     def fit(self, X, y):
-        """Store training data"""
-        self.X_train = X
-        self.y_train = y
+        """Store training data and build the spatial index, if any"""
+        self.close()
+        self.X_train = np.asarray(X, dtype=float)
+        self.y_train = np.asarray(y)
+        # Votes are counted on integer label codes
+        self.classes_, self.y_codes_ = np.unique(self.y_train, return_inverse=True)
+        self.index_ = None
+        algorithm = self.algorithm
+        if algorithm == 'auto':
+            algorithm = 'kd_tree' if self.X_train.shape[1] <= KD_TREE_MAX_DIMENSIONS else 'ball_tree'
+        if algorithm == 'rp_forest':
+            self.index_ = RandomProjectionForest(self.X_train, self.n_trees, self.n_probes,
+                                                 self.leaf_size, seed=self.random_state)
+        elif algorithm != 'brute':
+            self.index_ = INDEXES[algorithm](self.X_train, self.leaf_size)
+        else:
+            self.sq_norms_ = np.einsum('ij,ij->i', self.X_train, self.X_train)
+
+        n_jobs = os.cpu_count() if self.n_jobs == -1 else self.n_jobs
+        if n_jobs and n_jobs > 1:
+            self._start_pool(n_jobs)
+        return self
+
+    def _shared_arrays(self):
+        """The large arrays workers need, by their dotted path in the model"""
+        arrays = {'X_train': self.X_train, 'y_codes_': self.y_codes_}
+        if self.index_ is None:
+            arrays['sq_norms_'] = self.sq_norms_
+            return arrays
+        # The index's points are X_train itself for the forest, reordered for the trees
+        arrays['index_.points'] = self.index_.points
+        if isinstance(self.index_, RandomProjectionForest):
+            for i, tree in enumerate(self.index_.trees):
+                arrays[f'index_.trees.{i}.order'] = tree['order']
+        else:
+            arrays['index_.index'] = self.index_.index
+        return arrays
+
+    def _worker_template(self, arrays, n_jobs):
+        """Copy of this model for the workers, without the shared arrays"""
+        # Workers only search, so they need neither the raw labels nor the finalizer
+        template = object.__new__(KNN)
+        template.__dict__.update({key: value for key, value in self.__dict__.items()
+                                  if key not in arrays and key not in ('y_train', '_finalizer')})
+        # The budget bounds the distance blocks of all workers together
+        template.memory_budget = self.memory_budget // n_jobs
+        if self.index_ is not None:
+            template.index_ = copy.copy(self.index_)
+            if isinstance(self.index_, RandomProjectionForest):
+                template.index_.trees = [dict(tree) for tree in self.index_.trees]
+            for name in arrays:
+                if name.startswith('index_.'):
+                    _attach(template, name, None)
+        return template
+
+    def _start_pool(self, n_jobs):
+        """Copy the training arrays into shared memory and start the workers.
+
+        Workers get a copy of this model without the shared arrays, once
+        at start-up, then map the arrays by name; afterwards only query
+        shards and their results cross processes. The index's per-point
+        arrays (points, and the trees' orderings) are shared the same way.
+        fit() waits for every worker to start, so the first query doesn't.
+        """
+        arrays = self._shared_arrays()
+        blocks, specs, blocks_by_array = [], {}, {}
+        for name, array in arrays.items():
+            if id(array) not in blocks_by_array:
+                memory, blocks_by_array[id(array)] = _share(array)
+                blocks.append(memory)
+            specs[name] = blocks_by_array[id(array)]
+
+        self._pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                         initargs=(self._worker_template(arrays, n_jobs), specs))
+        self._n_workers = n_jobs
+        self._finalizer = weakref.finalize(self, _release, self._pool, blocks)
+        # Processes are started on demand, so one task per worker starts them all now
+        wait([self._pool.submit(_ready) for _ in range(n_jobs)])
+
+    def close(self):
+        """Stop the worker pool and free the shared memory, if parallel"""
+        if self._pool is not None:
+            self._finalizer()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def predict(self, X):
         """Predict labels for given data"""
-        predictions = [self._predict(x) for x in X]
-        return np.array(predictions)
+        distances, indices = self.kneighbors(X)
+        weights = distance_weights(distances) if self.weights == 'distance' else None
+        return self.classes_[self._vote(self.y_codes_[indices], weights)]
+
+    def kneighbors(self, X, k=None):
+        """Return (distances, indices) of the k nearest training points of every row of X, nearest first"""
+        k = min(self.k if k is None else k, len(self.X_train))
+        X = np.asarray(X, dtype=float).reshape(-1, self.X_train.shape[1])
+        if self._pool is not None and len(X) > 1:
+            # map() yields the shards' results in submission order
+            shards = np.array_split(X, min(len(X), self._n_workers * SHARDS_PER_JOB))
+            results = list(self._pool.map(_kneighbors_shard, shards, [k] * len(shards)))
+            return (np.concatenate([d for d, _ in results]).reshape(len(X), k),
+                    np.concatenate([i for _, i in results]).reshape(len(X), k))
+        if self.index_ is not None:
+            # Trees skip nodes too far away to matter; the forest only ranks its candidates
+            results = [self.index_.query(x, k) for x in X]
+            distances = np.array([d for d, _ in results]).reshape(len(X), k)
+            indices = np.array([i for _, i in results], dtype=np.intp).reshape(len(X), k)
+            return distances, indices
+
+        distances = np.empty((len(X), k))
+        indices = np.empty((len(X), k), dtype=np.intp)
+        for start in range(0, len(X), self._chunk_size()):
+            stop = start + self._chunk_size()
+            distances[start:stop], indices[start:stop] = self._brute_chunk(X[start:stop], k)
+        return distances, indices
+
+    def _chunk_size(self):
+        # A query row costs one float64 distance and one argpartition index per training point
+        return max(1, int(self.memory_budget // (16 * max(len(self.X_train), 1))))
 
-    def _predict(self, x):
-        """Predict label for one sample"""
-        distances = np.linalg.norm(self.X_train - x, axis=1)
+    def _brute_chunk(self, queries, k):
+        # ||a - b||^2 = ||a||^2 + ||b||^2 - 2ab, with every ab of the chunk from one matrix product
+        block = queries @ self.X_train.T
+        block *= -2
+        block += self.sq_norms_
+        block += np.einsum('ij,ij->i', queries, queries)[:, None]
 
-        k_indices = np.argsort(distances)[:self.k]
+        if k < block.shape[1]:
+            nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+        else:
+            nearest = np.broadcast_to(np.arange(block.shape[1]), block.shape)
+        # The expansion loses precision (an exact match can come out a little
+        # off zero), so the k picked are measured again directly
+        diff = queries[:, None, :] - self.X_train[nearest]
+        squared = np.einsum('ijk,ijk->ij', diff, diff)
+        order = np.argsort(squared, axis=1, kind='stable')
+        nearest = np.take_along_axis(nearest, order, axis=1)
+        squared = np.take_along_axis(squared, order, axis=1)
+        return np.sqrt(squared), nearest
 
-        k_nearest_labels = self.y_train[k_indices]
+    def _vote(self, codes, weights=None):
+        """Majority label code of every row of neighbour codes, ordered nearest first.
 
-        most_common = Counter(k_nearest_labels).most_common(1)
-        return most_common[0][0]
+        weights, shaped like codes, replaces one vote per neighbour. Ties
+        go to the tied label whose first neighbour is nearest, as
+        Counter.most_common would pick from the same list.
+        """
+        n_rows, k = codes.shape
+        n_classes = len(self.classes_)
+        offsets = np.arange(n_rows)[:, None] * n_classes
+        counts = np.bincount((codes + offsets).ravel(), None if weights is None else weights.ravel(),
+                             minlength=n_rows * n_classes)
+        counts = counts.reshape(n_rows, n_classes)
+        votes = np.take_along_axis(counts, codes, axis=1)
+        first = np.argmax(votes == votes.max(axis=1, keepdims=True), axis=1)
+        return codes[np.arange(n_rows), first]
 
 
 if __name__ == "__main__":
@@ -39,10 +281,11 @@ if __name__ == "__main__":
         X, y, test_size=0.2, random_state=42
     )
 
-    model = KNN(k=5)
-    model.fit(X_train, y_train)
+    for algorithm in ('brute', 'kd_tree', 'ball_tree', 'rp_forest'):
+        model = KNN(k=5, algorithm=algorithm)
+        model.fit(X_train, y_train)
 
-    predictions = model.predict(X_test)
+        predictions = model.predict(X_test)
 
-    acc = accuracy_score(y_test, predictions)
-    print(f"KNN Accuracy: {acc:.2f}")
+        acc = accuracy_score(y_test, predictions)
+        print(f"KNN Accuracy ({algorithm}): {acc:.2f}")
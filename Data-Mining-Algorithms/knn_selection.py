@@ -0,0 +1,126 @@
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from knn import KNN, distance_weights
+
+# Data of the fold workers, set once per worker by _init_folds
+_X = _y_codes = _knn_params = None
+
+
+def score_all_k(codes, true_codes, n_classes, weights=None):
+    """Accuracy for every k from 1 to k_max, from each row's k_max neighbour label codes (nearest first).
+
+    Votes are added one neighbour at a time, so the prediction for k
+    builds on the one for k - 1. Ties are broken as KNN.predict does: the
+    tied label whose first neighbour is nearest wins.
+    """
+    n_rows, k_max = codes.shape
+    rows = np.arange(n_rows)
+    votes = np.zeros((n_rows, n_classes))
+    first = np.full((n_rows, n_classes), k_max)
+    correct = np.empty(k_max)
+    for j in range(k_max):
+        label = codes[:, j]
+        votes[rows, label] += 1 if weights is None else weights[:, j]
+        first[rows, label] = np.minimum(first[rows, label], j)
+        tied = votes == votes.max(axis=1, keepdims=True)
+        predictions = np.argmin(np.where(tied, first, k_max), axis=1)
+        correct[j] = np.count_nonzero(predictions == true_codes)
+    return correct / max(n_rows, 1)
+
+
+def _init_folds(X, y_codes, knn_params):
+    global _X, _y_codes, _knn_params
+    _X, _y_codes, _knn_params = X, y_codes, knn_params
+
+
+def _score_fold(train, validation, k_max, weights):
+    """One neighbour search of the validation rows, up to k_max, scored for every k"""
+    model = KNN(k_max, **_knn_params).fit(_X[train], _y_codes[train])
+    distances, indices = model.kneighbors(_X[validation])
+    codes = _y_codes[train][indices]
+    weights = distance_weights(distances) if weights == 'distance' else None
+    return score_all_k(codes, _y_codes[validation], int(_y_codes.max()) + 1, weights)
+
+
+def select_k(X, y, k_max=30, n_folds=5, weights='uniform', n_jobs=None, random_state=0, **knn_params):
+    """Cross-validated accuracy of KNN for every k from 1 to k_max.
+
+    Each fold searches the k_max nearest neighbours of its validation
+    rows once and scores every k from that sorted list, instead of one fit
+    and predict per k. Folds run in a process pool when n_jobs > 1 (-1
+    for every core). knn_params go to KNN (algorithm, leaf_size, ...).
+    Returns a dict with the scores per k (mean and per fold) and best_k,
+    the smallest k with the best mean score.
+    """
+    if weights not in ('uniform', 'distance'):
+        raise ValueError(f"unknown weights: {weights}")
+    start = time.perf_counter()
+    X = np.asarray(X, dtype=float)
+    _, y_codes = np.unique(np.asarray(y), return_inverse=True)
+    if not 2 <= n_folds <= len(X):
+        raise ValueError("n_folds must be between 2 and the number of samples")
+
+    order = np.random.default_rng(random_state).permutation(len(X))
+    validations = np.array_split(order, n_folds)
+    trains = [np.setdiff1d(order, validation) for validation in validations]
+    if k_max > min(map(len, trains)):
+        raise ValueError("k_max is larger than the smallest training fold")
+
+    n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+    args = (trains, validations, [k_max] * n_folds, [weights] * n_folds)
+    if n_jobs and n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, n_folds), initializer=_init_folds,
+                                 initargs=(X, y_codes, knn_params)) as pool:
+            fold_scores = list(pool.map(_score_fold, *args))
+    else:
+        _init_folds(X, y_codes, knn_params)
+        fold_scores = list(map(_score_fold, *args))
+
+    fold_scores = np.array(fold_scores)
+    scores = fold_scores.mean(axis=0)
+    return {
+        'k': np.arange(1, k_max + 1),
+        'scores': scores,
+        'fold_scores': fold_scores,
+        'best_k': int(np.argmax(scores)) + 1,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+if __name__ == "__main__":
+    from benchmark_knn import make_clusters
+
+    parser = argparse.ArgumentParser(description="Pick k for KNN by cross-validation")
+    parser.add_argument("--samples", type=lambda text: int(float(text)), default=20000)
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--k-max", type=int, default=30)
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--weights", choices=("uniform", "distance"), default="uniform")
+    parser.add_argument("--jobs", type=int)
+    parser.add_argument("--compare", action="store_true", help="also time one fit and predict per k")
+    args = parser.parse_args()
+
+    # Wide clusters, so the classes overlap and k matters
+    X, y = make_clusters(args.samples, args.features, spread=6.0)
+    result = select_k(X, y, args.k_max, args.folds, args.weights, args.jobs)
+    for k, score in zip(result['k'], result['scores']):
+        print(f"k={k:<4} {score:.4f}")
+    print(f"best k={result['best_k']} in {result['seconds']:.2f} s")
+
+    if args.compare:
+        start = time.perf_counter()
+        order = np.random.default_rng(0).permutation(len(X))
+        naive = np.zeros(args.k_max)
+        for validation in np.array_split(order, args.folds):
+            train = np.setdiff1d(order, validation)
+            for k in range(1, args.k_max + 1):
+                model = KNN(k, weights=args.weights).fit(X[train], y[train])
+                naive[k - 1] += np.mean(model.predict(X[validation]) == y[validation]) / args.folds
+        print(f"one predict per k: {time.perf_counter() - start:.2f} s, "
+              f"same scores: {np.allclose(naive, result['scores'])}")
@@ -0,0 +1,114 @@
+import numpy as np
+
+
+class RandomProjectionForest:
+    """Approximate k-nearest queries with a forest of random projection trees.
+
+    Every tree splits its points in half, over and over, along the line
+    through two random points of the node, until leaves hold at most
+    leaf_size points. A query descends each tree to one leaf and ranks
+    only the points of the leaves it reached by exact distance. Splits
+    sit at the median, so leaves stay small even where data is dense.
+
+    Recall grows with n_trees and with n_probes: each probe also descends
+    the other side of one of the splits the query passed closest to.
+    Nodes keep just the two points and the threshold of their split, so
+    a tree costs about one int32 per training point.
+    """
+
+    def __init__(self, X, n_trees=10, n_probes=2, leaf_size=40, seed=0):
+        if n_trees < 1 or leaf_size < 1:
+            raise ValueError("n_trees and leaf_size must be positive")
+        self.points = np.asarray(X, dtype=float)
+        self.n_trees = n_trees
+        self.n_probes = n_probes
+        self.leaf_size = leaf_size
+        rng = np.random.default_rng(seed)
+        self.trees = [self._build_tree(rng) for _ in range(n_trees)]
+
+    def _build_tree(self, rng):
+        order = np.arange(len(self.points), dtype=np.int32)
+        # Per node: slice bounds, children (-1 for leaves) and split (two points, threshold)
+        tree = {'start': [], 'end': [], 'left': [], 'right': [], 'a': [], 'b': [], 'threshold': []}
+        if len(order):
+            self._split(tree, order, 0, len(order), rng)
+        tree['order'] = order
+        return tree
+
+    def _split(self, tree, order, start, end, rng):
+        node = len(tree['start'])
+        for key, value in (('start', start), ('end', end), ('left', -1), ('right', -1),
+                           ('a', -1), ('b', -1), ('threshold', 0.0)):
+            tree[key].append(value)
+        if end - start <= self.leaf_size:
+            return node
+
+        members = order[start:end]
+        a, b = rng.choice(members, size=2, replace=False)
+        projections = self.points[members] @ (self.points[a] - self.points[b])
+        middle = (end - start) // 2
+        split = np.argpartition(projections, middle)
+        order[start:end] = members[split]
+        tree['a'][node], tree['b'][node] = int(a), int(b)
+        tree['threshold'][node] = float(projections[split[middle]])
+        tree['left'][node] = self._split(tree, order, start, start + middle, rng)
+        tree['right'][node] = self._split(tree, order, start + middle, end, rng)
+        return node
+
+    def _leaves(self, tree, x):
+        """Leaves reached by x: its own, plus one per probe across the closest splits"""
+        points = self.points
+        margins = []
+        node = 0
+        while tree['left'][node] != -1:
+            a, b = tree['a'][node], tree['b'][node]
+            margin = float(x @ (points[a] - points[b])) - tree['threshold'][node]
+            near, far = ((tree['left'][node], tree['right'][node]) if margin < 0
+                         else (tree['right'][node], tree['left'][node]))
+            margins.append((abs(margin), far))
+            node = near
+        leaves = [node]
+
+        margins.sort()
+        for _, node in margins[:self.n_probes]:
+            while tree['left'][node] != -1:
+                a, b = tree['a'][node], tree['b'][node]
+                margin = float(x @ (points[a] - points[b])) - tree['threshold'][node]
+                node = tree['left'][node] if margin < 0 else tree['right'][node]
+            leaves.append(node)
+        return leaves
+
+    def candidates(self, x):
+        """Positions of the training points sharing a reached leaf with x"""
+        x = np.asarray(x, dtype=float)
+        groups = []
+        for tree in self.trees:
+            if not tree['start']:
+                continue
+            for leaf in self._leaves(tree, x):
+                groups.append(tree['order'][tree['start'][leaf]:tree['end'][leaf]])
+        if not groups:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(groups)).astype(np.intp)
+
+    def query(self, x, k=1):
+        """Return (distances, indices) of about the k nearest points to x, nearest first.
+
+        Falls back to a full scan when the reached leaves hold fewer than k
+        points, so k results always come back.
+        """
+        x = np.asarray(x, dtype=float)
+        k = min(k, len(self.points))
+        if k <= 0:
+            return np.empty(0), np.empty(0, dtype=np.intp)
+
+        candidates = self.candidates(x)
+        if len(candidates) < k:
+            candidates = np.arange(len(self.points))
+        distances = np.sqrt(((self.points[candidates] - x) ** 2).sum(axis=1))
+        if k < len(candidates):
+            nearest = np.argpartition(distances, k - 1)[:k]
+        else:
+            nearest = np.arange(len(candidates))
+        nearest = nearest[np.argsort(distances[nearest], kind='stable')]
+        return distances[nearest], candidates[nearest]
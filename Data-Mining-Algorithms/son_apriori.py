@@ -0,0 +1,152 @@
+
+import argparse
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from apriori_algorithm import ENGINES
+from support_counting import itemset_count, vertical_bitsets
+
+# Candidates of the counting pass, set once per worker by _init_counter
+_candidates = None
+
+
+def parse_line(line, delimiter=','):
+    """One transaction per line, items separated by delimiter"""
+    return [item.strip() for item in line.split(delimiter) if item.strip()]
+
+
+def write_transactions(path, transactions, delimiter=','):
+    with open(path, 'w') as f:
+        for transaction in transactions:
+            f.write(delimiter.join(transaction) + '\n')
+
+
+def read_chunks(path, chunk_size):
+    """Yield the lines of a transaction file in lists of at most chunk_size"""
+    chunk = []
+    with open(path) as f:
+        for line in f:
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _mine_chunk(lines, min_support, engine, delimiter):
+    transactions = [parse_line(line, delimiter) for line in lines]
+    itemsets = ENGINES[engine](transactions, min_support)
+    return [frozenset(itemset) for itemset in itemsets]
+
+
+def _init_counter(candidates):
+    global _candidates
+    _candidates = candidates
+
+
+def _count_chunk(lines, delimiter):
+    bitsets, n = vertical_bitsets(parse_line(line, delimiter) for line in lines)
+    return n, [itemset_count(bitsets, candidate, n) for candidate in _candidates]
+
+
+def _run_bounded(pool, chunks, submit, collect, in_flight):
+    # At most in_flight chunks are held in memory (read but not yet processed)
+    pending = set()
+    for chunk in chunks:
+        pending.add(submit(chunk))
+        if len(pending) >= in_flight:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                collect(future.result())
+    for future in pending:
+        collect(future.result())
+
+
+def son_apriori(path, min_support, chunk_size=100000, workers=None, engine='eclat', delimiter=',',
+                return_support=False):
+    """Frequent itemsets of a transaction file too large for memory (SON algorithm).
+
+    Pass 1 mines every chunk of chunk_size transactions on its own with the
+    given engine; an itemset frequent in the whole file is frequent in at
+    least one chunk, so the union of the local results holds every answer.
+    Pass 2 counts the global support of those candidates. Both passes run
+    chunks in a process pool and keep only a few chunks in memory at once.
+    Returns a list of sets like apriori(), and the support map too with
+    return_support=True.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine: {engine}")
+    workers = workers or os.cpu_count() or 1
+    in_flight = 2 * workers
+
+    # Pass 1: local frequent itemsets of every chunk
+    candidates = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        _run_bounded(
+            pool,
+            read_chunks(path, chunk_size),
+            lambda chunk: pool.submit(_mine_chunk, chunk, min_support, engine, delimiter),
+            candidates.update,
+            in_flight,
+        )
+    candidates = list(candidates)
+
+    # Pass 2: global support count of every candidate
+    totals = [0] * len(candidates)
+    n_transactions = 0
+
+    def add_counts(result):
+        nonlocal n_transactions
+        n, counts = result
+        n_transactions += n
+        for i, count in enumerate(counts):
+            totals[i] += count
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_counter, initargs=(candidates,)) as pool:
+        _run_bounded(
+            pool,
+            read_chunks(path, chunk_size),
+            lambda chunk: pool.submit(_count_chunk, chunk, delimiter),
+            add_counts,
+            in_flight,
+        )
+
+    support = {
+        candidate: count / n_transactions for candidate, count in zip(candidates, totals)
+        if count / n_transactions >= min_support
+    }
+    frequent = sorted(map(set, support), key=len)
+    if return_support:
+        return frequent, support
+    return frequent
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mine frequent itemsets from a transaction file with SON")
+    parser.add_argument("path", nargs="?", help="one transaction per line (default: a small example)")
+    parser.add_argument("--min-support", type=float, default=0.6)
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="eclat")
+    parser.add_argument("--delimiter", default=",")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.path
+        if path is None:
+            path = os.path.join(tmp, "transactions.csv")
+            write_transactions(path, [
+                ['milk', 'bread', 'butter'],
+                ['beer', 'bread'],
+                ['milk', 'bread', 'butter', 'beer'],
+                ['bread', 'butter'],
+                ['milk', 'bread', 'beer']
+            ])
+            args.chunk_size = 2
+
+        itemsets = son_apriori(path, args.min_support, args.chunk_size, args.workers, args.engine, args.delimiter)
+        print("Frequent Itemsets (SON):")
+        for itemset in itemsets:
+            print(itemset)
@@ -0,0 +1,123 @@
+import heapq
+
+import numpy as np
+
+
+class _SpatialTree:
+    """Binary space-partitioning tree for exact Euclidean k-nearest queries.
+
+    Points are reordered so that every node covers a contiguous slice
+    [start, end) of `self.points`; leaves hold at most leaf_size points.
+    Subclasses decide how a node is summarised for pruning.
+    """
+
+    def __init__(self, X, leaf_size=40):
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be positive")
+        X = np.asarray(X, dtype=float)
+        self.leaf_size = leaf_size
+        self.index = np.arange(len(X))
+        self.points = X
+        # Per node: slice bounds and children (-1 for leaves)
+        self.start, self.end, self.left, self.right = [], [], [], []
+        self._bounds = []
+        if len(X):
+            self._build(0, len(X))
+        self.points = X[self.index]
+
+    def _build(self, start, end):
+        node = len(self.start)
+        self.start.append(start)
+        self.end.append(end)
+        self.left.append(-1)
+        self.right.append(-1)
+        points = self.points[self.index[start:end]]
+        self._bounds.append(self._summary(points))
+
+        if end - start > self.leaf_size:
+            # Split at the median of the dimension with the largest spread
+            dim = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+            middle = (end - start) // 2
+            order = np.argpartition(points[:, dim], middle)
+            self.index[start:end] = self.index[start:end][order]
+            self.left[node] = self._build(start, start + middle)
+            self.right[node] = self._build(start + middle, end)
+        return node
+
+    def _summary(self, points):
+        raise NotImplementedError
+
+    def _min_distance(self, node, x):
+        raise NotImplementedError
+
+    def query(self, x, k=1):
+        """Return (distances, indices) of the k points nearest to x, nearest first"""
+        x = np.asarray(x, dtype=float)
+        k = min(k, len(self.points))
+        if k <= 0:
+            return np.empty(0), np.empty(0, dtype=int)
+
+        # Max-heap of the best k so far, as (-distance, position)
+        best = []
+        stack = [(0.0, 0)]
+        while stack:
+            bound, node = stack.pop()
+            if len(best) == k and bound >= -best[0][0]:
+                continue
+            if self.left[node] == -1:
+                start, end = self.start[node], self.end[node]
+                distances = np.sqrt(((self.points[start:end] - x) ** 2).sum(axis=1))
+                if len(best) == k:
+                    # Only points closer than the current k-th can enter
+                    closer = np.flatnonzero(distances < -best[0][0])
+                else:
+                    closer = range(end - start)
+                for offset in closer:
+                    distance = float(distances[offset])
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, start + int(offset)))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, start + int(offset)))
+                continue
+            children = [(self._min_distance(child, x), child) for child in (self.left[node], self.right[node])]
+            # Push the farther child first so the nearer one is searched first
+            children.sort(reverse=True)
+            for child_bound, child in children:
+                if len(best) < k or child_bound < -best[0][0]:
+                    stack.append((child_bound, child))
+
+        best.sort(reverse=True)
+        distances = np.array([-distance for distance, _ in best])
+        indices = self.index[[position for _, position in best]]
+        return distances, indices
+
+
+class KDTree(_SpatialTree):
+    """KD-tree: nodes are axis-aligned boxes. Prunes well in low dimensions."""
+
+    def _summary(self, points):
+        return points.min(axis=0), points.max(axis=0)
+
+    def _min_distance(self, node, x):
+        low, high = self._bounds[node]
+        gap = np.maximum(low - x, 0) + np.maximum(x - high, 0)
+        return float(np.sqrt(gap @ gap))
+
+
+class BallTree(_SpatialTree):
+    """Ball tree: nodes are spheres around their centroid. Holds up better than boxes in higher dimensions."""
+
+    def _summary(self, points):
+        center = points.mean(axis=0)
+        return center, float(np.sqrt(((points - center) ** 2).sum(axis=1).max()))
+
+    def _min_distance(self, node, x):
+        center, radius = self._bounds[node]
+        diff = x - center
+        return max(float(np.sqrt(diff @ diff)) - radius, 0.0)
+
+
+INDEXES = {
+    'kd_tree': KDTree,
+    'ball_tree': BallTree,
+}
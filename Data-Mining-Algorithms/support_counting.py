@@ -0,0 +1,63 @@
+"""Support counting shared by the frequent itemset engines"""
+
+if hasattr(int, "bit_count"):
+    def popcount(bits):
+        return bits.bit_count()
+else:  # Python < 3.10
+    def popcount(bits):
+        return bin(bits).count("1")
+
+
+def min_support_count(n_transactions, min_support):
+    """Smallest transaction count whose support count / n reaches min_support"""
+    count = max(int(min_support * n_transactions) - 1, 0)
+    while count <= n_transactions and count / n_transactions < min_support:
+        count += 1
+    return count
+
+
+def vertical_bitsets(transactions):
+    """Map every item to a bitset (a Python int) of the transactions containing it.
+
+    Bit i of an item's bitset is set when transaction i contains the item,
+    so the support count of an itemset is the popcount of the AND of its
+    items' bitsets. A TransactionStore builds its bitsets itself.
+    """
+    if hasattr(transactions, 'vertical_bitsets'):
+        return transactions.vertical_bitsets()
+    rows = {}
+    size = 0
+    for tid, transaction in enumerate(transactions):
+        byte, bit = tid >> 3, 1 << (tid & 7)
+        for item in set(transaction):
+            row = rows.get(item)
+            if row is None:
+                row = rows[item] = bytearray()
+            if len(row) <= byte:
+                row.extend(bytes(byte + 1 - len(row)))
+            row[byte] |= bit
+        size = tid + 1
+    bitsets = {item: int.from_bytes(row, "little") for item, row in rows.items()}
+    return bitsets, size
+
+
+def itemset_count(bitsets, itemset, n_transactions):
+    """Number of transactions containing every item of itemset"""
+    items = iter(itemset)
+    first = next(items, None)
+    if first is None:
+        return n_transactions
+    bits = bitsets.get(first, 0)
+    for item in items:
+        bits &= bitsets.get(item, 0)
+        if not bits:
+            return 0
+    return popcount(bits)
+
+
+def calculate_support_bitset(bitsets, n_transactions, candidates):
+    """Same result as calculate_support, counted on vertical bitsets"""
+    return {
+        frozenset(candidate): itemset_count(bitsets, candidate, n_transactions) / n_transactions
+        for candidate in candidates
+    }
@@ -0,0 +1,47 @@
+import random
+from itertools import combinations
+
+import pytest
+
+TRANSACTIONS = [
+    ['milk', 'bread', 'butter'],
+    ['beer', 'bread'],
+    ['milk', 'bread', 'butter', 'beer'],
+    ['bread', 'butter'],
+    ['milk', 'bread', 'beer'],
+]
+
+
+def random_baskets(seed, n_transactions=40, n_items=8, max_size=5):
+    rng = random.Random(seed)
+    items = [f"i{j}" for j in range(n_items)]
+    # Repeated items in a basket must count once
+    return [rng.choices(items, k=rng.randint(1, max_size)) for _ in range(n_transactions)]
+
+
+def brute_force_support(transactions, min_support):
+    """Support of every frequent itemset, found by checking every subset of the items"""
+    transactions = [set(transaction) for transaction in transactions]
+    items = sorted(set().union(*transactions), key=str)
+    support = {}
+    for size in range(1, len(items) + 1):
+        for itemset in combinations(items, size):
+            count = sum(transaction.issuperset(itemset) for transaction in transactions)
+            if count and count / len(transactions) >= min_support:
+                support[frozenset(itemset)] = count / len(transactions)
+    return support
+
+
+@pytest.fixture(params=[0, 1, 2])
+def baskets(request):
+    return random_baskets(request.param)
+
+
+@pytest.fixture
+def transactions():
+    return [list(transaction) for transaction in TRANSACTIONS]
+
+
+@pytest.fixture
+def oracle():
+    return brute_force_support
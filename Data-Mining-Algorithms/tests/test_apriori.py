@@ -0,0 +1,90 @@
+from itertools import combinations
+
+import pytest
+
+from apriori_algorithm import (ENGINES, HashTree, apriori, count_support, create_candidates,
+                               find_frequent_itemsets, item_order)
+
+
+@pytest.mark.parametrize("counting", ["scan", "bitset"])
+@pytest.mark.parametrize("min_support", [0.05, 0.1, 0.25, 0.5])
+def test_matches_brute_force(baskets, oracle, counting, min_support):
+    expected = oracle(baskets, min_support)
+    itemsets, support = apriori(baskets, min_support, counting=counting, return_support=True)
+    assert len(itemsets) == len(expected)
+    assert {frozenset(itemset) for itemset in itemsets} == set(expected)
+    assert support == pytest.approx(expected)
+    sizes = [len(itemset) for itemset in itemsets]
+    assert sizes == sorted(sizes)
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_engines_agree(baskets, engine):
+    expected = apriori(baskets, 0.1, return_support=True)[1]
+    assert find_frequent_itemsets(baskets, 0.1, engine, return_support=True)[1] == pytest.approx(expected)
+
+
+def test_stats(baskets, oracle):
+    stats = []
+    apriori(baskets, 0.1, stats=stats)
+    expected = oracle(baskets, 0.1)
+    assert [level['level'] for level in stats] == list(range(1, len(stats) + 1))
+    assert stats[0]['candidates'] == len(set().union(*map(set, baskets)))
+    for level in stats:
+        assert set(level) == {'level', 'candidates', 'frequent', 'seconds'}
+        assert level['frequent'] == sum(len(itemset) == level['level'] for itemset in expected)
+        assert level['frequent'] <= level['candidates']
+        assert level['seconds'] >= 0
+    # Mining stops at the largest frequent size, or one level later if that had candidates
+    assert len(stats) - max(map(len, expected)) in (0, 1)
+
+
+def test_create_candidates_joins_and_prunes():
+    frequent = [{'a', 'b'}, {'a', 'c'}, {'b', 'c'}, {'a', 'd'}, {'c', 'd'}, {'c', 'e'}]
+    candidates = {frozenset(candidate) for candidate in create_candidates(frequent, 3)}
+    # abd and bcd have the infrequent subset bd, ace has ae, cde has de
+    assert candidates == {frozenset('abc'), frozenset('acd')}
+    assert create_candidates([{'a'}, {'b'}, {'c'}], 2) == [{'a', 'b'}, {'a', 'c'}, {'b', 'c'}]
+    assert create_candidates([], 2) == []
+
+
+@pytest.mark.parametrize("k", [2, 3, 4])
+def test_create_candidates_matches_brute_force(baskets, oracle, k):
+    frequent = [set(itemset) for itemset, _ in oracle(baskets, 0.05).items() if len(itemset) == k - 1]
+    items = sorted(set().union(*frequent), key=str) if frequent else []
+    previous = set(map(frozenset, frequent))
+    expected = {frozenset(candidate) for candidate in combinations(items, k)
+                if all(frozenset(subset) in previous for subset in combinations(candidate, k - 1))}
+    candidates = create_candidates(frequent, k)
+    assert len(candidates) == len(expected)
+    assert set(map(frozenset, candidates)) == expected
+
+
+@pytest.mark.parametrize("max_leaf_size, branches", [(1, 2), (2, 3), (8, 16), (100, 16)])
+def test_hash_tree_counts_every_candidate_once(baskets, max_leaf_size, branches):
+    transactions = list(map(set, baskets))
+    order = item_order(transactions)
+    candidates = [tuple(sorted(candidate, key=order.__getitem__))
+                  for candidate in combinations(sorted(order, key=str), 3)]
+    tree = HashTree(candidates, order, max_leaf_size, branches)
+    for transaction in transactions:
+        tree.add_transaction(transaction)
+    # Hash collisions put several paths to the same leaf, which must still count once
+    assert tree.counts == {candidate: sum(transaction.issuperset(candidate) for transaction in transactions)
+                           for candidate in candidates}
+
+
+def test_count_support_mixes_candidate_sizes_and_item_types():
+    transactions = [{1, 'a', (2, 3)}, {1, 'a'}, {1, (2, 3)}, {'a'}]
+    candidates = [{1}, {'a'}, {(2, 3)}, {1, 'a'}, {1, (2, 3)}, {1, 'a', (2, 3)}, {'missing'}]
+    assert count_support(transactions, candidates) == {
+        frozenset({1}): 3, frozenset({'a'}): 3, frozenset({(2, 3)}): 2, frozenset({1, 'a'}): 2,
+        frozenset({1, (2, 3)}): 2, frozenset({1, 'a', (2, 3)}): 1, frozenset({'missing'}): 0,
+    }
+
+
+def test_rejects_unknown_counting_and_engine(transactions):
+    with pytest.raises(ValueError):
+        apriori(transactions, 0.5, counting='nope')
+    with pytest.raises(ValueError):
+        find_frequent_itemsets(transactions, 0.5, engine='nope')
@@ -0,0 +1,32 @@
+import random
+import statistics
+
+import pytest
+
+from basket_generator import generate_baskets, generate_patterns
+
+
+def test_same_seed_same_baskets():
+    assert generate_baskets(500, seed=3) == generate_baskets(500, seed=3)
+    assert generate_baskets(500, seed=3) != generate_baskets(500, seed=4)
+
+
+@pytest.mark.parametrize("avg_size, n_items", [(5, 200), (10, 1000), (20, 2000)])
+def test_sizes_and_items(avg_size, n_items):
+    baskets = generate_baskets(3000, avg_size, n_items, seed=1)
+    assert len(baskets) == 3000
+    assert statistics.mean(map(len, baskets)) == pytest.approx(avg_size, rel=0.1)
+    for basket in baskets:
+        assert basket and len(set(basket)) == len(basket)
+        ids = [int(item[len("item"):]) for item in basket]
+        assert ids == sorted(ids) and 0 <= ids[0] and ids[-1] < n_items
+
+
+def test_patterns():
+    patterns = generate_patterns(random.Random(0), 100, 4, 30, 0.5)
+    assert len(patterns) == 100
+    for items, weight, corruption in patterns:
+        assert items == sorted(set(items)) and 1 <= len(items) <= 30
+        assert all(0 <= item < 30 for item in items)
+        assert weight > 0 and 0 <= corruption <= 1
+    assert statistics.mean(len(items) for items, _, _ in patterns) == pytest.approx(4, rel=0.25)
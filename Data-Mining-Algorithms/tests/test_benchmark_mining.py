@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+import benchmark_mining
+from benchmark_mining import ENGINES, compare_to_baseline, run_benchmark
+
+ARGS = ['--sizes', '300', '--min-supports', '0.05', '--engines', 'eclat,fp-growth', '--avg-size', '5',
+        '--items', '50', '--patterns', '20']
+
+
+@pytest.fixture(scope="module")
+def results():
+    return run_benchmark([300], [0.05, 0.1], sorted(ENGINES), avg_size=5, n_items=50, n_patterns=20)
+
+
+def test_every_engine_finds_the_same_counts(results):
+    assert len(results) == 2 * len(ENGINES)
+    for min_support in (0.05, 0.1):
+        rows = [row for row in results if row['min_support'] == min_support]
+        assert len({(row['itemsets'], row['rules'], row['largest_itemset']) for row in rows}) == 1
+        assert rows[0]['itemsets'] > 0
+        assert all(row['peak_bytes'] > 0 and row['mining_seconds'] >= 0 for row in rows)
+
+
+def test_compare_to_baseline(results):
+    assert compare_to_baseline(results, results) == []
+    baseline = [dict(row) for row in results]
+    baseline[0]['mining_seconds'] = results[0]['mining_seconds'] / 2 - 1e-9
+    baseline[1]['rules'] += 1
+    problems = compare_to_baseline(results, baseline, tolerance=0.25)
+    assert len(problems) == 2
+    assert "vs baseline" in problems[0] and results[0]['engine'] in problems[0]
+    assert f"{results[1]['rules']} rules vs baseline" in problems[1]
+    # Within tolerance, or not in the baseline at all, is no problem
+    assert compare_to_baseline(results, baseline[:1], tolerance=10) == []
+
+
+def test_main_writes_a_report_and_flags_regressions(tmp_path, capsys):
+    report_path = tmp_path / "mining.json"
+    assert benchmark_mining.main(ARGS + ['--no-memory', '--output', str(report_path)]) == 0
+    with open(report_path) as f:
+        report = json.load(f)
+    assert [row['engine'] for row in report['results']] == ['eclat', 'fp-growth']
+    assert all('peak_bytes' not in row for row in report['results'])
+
+    assert benchmark_mining.main(ARGS + ['--no-memory', '--baseline', str(report_path), '--tolerance', '1e9']) == 0
+    for row in report['results']:
+        row['itemsets'] += 1
+    report_path.write_text(json.dumps(report))
+    capsys.readouterr()
+    assert benchmark_mining.main(ARGS + ['--no-memory', '--baseline', str(report_path), '--tolerance', '1e9']) == 1
+    assert capsys.readouterr().out.count('REGRESSION') == 2
+
+
+def test_main_rejects_unknown_engines():
+    with pytest.raises(SystemExit):
+        benchmark_mining.main(['--engines', 'nope'])
@@ -0,0 +1,58 @@
+import pytest
+
+from eclat import eclat
+from support_counting import (calculate_support_bitset, itemset_count, min_support_count, popcount,
+                              vertical_bitsets)
+
+
+@pytest.mark.parametrize("min_support", [0.05, 0.1, 0.25, 0.5])
+def test_matches_brute_force(baskets, oracle, min_support):
+    expected = oracle(baskets, min_support)
+    itemsets, support = eclat(baskets, min_support, return_support=True)
+    assert len(itemsets) == len(expected)
+    assert {frozenset(itemset) for itemset in itemsets} == set(expected)
+    assert support == pytest.approx(expected)
+    sizes = [len(itemset) for itemset in itemsets]
+    assert sizes == sorted(sizes)
+
+
+def test_vertical_bitsets(baskets):
+    bitsets, n = vertical_bitsets(baskets)
+    assert n == len(baskets)
+    for item, bits in bitsets.items():
+        assert bits == sum(1 << tid for tid, basket in enumerate(baskets) if item in basket)
+
+
+def test_vertical_bitsets_read_the_transactions_once():
+    # A generator works; bits past the first byte land in the right place
+    bitsets, n = vertical_bitsets(['a'] if i % 9 == 0 else ['b', 'b'] for i in range(20))
+    assert n == 20
+    assert bitsets['a'] == (1 << 0) | (1 << 9) | (1 << 18)
+    assert popcount(bitsets['b']) == 17
+    assert vertical_bitsets([]) == ({}, 0)
+
+
+def test_itemset_count(baskets, oracle):
+    bitsets, n = vertical_bitsets(baskets)
+    for itemset, support in oracle(baskets, 0).items():
+        assert itemset_count(bitsets, itemset, n) == round(support * n)
+    assert itemset_count(bitsets, (), n) == n
+    assert itemset_count(bitsets, ['i0', 'missing'], n) == 0
+    candidates = [{'i0'}, {'i0', 'i1'}, {'missing'}]
+    assert calculate_support_bitset(bitsets, n, candidates) == {
+        frozenset(candidate): itemset_count(bitsets, candidate, n) / n for candidate in candidates
+    }
+
+
+@pytest.mark.parametrize("n", [1, 3, 7, 10, 40, 1000])
+@pytest.mark.parametrize("min_support", [0.0, 0.01, 0.1, 0.3, 1 / 3, 0.5, 0.7, 1.0])
+def test_min_support_count(n, min_support):
+    count = min_support_count(n, min_support)
+    assert count / n >= min_support
+    assert count == 0 or (count - 1) / n < min_support
+
+
+def test_empty_input(transactions):
+    assert eclat([], 0.1) == []
+    assert eclat([], 0.1, return_support=True) == ([], {})
+    assert eclat(transactions, 1.1) == []
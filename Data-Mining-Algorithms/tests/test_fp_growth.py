@@ -0,0 +1,48 @@
+import pytest
+
+from fp_growth import build_fp_tree, fp_growth
+
+
+def _as_map(itemsets):
+    return {frozenset(itemset) for itemset in itemsets}
+
+
+@pytest.mark.parametrize("min_support", [0.05, 0.1, 0.25, 0.5])
+def test_matches_brute_force(baskets, oracle, min_support):
+    expected = oracle(baskets, min_support)
+    itemsets, support = fp_growth(baskets, min_support, return_support=True)
+    assert len(itemsets) == len(expected)
+    assert _as_map(itemsets) == set(expected)
+    assert support == pytest.approx(expected)
+    assert fp_growth(baskets, min_support) == itemsets
+
+
+def test_itemsets_come_by_size(transactions):
+    sizes = [len(itemset) for itemset in fp_growth(transactions, 0.4)]
+    assert sizes == sorted(sizes)
+    assert sizes[-1] == 3
+
+
+def test_single_path_tree():
+    # Nested baskets give a single-path tree, mined without conditional trees
+    transactions = [['a'], ['a', 'b'], ['a', 'b', 'c'], ['a', 'b', 'c', 'd']]
+    _, support = fp_growth(transactions, 0.5, return_support=True)
+    assert support == {
+        frozenset('a'): 1.0, frozenset('b'): 0.75, frozenset('ab'): 0.75,
+        frozenset('c'): 0.5, frozenset('ac'): 0.5, frozenset('bc'): 0.5, frozenset('abc'): 0.5,
+    }
+
+
+def test_tree_counts_and_header(transactions):
+    root, header, counts = build_fp_tree([(t, 1) for t in transactions], 3)
+    assert counts == {'bread': 5, 'milk': 3, 'butter': 3, 'beer': 3}
+    # bread is in every basket, so it is the only child of the root
+    assert list(root.children) == ['bread']
+    for item, nodes in header.items():
+        assert sum(node.count for node in nodes) == counts[item]
+
+
+def test_empty_input_and_unreachable_support(transactions):
+    assert fp_growth([], 0.1) == []
+    assert fp_growth([], 0.1, return_support=True) == ([], {})
+    assert fp_growth(transactions, 1.1) == []
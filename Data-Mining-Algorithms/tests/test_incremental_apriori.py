@@ -0,0 +1,93 @@
+import csv
+import json
+import os
+
+import pytest
+
+from apriori_algorithm import apriori
+from incremental_apriori import IncrementalMiner
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "state.json"), str(tmp_path / "transactions.csv")
+
+
+@pytest.mark.parametrize("min_support", [0.1, 0.25])
+@pytest.mark.parametrize("splits", [(40,), (30, 10), (5, 5, 20, 1, 9), (1, 39)])
+def test_matches_remining(paths, baskets, oracle, min_support, splits):
+    seen = 0
+    for size in splits:
+        # A fresh miner every time, so the state also goes through the files
+        miner = IncrementalMiner(*paths, min_support=min_support)
+        stats = miner.update(baskets[seen:seen + size])
+        seen += size
+        assert stats['increment'] == size
+        itemsets, support = miner.itemsets(return_support=True)
+        expected = oracle(baskets[:seen], min_support)
+        assert stats['frequent'] == len(itemsets) == len(expected)
+        assert support == pytest.approx(expected)
+        assert support == pytest.approx(apriori(baskets[:seen], min_support, return_support=True)[1])
+
+
+def test_only_rescans_for_itemsets_frequent_in_the_increment(paths):
+    miner = IncrementalMiner(*paths, min_support=0.5)
+    miner.update([['a', 'b']] * 4 + [['c']] * 4)
+    # Nothing new is frequent in an increment of known itemsets
+    stats = miner.update([['a', 'b'], ['a']])
+    assert stats['old_scans'] == 0
+    assert miner.itemsets(return_support=True)[1] == {frozenset('a'): 0.6, frozenset('b'): 0.5,
+                                                      frozenset('ab'): 0.5}
+    # d is frequent in the increment, so its old count is read once
+    stats = miner.update([['d', 'a']] * 4)
+    assert (stats['old_scans'], stats['rescanned_candidates']) == (1, 1)
+    assert miner.itemsets(return_support=True)[1] == {frozenset('a'): 10 / 14}
+
+
+def test_state_file_and_data_file(paths):
+    state_path, data_path = paths
+    miner = IncrementalMiner(state_path, data_path, min_support=0.6)
+    miner.update([[1, 2], [2, 3]])
+    # Items are stored as strings
+    with open(state_path) as f:
+        assert json.load(f) == {'min_support': 0.6, 'n_transactions': 2, 'itemsets': [[['2'], 2]],
+                                'data_bytes': os.path.getsize(data_path)}
+    with open(data_path, newline='') as f:
+        assert sorted(map(sorted, csv.reader(f))) == [['1', '2'], ['2', '3']]
+
+
+def test_items_holding_commas_stay_whole(paths):
+    miner = IncrementalMiner(*paths, min_support=0.6)
+    miner.update([['salt, coarse', '"quoted"'], ['a'], ['a']])
+    # 'salt, coarse' becomes frequent only with its count in the old rows
+    stats = miner.update([['salt, coarse']] * 2)
+    assert (stats['old_scans'], stats['rescanned_candidates']) == (1, 1)
+    assert miner.itemsets(return_support=True)[1] == {frozenset(['salt, coarse']): 0.6}
+
+
+def test_rows_written_before_a_crash_are_dropped(paths, baskets, oracle):
+    state_path, data_path = paths
+    IncrementalMiner(*paths, min_support=0.1).update(baskets[:20])
+    # A run that appended its rows but stopped before saving the state
+    size = os.path.getsize(data_path)
+    with open(data_path, 'a', newline='') as f:
+        csv.writer(f).writerows(baskets[20:] * 3)
+
+    miner = IncrementalMiner(*paths)
+    miner.update(baskets[20:])
+    assert miner.n_transactions == len(baskets)
+    assert miner.itemsets(return_support=True)[1] == pytest.approx(oracle(baskets, 0.1))
+    with open(data_path, newline='') as f:
+        assert len(list(csv.reader(f))) == len(baskets)
+    assert miner.data_bytes == os.path.getsize(data_path) > size
+
+
+def test_empty_update_and_min_support_checks(paths):
+    with pytest.raises(ValueError):
+        IncrementalMiner(*paths)
+    miner = IncrementalMiner(*paths, min_support=0.5)
+    stats = miner.update([])
+    assert stats['increment'] == 0
+    assert IncrementalMiner(*paths).min_support == 0.5
+    with pytest.raises(ValueError):
+        IncrementalMiner(*paths, min_support=0.25)
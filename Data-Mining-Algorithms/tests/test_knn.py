@@ -0,0 +1,82 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from knn import KNN
+
+
+def _counter_predict(X_train, y_train, x, k):
+    # The original per-row prediction: full argsort, then Counter.most_common
+    nearest = np.argsort(np.linalg.norm(X_train - x, axis=1))[:k]
+    return Counter(y_train[nearest]).most_common(1)[0][0]
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, 6))
+    y = np.array(['ant', 'bee', 'cat', 'dog'])[rng.integers(0, 4, size=400)]
+    return X, y, rng.normal(size=(50, 6))
+
+
+@pytest.mark.parametrize("k", [1, 2, 4, 7])
+def test_predict_matches_counter_vote(data, k):
+    X, y, queries = data
+    model = KNN(k).fit(X, y)
+    assert model.predict(queries).tolist() == [_counter_predict(X, y, x, k) for x in queries]
+
+
+@pytest.mark.parametrize("n_classes, k", [(2, 2), (3, 6), (5, 4), (5, 10)])
+def test_vote_breaks_ties_like_counter(n_classes, k):
+    rng = np.random.default_rng(k)
+    codes = rng.integers(0, n_classes, size=(500, k))
+    model = KNN(k)
+    model.classes_ = np.arange(n_classes)
+    expected = [Counter(row.tolist()).most_common(1)[0][0] for row in codes]
+    assert model._vote(codes).tolist() == expected
+
+    # Weighted: the largest total, the nearest first occurrence among equal totals
+    weights = rng.integers(1, 3, size=codes.shape).astype(float)
+    expected = []
+    for row, row_weights in zip(codes.tolist(), weights.tolist()):
+        totals = {}
+        for code, weight in zip(row, row_weights):
+            totals[code] = totals.get(code, 0) + weight
+        expected.append(max(totals, key=totals.get))
+    assert model._vote(codes, weights).tolist() == expected
+
+
+@pytest.mark.parametrize("memory_budget", [1, 16 * 400 * 7, 16 * 400 * 50])
+def test_small_memory_budget_chunks_the_queries(data, monkeypatch, memory_budget):
+    X, y, queries = data
+    expected = KNN(5).fit(X, y).kneighbors(queries)
+    model = KNN(5, memory_budget=memory_budget).fit(X, y)
+
+    chunks = []
+    brute_chunk = model._brute_chunk
+    monkeypatch.setattr(model, '_brute_chunk', lambda rows, k: chunks.append(len(rows)) or brute_chunk(rows, k))
+    distances, indices = model.kneighbors(queries)
+    assert chunks == [len(part) for part in np.array_split(queries, range(model._chunk_size(), 50,
+                                                                          model._chunk_size()))]
+    assert max(chunks) == min(50, max(1, memory_budget // (16 * 400)))
+    np.testing.assert_array_equal(indices, expected[1])
+    np.testing.assert_allclose(distances, expected[0])
+
+
+def test_kneighbors_sorted_and_k_beyond_the_data(data):
+    X, y, queries = data
+    model = KNN(3).fit(X[:8], y[:8])
+    distances, indices = model.kneighbors(queries, k=20)
+    assert distances.shape == indices.shape == (50, 8)
+    assert np.all(np.diff(distances, axis=1) >= 0)
+    assert all(sorted(row) == list(range(8)) for row in indices.tolist())
+    np.testing.assert_allclose(distances, np.linalg.norm(queries[:, None] - X[indices], axis=2))
+    # A single row works too, and a training point is its own nearest neighbour at distance 0
+    distances, indices = model.kneighbors(X[3])
+    assert indices[0, 0] == 3 and distances[0, 0] == 0
+
+
+def test_rejects_unknown_weights():
+    with pytest.raises(ValueError):
+        KNN(weights='nope')
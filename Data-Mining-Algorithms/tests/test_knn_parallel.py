@@ -0,0 +1,100 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from knn import KNN
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(2000, 8))
+    y = rng.integers(0, 5, size=2000)
+    return X, y, rng.normal(size=(97, 8))
+
+
+def _block_names(model):
+    _, _, (_, blocks), _ = model._finalizer.peek()
+    return [memory.name for memory in blocks]
+
+
+def _arrays_in(value, path=''):
+    """(path, array) of every NumPy array reachable through attributes, dicts and lists"""
+    if isinstance(value, np.ndarray):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield from _arrays_in(item, f'{path}.{key}')
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            yield from _arrays_in(item, f'{path}.{i}')
+    elif hasattr(value, '__dict__'):
+        yield from _arrays_in(vars(value), path)
+
+
+def _assert_unlinked(names):
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree", "ball_tree", "rp_forest"])
+@pytest.mark.parametrize("weights", ["uniform", "distance"])
+def test_matches_serial(data, algorithm, weights):
+    X, y, queries = data
+    serial = KNN(7, algorithm=algorithm, weights=weights).fit(X, y)
+    with KNN(7, algorithm=algorithm, weights=weights, n_jobs=2).fit(X, y) as parallel:
+        for expected, result in zip(serial.kneighbors(queries), parallel.kneighbors(queries)):
+            np.testing.assert_array_equal(result, expected)
+        np.testing.assert_array_equal(parallel.predict(queries), serial.predict(queries))
+        np.testing.assert_array_equal(parallel.kneighbors(queries, k=3)[1], serial.kneighbors(queries, k=3)[1])
+
+
+def test_close_and_with_block_unlink_the_shared_memory(data):
+    X, y, queries = data
+    model = KNN(3, n_jobs=2).fit(X, y)
+    names = _block_names(model)
+    # X_train, the label codes and the squared norms
+    assert len(names) == 3
+    model.close()
+    _assert_unlinked(names)
+    model.close()
+    # Without a pool, queries run in this process
+    assert model.predict(queries[:5]).shape == (5,)
+
+    with KNN(3, algorithm='rp_forest', n_jobs=2).fit(X, y) as model:
+        names = _block_names(model)
+        model.predict(queries)
+    _assert_unlinked(names)
+
+    model = KNN(3, n_jobs=2).fit(X, y)
+    names = _block_names(model)
+    # Refitting frees the old blocks
+    model.fit(X[:100], y[:100])
+    _assert_unlinked(names)
+    model.close()
+
+
+def test_fit_starts_every_worker(data):
+    X, y, _ = data
+    with KNN(3, n_jobs=2).fit(X, y) as model:
+        assert len(model._pool._processes) == 2
+
+
+@pytest.mark.parametrize("algorithm", ["brute", "kd_tree", "rp_forest"])
+def test_workers_get_no_per_point_arrays(data, algorithm):
+    X, y, _ = data
+    model = KNN(3, algorithm=algorithm, memory_budget=2 ** 20).fit(X, y)
+    arrays = model._shared_arrays()
+    template = model._worker_template(arrays, 4)
+    assert template.memory_budget == 2 ** 18
+    # Every array with one entry per training point is shared instead of pickled
+    assert not [path for path, value in _arrays_in(template) if len(value) == len(X)]
+    if algorithm == 'rp_forest':
+        assert len([name for name in arrays if name.endswith('.order')]) == model.n_trees
+        assert all(tree['order'] is None for tree in template.index_.trees)
+        # The model's own trees are left alone
+        assert all(tree['order'] is not None for tree in model.index_.trees)
+    if algorithm != 'brute':
+        assert template.index_.points is None and model.index_.points is not None
@@ -0,0 +1,69 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from benchmark_knn import make_clusters
+from knn import KNN
+from knn_selection import score_all_k, select_k
+
+
+@pytest.fixture(scope="module")
+def clusters():
+    # Wide clusters overlap, so the best k is neither 1 nor k_max
+    X, y = make_clusters(600, 4, n_classes=4, spread=6.0)
+    return X, np.array(['a', 'b', 'c', 'd'])[y]
+
+
+def _refit_scores(X, y, k_max, n_folds, weights, random_state=0, **knn_params):
+    # One fit and predict per fold and per k, on the folds select_k uses
+    order = np.random.default_rng(random_state).permutation(len(X))
+    scores = np.zeros((n_folds, k_max))
+    for fold, validation in enumerate(np.array_split(order, n_folds)):
+        train = np.setdiff1d(order, validation)
+        for k in range(1, k_max + 1):
+            model = KNN(k, weights=weights, **knn_params).fit(X[train], y[train])
+            scores[fold, k - 1] = np.mean(model.predict(X[validation]) == y[validation])
+    return scores
+
+
+@pytest.mark.parametrize("weights", ["uniform", "distance"])
+def test_matches_refitting_for_every_k(clusters, weights):
+    X, y = clusters
+    result = select_k(X, y, k_max=15, n_folds=4, weights=weights)
+    expected = _refit_scores(X, y, 15, 4, weights)
+    np.testing.assert_allclose(result['fold_scores'], expected)
+    np.testing.assert_allclose(result['scores'], expected.mean(axis=0))
+    assert result['k'].tolist() == list(range(1, 16))
+    best = np.flatnonzero(result['scores'] == result['scores'].max())[0] + 1
+    assert result['best_k'] == best
+    assert 1 < best
+    assert result['seconds'] >= 0
+
+
+def test_knn_params_and_parallel_folds(clusters):
+    X, y = clusters
+    serial = select_k(X, y, k_max=8, n_folds=3, algorithm='kd_tree', leaf_size=5)
+    np.testing.assert_allclose(serial['fold_scores'], _refit_scores(X, y, 8, 3, 'uniform', algorithm='kd_tree', leaf_size=5))
+    parallel = select_k(X, y, k_max=8, n_folds=3, n_jobs=2, algorithm='kd_tree', leaf_size=5)
+    np.testing.assert_array_equal(parallel['fold_scores'], serial['fold_scores'])
+
+
+def test_score_all_k_breaks_ties_like_counter():
+    rng = np.random.default_rng(0)
+    codes = rng.integers(0, 3, size=(400, 6))
+    true_codes = rng.integers(0, 3, size=400)
+    expected = [np.mean([Counter(row[:k].tolist()).most_common(1)[0][0] == truth
+                         for row, truth in zip(codes, true_codes)]) for k in range(1, 7)]
+    np.testing.assert_allclose(score_all_k(codes, true_codes, 3), expected)
+    assert score_all_k(np.empty((0, 4), dtype=int), np.empty(0, dtype=int), 3).tolist() == [0] * 4
+
+
+def test_rejects_bad_arguments(clusters):
+    X, y = clusters
+    with pytest.raises(ValueError):
+        select_k(X, y, weights='nope')
+    with pytest.raises(ValueError):
+        select_k(X, y, n_folds=1)
+    with pytest.raises(ValueError):
+        select_k(X[:10], y[:10], k_max=9, n_folds=2)
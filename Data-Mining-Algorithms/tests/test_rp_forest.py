@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from benchmark_knn import make_clusters, recall_at_k
+from knn import KNN
+from rp_forest import RandomProjectionForest
+
+
+@pytest.fixture(scope="module")
+def clusters():
+    X, y = make_clusters(5000, 16)
+    queries, X, y = X[:200], X[200:], y[200:]
+    exact = KNN(10).fit(X, y).kneighbors(queries)[1]
+    return X, y, queries, exact
+
+
+@pytest.mark.parametrize("n_trees, n_probes, floor", [(5, 2, 0.85), (10, 2, 0.95), (20, 4, 0.99)])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_recall_floor(clusters, n_trees, n_probes, floor, seed):
+    X, y, queries, exact = clusters
+    model = KNN(10, algorithm='rp_forest', n_trees=n_trees, n_probes=n_probes, random_state=seed).fit(X, y)
+    distances, indices = model.kneighbors(queries)
+    assert recall_at_k(indices, exact) >= floor
+    # Whatever is found is measured exactly and sorted
+    np.testing.assert_allclose(distances, np.linalg.norm(queries[:, None] - X[indices], axis=2))
+    assert np.all(np.diff(distances, axis=1) >= 0)
+
+
+def test_recall_grows_with_trees_and_probes(clusters):
+    X, _, queries, exact = clusters
+    recalls = []
+    for n_trees, n_probes in [(1, 0), (1, 3), (8, 3)]:
+        forest = RandomProjectionForest(X, n_trees, n_probes)
+        recalls.append(recall_at_k(np.array([forest.query(x, 10)[1] for x in queries]), exact))
+    assert recalls == sorted(recalls) and recalls[0] < recalls[-1]
+
+
+@pytest.mark.parametrize("leaf_size", [1, 7, 40])
+def test_trees_partition_the_points(leaf_size):
+    X = np.random.default_rng(0).normal(size=(300, 4))
+    forest = RandomProjectionForest(X, n_trees=3, leaf_size=leaf_size, seed=1)
+    for tree in forest.trees:
+        assert tree['order'].dtype == np.int32
+        assert sorted(tree['order'].tolist()) == list(range(300))
+        leaves = [node for node, left in enumerate(tree['left']) if left == -1]
+        sizes = [tree['end'][leaf] - tree['start'][leaf] for leaf in leaves]
+        assert sum(sizes) == 300 and max(sizes) <= leaf_size
+    # Every query reaches its own leaf, plus at most n_probes more
+    for x in X[:20]:
+        assert 1 <= len(forest._leaves(forest.trees[0], x)) <= 1 + forest.n_probes
+
+
+def test_same_seed_same_forest_and_small_inputs():
+    X = np.random.default_rng(0).normal(size=(200, 3))
+    first, second = RandomProjectionForest(X, seed=5), RandomProjectionForest(X, seed=5)
+    assert all(np.array_equal(a['order'], b['order']) for a, b in zip(first.trees, second.trees))
+
+    # Fewer candidates than k falls back to a full scan, so k results come back
+    distances, indices = RandomProjectionForest(X, n_trees=1, n_probes=0, leaf_size=2).query(X[0], 50)
+    expected = np.sort(np.linalg.norm(X - X[0], axis=1))[:50]
+    np.testing.assert_allclose(distances, expected)
+    assert len(set(indices.tolist())) == 50
+
+    # One leaf holding every point is exact
+    forest = RandomProjectionForest(X, n_trees=1, leaf_size=200)
+    np.testing.assert_allclose(forest.query(X[7], 5)[0], np.sort(np.linalg.norm(X - X[7], axis=1))[:5])
+    assert [len(part) for part in RandomProjectionForest(np.empty((0, 3))).query(X[0], 3)] == [0, 0]
+    with pytest.raises(ValueError):
+        RandomProjectionForest(X, n_trees=0)
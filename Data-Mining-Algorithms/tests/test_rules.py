@@ -0,0 +1,80 @@
+from itertools import combinations
+
+import pytest
+
+from apriori_algorithm import apriori, generate_rules, iter_rules
+
+
+def _brute_force_rules(support, min_confidence):
+    rules = {}
+    for itemset, itemset_support in support.items():
+        for size in range(1, len(itemset)):
+            for consequent in map(frozenset, combinations(itemset, size)):
+                confidence = itemset_support / support[itemset - consequent]
+                if confidence >= min_confidence:
+                    rules[itemset - consequent, consequent] = confidence
+    return rules
+
+
+def _as_map(rules):
+    return {(frozenset(antecedent), frozenset(consequent)): confidence
+            for antecedent, consequent, confidence in rules}
+
+
+class RecordingSupport(dict):
+    """Support map recording the itemsets looked up"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.lookups = []
+
+    def __getitem__(self, itemset):
+        self.lookups.append(itemset)
+        return super().__getitem__(itemset)
+
+
+@pytest.mark.parametrize("min_confidence", [0.0, 0.3, 0.6, 0.9, 1.0])
+def test_matches_brute_force(baskets, oracle, min_confidence):
+    support = oracle(baskets, 0.05)
+    expected = _brute_force_rules(support, min_confidence)
+    rules = list(iter_rules(list(map(set, support)), None, min_confidence, support))
+    assert len(rules) == len(expected)
+    assert _as_map(rules) == pytest.approx(expected)
+
+
+def test_counts_supports_without_a_support_map(baskets):
+    itemsets, support = apriori(baskets, 0.1, return_support=True)
+    expected = _as_map(generate_rules(itemsets, None, 0.5, support=support))
+    assert _as_map(generate_rules(itemsets, baskets, 0.5)) == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        generate_rules(itemsets, None, 0.5)
+
+
+def test_skips_consequents_with_an_unconfident_subset():
+    support = RecordingSupport({
+        frozenset('a'): 0.9, frozenset('b'): 0.7, frozenset('c'): 0.7,
+        frozenset('ab'): 0.3, frozenset('ac'): 0.3, frozenset('bc'): 0.6, frozenset('abc'): 0.3,
+    })
+    rules = _as_map(iter_rules([{'a', 'b', 'c'}], None, 0.7, support))
+    # bc -> a has confidence 0.5, a -> bc 1/3
+    assert rules == pytest.approx({(frozenset('ac'), frozenset('b')): 1.0, (frozenset('ab'), frozenset('c')): 1.0})
+    # So the consequents ab and ac, whose antecedents are c and b, are never tried
+    assert frozenset('a') in support.lookups
+    assert frozenset('b') not in support.lookups
+    assert frozenset('c') not in support.lookups
+
+
+def test_top_k(baskets, oracle):
+    support = oracle(baskets, 0.05)
+    itemsets = list(map(set, support))
+    rules = generate_rules(itemsets, None, 0.2, support=support)
+    confidences = sorted((rule[2] for rule in rules), reverse=True)
+    for top_k in (0, 1, 5, len(rules), len(rules) + 10):
+        best = generate_rules(itemsets, None, 0.2, support=support, top_k=top_k)
+        assert [rule[2] for rule in best] == confidences[:top_k]
+        assert _as_map(best).items() <= _as_map(rules).items()
+
+
+def test_single_items_give_no_rules():
+    support = {frozenset('a'): 0.5, frozenset('b'): 0.5}
+    assert generate_rules([{'a'}, {'b'}], None, 0.0, support=support) == []
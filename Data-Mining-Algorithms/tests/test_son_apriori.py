@@ -0,0 +1,58 @@
+import pytest
+
+from son_apriori import parse_line, read_chunks, son_apriori, write_transactions
+
+
+@pytest.fixture
+def basket_file(tmp_path, baskets):
+    path = tmp_path / "baskets.csv"
+    write_transactions(path, baskets)
+    return path
+
+
+@pytest.mark.parametrize("chunk_size, workers, engine", [
+    (7, 1, 'eclat'),
+    (7, 2, 'apriori'),
+    (13, 2, 'fp-growth'),
+    (1000, 1, 'eclat'),
+])
+def test_matches_brute_force(basket_file, baskets, oracle, chunk_size, workers, engine):
+    expected = oracle(baskets, 0.1)
+    itemsets, support = son_apriori(basket_file, 0.1, chunk_size, workers, engine, return_support=True)
+    assert {frozenset(itemset) for itemset in itemsets} == set(expected)
+    assert support == pytest.approx(expected)
+    sizes = [len(itemset) for itemset in itemsets]
+    assert sizes == sorted(sizes)
+
+
+def test_drops_candidates_frequent_in_one_chunk_only(tmp_path):
+    # 'x' is frequent in the first chunk of 4 but in only 3 of 12 baskets overall
+    path = tmp_path / "t.csv"
+    write_transactions(path, [['a', 'x']] * 3 + [['a', 'b']] * 5 + [['a', 'b', 'c']] * 4)
+    itemsets, support = son_apriori(path, 0.5, chunk_size=4, workers=2, return_support=True)
+    assert support == {frozenset('a'): 1.0, frozenset('b'): 0.75, frozenset('ab'): 0.75}
+    assert [len(itemset) for itemset in itemsets] == [1, 1, 2]
+
+
+def test_read_chunks_and_parse_line(tmp_path):
+    path = tmp_path / "t.txt"
+    path.write_text("a; b ;;c\n\n d\ne;f\n")
+    assert list(read_chunks(path, 2)) == [["a; b ;;c\n", "\n"], [" d\n", "e;f\n"]]
+    assert list(read_chunks(path, 3)) == [["a; b ;;c\n", "\n", " d\n"], ["e;f\n"]]
+    assert parse_line("a; b ;;c\n", ';') == ['a', 'b', 'c']
+    assert parse_line("\n") == []
+
+
+def test_delimiter(tmp_path, transactions):
+    path = tmp_path / "t.tsv"
+    write_transactions(path, transactions, delimiter='\t')
+    itemsets = son_apriori(path, 0.6, chunk_size=2, workers=1, delimiter='\t')
+    assert {frozenset(itemset) for itemset in itemsets} == {
+        frozenset(['bread']), frozenset(['milk']), frozenset(['butter']), frozenset(['beer']),
+        frozenset(['bread', 'milk']), frozenset(['bread', 'butter']), frozenset(['bread', 'beer']),
+    }
+
+
+def test_rejects_unknown_engine(basket_file):
+    with pytest.raises(ValueError):
+        son_apriori(basket_file, 0.1, engine='nope')
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from knn import KNN
+from spatial_index import INDEXES, BallTree, KDTree
+
+
+def _exact(X, queries):
+    return np.sqrt(((queries[:, None, :] - X[None, :, :]) ** 2).sum(axis=2))
+
+
+def check_neighbours(X, queries, distances, indices, k):
+    """Assert (distances, indices) are k exact nearest neighbours, any order among equal distances"""
+    exact = _exact(X, queries)
+    expected = np.sort(exact, axis=1)[:, :k]
+    assert distances.shape == indices.shape == (len(queries), k)
+    np.testing.assert_allclose(distances, expected, atol=1e-9)
+    np.testing.assert_allclose(np.take_along_axis(exact, indices, axis=1), distances, atol=1e-9)
+    for row in indices:
+        assert len(set(row.tolist())) == k
+
+
+@pytest.mark.parametrize("algorithm", ["kd_tree", "ball_tree", "auto"])
+@pytest.mark.parametrize("n_features", [2, 5, 20])
+@pytest.mark.parametrize("k, leaf_size", [(1, 40), (5, 3), (12, 4), (60, 10)])
+def test_matches_brute_force(algorithm, n_features, k, leaf_size):
+    rng = np.random.default_rng(n_features)
+    X = rng.normal(size=(300, n_features))
+    y = rng.integers(0, 3, size=300)
+    queries = rng.normal(size=(40, n_features))
+    brute = KNN(k).fit(X, y)
+    model = KNN(k, algorithm=algorithm, leaf_size=leaf_size).fit(X, y)
+
+    distances, indices = model.kneighbors(queries)
+    check_neighbours(X, queries, distances, indices, k)
+    # No ties in continuous data, so the indices are the same too
+    np.testing.assert_array_equal(indices, brute.kneighbors(queries)[1])
+    np.testing.assert_array_equal(model.predict(queries), brute.predict(queries))
+
+
+@pytest.mark.parametrize("index", [KDTree, BallTree])
+@pytest.mark.parametrize("leaf_size", [1, 2, 7])
+def test_ties_on_a_grid(index, leaf_size):
+    # Grid points with duplicates: many neighbours share a distance
+    grid = np.array([(i, j) for i in range(6) for j in range(6)], dtype=float)
+    X = np.concatenate([grid, grid[::3]])
+    queries = np.concatenate([grid[::5], grid[::7] + 0.5])
+    tree = index(X, leaf_size)
+    for k in (1, 4, 9, leaf_size + 3):
+        results = [tree.query(x, k) for x in queries]
+        check_neighbours(X, queries, np.array([d for d, _ in results]), np.array([i for _, i in results]), k)
+
+
+@pytest.mark.parametrize("index", [KDTree, BallTree])
+def test_k_beyond_the_data(index):
+    X = np.arange(10, dtype=float).reshape(5, 2)
+    distances, indices = index(X, leaf_size=2).query([0.0, 0.0], k=50)
+    assert sorted(indices.tolist()) == list(range(5))
+    assert np.all(np.diff(distances) >= 0)
+    assert [len(part) for part in index(np.empty((0, 2))).query([0.0, 0.0], 3)] == [0, 0]
+
+
+def test_auto_picks_the_tree_by_dimension():
+    rng = np.random.default_rng(0)
+    assert isinstance(KNN(algorithm='auto').fit(rng.normal(size=(50, 15)), np.zeros(50)).index_, KDTree)
+    assert isinstance(KNN(algorithm='auto').fit(rng.normal(size=(50, 16)), np.zeros(50)).index_, BallTree)
+
+
+def test_rejects_bad_parameters():
+    with pytest.raises(ValueError):
+        KNN(algorithm='nope')
+    for index in INDEXES.values():
+        with pytest.raises(ValueError):
+            index(np.zeros((3, 2)), leaf_size=0)
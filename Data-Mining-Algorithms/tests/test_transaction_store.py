@@ -0,0 +1,90 @@
+import json
+
+import numpy as np
+import pytest
+
+from apriori_algorithm import ENGINES, apriori, generate_rules
+from support_counting import vertical_bitsets
+from transaction_store import TransactionStore
+
+
+def test_from_transactions(transactions):
+    store = TransactionStore.from_transactions(transactions)
+    assert len(store) == len(transactions)
+    assert store.items == ['milk', 'bread', 'butter', 'beer']
+    assert list(store) == [[0, 1, 2], [1, 3], [0, 1, 2, 3], [1, 2], [0, 1, 3]]
+    assert store[1] == [1, 3]
+    assert [store.decode(set(row)) for row in store] == list(map(set, transactions))
+    assert store.item_counts().tolist() == [3, 5, 3, 3]
+    assert store.indptr.dtype == np.int64 and store.indices.dtype == np.int32
+    assert store.nbytes() == 6 * 8 + 14 * 4
+
+
+def test_indexing(transactions):
+    store = TransactionStore.from_transactions(transactions)
+    rows = list(store)
+    assert [store[i] for i in range(-len(store), len(store))] == rows + rows
+    for i in (len(store), -len(store) - 1, 100):
+        with pytest.raises(IndexError):
+            store[i]
+    with pytest.raises(IndexError):
+        TransactionStore.from_transactions([])[0]
+
+
+def test_repeated_items_count_once():
+    store = TransactionStore.from_transactions([['b', 'a', 'b'], [], ['a']])
+    assert list(store) == [[0, 1], [], [1]]
+    assert store.item_counts().tolist() == [1, 2]
+
+
+def test_from_csv(tmp_path, transactions):
+    path = tmp_path / "baskets.csv"
+    path.write_text("milk; bread ;butter\nbeer;bread\n\n;;\n")
+    store = TransactionStore.from_csv(path, delimiter=';')
+    assert [store.decode(set(row)) for row in store] == [{'milk', 'bread', 'butter'}, {'beer', 'bread'},
+                                                         set(), set()]
+
+
+def test_from_jsonl(tmp_path):
+    path = tmp_path / "baskets.jsonl"
+    path.write_text('["a", "b"]\n\n[1, "a"]\n')
+    store = TransactionStore.from_jsonl(path)
+    assert store.items == ['a', 'b', 1]
+    assert store.decode([set(row) for row in store]) == [{'a', 'b'}, {1, 'a'}]
+
+    path.write_text("".join(json.dumps({'id': i, 'items': items}) + "\n"
+                            for i, items in enumerate([['x'], ['x', 'y']])))
+    store = TransactionStore.from_jsonl(path, field='items')
+    assert store.decode([set(row) for row in store]) == [{'x'}, {'x', 'y'}]
+
+
+def test_vertical_bitsets_match_the_python_build(baskets):
+    store = TransactionStore.from_transactions(baskets)
+    # A list of the store's rows takes the pure Python path
+    assert store.vertical_bitsets() == vertical_bitsets(list(store))
+    assert vertical_bitsets(store) == store.vertical_bitsets()
+    assert TransactionStore.from_transactions([]).vertical_bitsets() == ({}, 0)
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_engines_mine_a_store(baskets, oracle, engine):
+    store = TransactionStore.from_transactions(baskets)
+    itemsets, support = ENGINES[engine](store, 0.1, return_support=True)
+    assert store.decode(support) == pytest.approx(oracle(baskets, 0.1))
+    assert {frozenset(itemset) for itemset in store.decode(itemsets)} == set(oracle(baskets, 0.1))
+
+
+def _rule_map(rules):
+    return {(frozenset(antecedent), frozenset(consequent)): confidence
+            for antecedent, consequent, confidence in rules}
+
+
+def test_decode_rules(baskets):
+    plain_itemsets, plain_support = apriori(baskets, 0.1, return_support=True)
+    expected = _rule_map(generate_rules(plain_itemsets, None, 0.3, support=plain_support))
+
+    store = TransactionStore.from_transactions(baskets)
+    itemsets, support = apriori(store, 0.1, counting='bitset', return_support=True)
+    assert _rule_map(store.decode(generate_rules(itemsets, None, 0.3, support=support))) == pytest.approx(expected)
+    # Without a support map the supports are counted from the store
+    assert _rule_map(store.decode(generate_rules(itemsets, store, 0.3))) == pytest.approx(expected)
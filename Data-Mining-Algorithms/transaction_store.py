@@ -0,0 +1,133 @@
+
+import json
+import sys
+from array import array
+
+import numpy as np
+
+
+class TransactionStore:
+    """Transactions as integer item IDs in CSR arrays.
+
+    Every distinct item gets an int32 ID (its index in `items`). Transaction
+    i holds the sorted IDs indices[indptr[i]:indptr[i + 1]], so an item
+    occurrence costs 4 bytes instead of a Python object in a set.
+
+    The miners accept a store wherever they take a list of transactions:
+    it iterates as lists of IDs, and `vertical_bitsets()` builds the
+    per-item bitsets with NumPy. Results then hold IDs; `decode()` turns
+    them back into item labels.
+    """
+
+    def __init__(self, items, indptr, indices):
+        self.items = list(items)
+        self.item_ids = {item: i for i, item in enumerate(self.items)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+
+    @classmethod
+    def from_transactions(cls, transactions):
+        item_ids = {}
+        indptr = array('q', [0])
+        indices = array('i')
+        for transaction in transactions:
+            ids = {item_ids.setdefault(item, len(item_ids)) for item in transaction}
+            indices.extend(sorted(ids))
+            indptr.append(len(indices))
+        return cls(item_ids, np.frombuffer(indptr, dtype=np.int64), np.frombuffer(indices, dtype=np.int32))
+
+    @classmethod
+    def from_csv(cls, path, delimiter=','):
+        """One transaction per line, items separated by delimiter"""
+        def rows():
+            with open(path) as f:
+                for line in f:
+                    yield [item.strip() for item in line.split(delimiter) if item.strip()]
+        return cls.from_transactions(rows())
+
+    @classmethod
+    def from_jsonl(cls, path, field=None):
+        """One JSON list of items per line, or objects holding the list under field"""
+        def rows():
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        row = json.loads(line)
+                        yield row[field] if field is not None else row
+        return cls.from_transactions(rows())
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def __iter__(self):
+        indices = self.indices
+        bounds = self.indptr.tolist()
+        for start, stop in zip(bounds, bounds[1:]):
+            yield indices[start:stop].tolist()
+
+    def __getitem__(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("transaction index out of range")
+        return self.indices[self.indptr[i]:self.indptr[i + 1]].tolist()
+
+    def item_counts(self):
+        """Number of transactions containing each item ID"""
+        return np.bincount(self.indices, minlength=len(self.items))
+
+    def vertical_bitsets(self):
+        """Same result as support_counting.vertical_bitsets(), built without a Python loop over occurrences"""
+        n = len(self)
+        rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind='stable')
+        bounds = np.searchsorted(self.indices[order], np.arange(len(self.items) + 1))
+        bitsets = {}
+        column = np.zeros(n, dtype=bool)
+        for item in range(len(self.items)):
+            tids = rows[order[bounds[item]:bounds[item + 1]]]
+            if not len(tids):
+                continue
+            column[tids] = True
+            bitsets[item] = int.from_bytes(np.packbits(column, bitorder='little').tobytes(), 'little')
+            column[tids] = False
+        return bitsets, n
+
+    def nbytes(self):
+        """Bytes held by the CSR arrays"""
+        return self.indptr.nbytes + self.indices.nbytes
+
+    def decode(self, result):
+        """Map item IDs in miner output back to item labels.
+
+        Accepts an itemset, a list of itemsets, a support map or a list of
+        (antecedent, consequent, confidence) rules.
+        """
+        items = self.items
+        if isinstance(result, dict):
+            return {frozenset(items[i] for i in itemset): value for itemset, value in result.items()}
+        if isinstance(result, (set, frozenset)):
+            return {items[i] for i in result}
+        if isinstance(result, tuple):
+            antecedent, consequent, confidence = result
+            return self.decode(antecedent), self.decode(consequent), confidence
+        return [self.decode(entry) for entry in result]
+
+
+if __name__ == "__main__":
+    from apriori_algorithm import apriori, generate_rules
+    from basket_generator import generate_baskets
+
+    transactions = generate_baskets(int(float(sys.argv[1])) if len(sys.argv) > 1 else 100000)
+    store = TransactionStore.from_transactions(transactions)
+    as_sets = list(map(set, transactions))
+    python_bytes = sys.getsizeof(as_sets) + sum(sys.getsizeof(t) for t in as_sets)
+    print(f"{len(store)} transactions: {python_bytes / 2 ** 20:.1f} MiB as sets, "
+          f"{store.nbytes() / 2 ** 20:.1f} MiB as CSR")
+
+    itemsets, support = apriori(store, 0.02, counting='bitset', return_support=True)
+    rules = generate_rules(itemsets, None, 0.3, support=support)
+    print(f"{len(itemsets)} itemsets, {len(rules)} rules")
+    for rule in store.decode(rules[:5]):
+        print(rule)
@@ -0,0 +1,184 @@
+"""
+Title: Prefix Search over Sorted Strings
+Contribution: Hacktoberfest 2025
+Repository: https://github.com/A-K-0/HACKTOBERFEST_25_Python
+
+Description:
+A compact index over a sorted list of strings that answers "which keys
+start with this prefix?" as a range of positions in the sorted list.
+
+Words are stored front-coded in blocks: the first word of every block is
+kept whole (the block "head"), every other word only as the number of
+leading bytes it shares with the previous word plus the remaining suffix.
+Sorted word lists share long prefixes, so this stores a fraction of the
+bytes of a plain Python list of strings. A lookup binary searches the
+block heads and decodes at most two blocks.
+"""
+
+import bisect
+import sys
+
+
+def _encode_varint(value, out):
+    """Append value to the bytearray out as a little-endian base-128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(data, pos):
+    """Read a varint from data at pos; return (value, next position)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _common_prefix(a, b):
+    """Length of the longest common prefix of two byte strings."""
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class PrefixIndex:
+    """Front-coded index over sorted strings for prefix range queries."""
+
+    def __init__(self, words, block_size=16):
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        self.block_size = block_size
+        self.heads = []
+        self.blocks = []
+        self.n = 0
+
+        previous = None
+        block = bytearray()
+        for word in words:
+            # Strings compare in code point order, which UTF-8 preserves
+            data = word.encode("utf-8")
+            if previous is not None and data < previous:
+                raise ValueError("words must be sorted")
+            if self.n % block_size == 0:
+                if self.heads:
+                    self.blocks.append(bytes(block))
+                    block = bytearray()
+                self.heads.append(data)
+            else:
+                shared = _common_prefix(previous, data)
+                _encode_varint(shared, block)
+                _encode_varint(len(data) - shared, block)
+                block += data[shared:]
+            previous = data
+            self.n += 1
+        if self.heads:
+            self.blocks.append(bytes(block))
+
+    def __len__(self):
+        return self.n
+
+    def _decode_block(self, b):
+        """Return every word of block b as bytes."""
+        words = [self.heads[b]]
+        data = self.blocks[b]
+        pos = 0
+        while pos < len(data):
+            shared, pos = _decode_varint(data, pos)
+            length, pos = _decode_varint(data, pos)
+            words.append(words[-1][:shared] + data[pos:pos + length])
+            pos += length
+        return words
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("PrefixIndex index out of range")
+        b, offset = divmod(i, self.block_size)
+        return self._decode_block(b)[offset].decode("utf-8")
+
+    def __iter__(self):
+        for b in range(len(self.heads)):
+            for word in self._decode_block(b):
+                yield word.decode("utf-8")
+
+    def _first_after(self, prefix):
+        """Position of the first word that sorts after every word starting with prefix."""
+        size = len(prefix)
+        # Binary search for the first block head past the prefix range,
+        # comparing only the first len(prefix) bytes of each head
+        left, right = 0, len(self.heads)
+        while left < right:
+            mid = (left + right) // 2
+            if self.heads[mid][:size] <= prefix:
+                left = mid + 1
+            else:
+                right = mid
+        if left == 0:
+            return 0
+        # The range ends inside the previous block
+        words = self._decode_block(left - 1)
+        inside = 0
+        while inside < len(words) and words[inside][:size] <= prefix:
+            inside += 1
+        return (left - 1) * self.block_size + inside
+
+    def _lower_bound(self, key):
+        """Position of the first word that is not smaller than key."""
+        b = bisect.bisect_left(self.heads, key)
+        if b == 0:
+            return 0
+        words = self._decode_block(b - 1)
+        return (b - 1) * self.block_size + bisect.bisect_left(words, key)
+
+    def prefix_range(self, prefix):
+        """Return (start, stop): the sorted words [start, stop) start with prefix."""
+        key = prefix.encode("utf-8")
+        start = self._lower_bound(key)
+        if not key:
+            return start, self.n
+        return start, max(self._first_after(key), start)
+
+    def count(self, prefix):
+        """Number of words starting with prefix."""
+        start, stop = self.prefix_range(prefix)
+        return stop - start
+
+    def with_prefix(self, prefix):
+        """List every word starting with prefix, in sorted order."""
+        start, stop = self.prefix_range(prefix)
+        result = []
+        b = start // self.block_size
+        while start < stop:
+            words = self._decode_block(b)
+            first = start - b * self.block_size
+            last = min(stop - b * self.block_size, len(words))
+            result.extend(word.decode("utf-8") for word in words[first:last])
+            start = (b + 1) * self.block_size
+            b += 1
+        return result
+
+    def memory_usage(self):
+        """Bytes held by the index (head and block payloads plus list overhead)."""
+        payload = sum(sys.getsizeof(part) for part in self.heads) + sum(
+            sys.getsizeof(part) for part in self.blocks
+        )
+        return payload + sys.getsizeof(self.heads) + sys.getsizeof(self.blocks)
+
+
+# ✅ Example Execution
+if __name__ == "__main__":
+    words = sorted(["car", "card", "care", "careful", "cart", "cat", "dog", "door", "dot"])
+    index = PrefixIndex(words, block_size=4)
+
+    print(f"Words: {words}")
+    for prefix in ("car", "care", "do", "x", ""):
+        print(f"Prefix {prefix!r}: range {index.prefix_range(prefix)} -> {index.with_prefix(prefix)}")
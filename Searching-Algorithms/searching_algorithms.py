@@ -8,12 +8,16 @@ Description:
 This script contains multiple searching algorithms implemented in Python:
 1. Linear Search
 2. Binary Search (Iterative & Recursive)
-3. Ternary Search
+3. Ternary Search (Recursive & Iterative)
 4. Jump Search
 5. Exponential Search
+6. Interpolation Search
+7. Adaptive Search (picks one of the above from statistics of the array)
 """
 
 import math
+import numbers
+import random
 
 
 # 1️⃣ Linear Search
@@ -26,9 +30,13 @@ def linear_search(arr, target):
 
 
 # 2️⃣ Binary Search (Iterative)
-def binary_search_iterative(arr, target):
-    """Binary search using an iterative approach (array must be sorted)."""
-    left, right = 0, len(arr) - 1
+def binary_search_iterative(arr, target, left=0, right=None):
+    """Binary search using an iterative approach (array must be sorted).
+
+    Optional bounds restrict the search to arr[left..right].
+    """
+    if right is None:
+        right = len(arr) - 1
     while left <= right:
         mid = (left + right) // 2
         if arr[mid] == target:
@@ -75,6 +83,28 @@ def ternary_search(arr, target, left, right):
         return ternary_search(arr, target, mid1 + 1, mid2 - 1)
 
 
+def ternary_search_iterative(arr, target, left=0, right=None):
+    """Ternary search as a loop, without a Python call per level."""
+    if right is None:
+        right = len(arr) - 1
+    while left <= right:
+        mid1 = left + (right - left) // 3
+        mid2 = right - (right - left) // 3
+
+        if arr[mid1] == target:
+            return mid1
+        if arr[mid2] == target:
+            return mid2
+
+        if target < arr[mid1]:
+            right = mid1 - 1
+        elif target > arr[mid2]:
+            left = mid2 + 1
+        else:
+            left, right = mid1 + 1, mid2 - 1
+    return -1
+
+
 # 5️⃣ Jump Search
 def jump_search(arr, target):
     """Jump search for sorted arrays."""
@@ -107,7 +137,172 @@ def exponential_search(arr, target):
     while i < n and arr[i] <= target:
         i *= 2
 
-    return binary_search_recursive(arr, target, i // 2, min(i, n - 1))
+    return binary_search_iterative(arr, target, i // 2, min(i, n - 1))
+
+
+# 7️⃣ Interpolation Search
+def interpolation_search(arr, target):
+    """Interpolation search for sorted numeric arrays.
+
+    Probes where the target should sit if the keys were evenly spread. A
+    probe that does not halve the range is followed by a bisection step,
+    so skewed keys still need only O(log n) probes.
+    """
+    left, right = 0, len(arr) - 1
+    bisect_next = False
+    while left <= right and arr[left] <= target <= arr[right]:
+        if arr[left] == arr[right]:
+            return left
+        if bisect_next:
+            mid = (left + right) // 2
+        else:
+            mid = left + int((target - arr[left]) * (right - left) // (arr[right] - arr[left]))
+            mid = min(max(mid, left), right)
+
+        size = right - left
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+        bisect_next = not bisect_next and right - left > size // 2
+    return -1
+
+
+# 8️⃣ Adaptive Search
+class AdaptiveSearch:
+    """Route every lookup to the cheapest search for this array.
+
+    The array is sampled once when the dispatcher is built: its size, how
+    closely the keys follow a straight line at several zoom levels
+    (uniformity) and how often a key repeats its neighbour (duplicate
+    ratio). While serving lookups it
+    also tracks where the hits land, to detect front-heavy access. That
+    position is an exponentially decayed mean, so the routing follows the
+    recent hits and changes back when the access pattern does.
+
+    ``counters`` counts the lookups sent to each strategy and ``reasons``
+    keeps the latest explanation for choosing it.
+    """
+
+    SMALL_ARRAY = 16          # at most this many keys: a plain scan wins
+    UNIFORM_DEVIATION = 0.05  # mean distance from the ideal line, as a fraction of a window's range
+    MAX_DUPLICATES = 0.5      # above this ratio interpolation probes collapse on runs
+    FRONT_FRACTION = 0.05     # hits averaging before this fraction of n are front-heavy
+    WARMUP = 32               # hits observed before the access pattern is trusted
+    POSITION_DECAY = 1 / 32   # weight of the newest hit in the decayed position mean
+
+    def __init__(self, arr, sample_size=256, seed=0):
+        self.arr = arr
+        self.n = len(arr)
+        self.strategies = {
+            "linear": linear_search,
+            "binary": binary_search_iterative,
+            "interpolation": interpolation_search,
+            "exponential": exponential_search,
+        }
+        self.counters = {name: 0 for name in self.strategies}
+        self.reasons = {}
+        self.stats = self._sample(sample_size, random.Random(seed))
+        self.strategy, self.reason = self._choose()
+        self.hits = 0
+        self.position_mean = 0.0
+
+    def _sample(self, sample_size, rng):
+        n = self.n
+        stats = {"size": n, "numeric": False, "uniform_deviation": None, "duplicate_ratio": 0.0}
+        if n < 2:
+            return stats
+
+        # Duplicate ratio: how often a sampled key equals its right neighbour
+        picks = [rng.randrange(n - 1) for _ in range(min(sample_size, n - 1))]
+        stats["duplicate_ratio"] = sum(bool(self.arr[i] == self.arr[i + 1]) for i in picks) / len(picks)
+
+        first, last = self.arr[0], self.arr[-1]
+        # numbers.Real also covers NumPy's integer and float scalars (but not np.bool_)
+        if not all(isinstance(v, numbers.Real) and not isinstance(v, bool) for v in (first, last)):
+            return stats
+        stats["numeric"] = True
+
+        # Uniformity: interpolation only works if the keys follow a straight
+        # line at every zoom level, so check random windows at widths n, n/4,
+        # n/16, ... and measure how far each window's middle key lies from
+        # the line through its end keys (as a fraction of the window's range)
+        per_width = max(sample_size // 16, 4)
+        deviations = []
+        width = n - 1
+        while width >= 8 or not deviations:
+            for _ in range(per_width):
+                a = rng.randrange(n - width)
+                b = a + width
+                mid = (a + b) // 2
+                span = self.arr[b] - self.arr[a]
+                if span:
+                    expected = self.arr[a] + span * (mid - a) / width
+                    deviations.append(abs(self.arr[mid] - expected) / span)
+                else:
+                    deviations.append(0.0)
+            width //= 4
+        stats["uniform_deviation"] = float(sum(deviations) / len(deviations))
+        return stats
+
+    def _choose(self):
+        stats = self.stats
+        if stats["size"] <= self.SMALL_ARRAY:
+            return "linear", f"only {stats['size']} keys, a scan is cheapest"
+        if (
+            stats["numeric"]
+            and stats["uniform_deviation"] <= self.UNIFORM_DEVIATION
+            and stats["duplicate_ratio"] <= self.MAX_DUPLICATES
+        ):
+            return "interpolation", (
+                f"keys are uniform (deviation {stats['uniform_deviation']:.3f}), "
+                "interpolation needs O(log log n) probes"
+            )
+        if not stats["numeric"]:
+            return "binary", "keys are not numeric"
+        if stats["duplicate_ratio"] > self.MAX_DUPLICATES:
+            return "binary", f"duplicate ratio {stats['duplicate_ratio']:.2f} is too high for interpolation"
+        return "binary", f"keys are skewed (deviation {stats['uniform_deviation']:.3f})"
+
+    def _route(self):
+        if (
+            self.strategy != "linear"
+            and self.hits >= self.WARMUP
+            and self.position_mean < self.FRONT_FRACTION
+        ):
+            return "exponential", (
+                f"recent hits average {self.position_mean:.3f} of the array, "
+                "exponential search costs O(log i) for index i"
+            )
+        return self.strategy, self.reason
+
+    def search(self, target):
+        """Search for target with the strategy currently chosen."""
+        name, reason = self._route()
+        self.counters[name] += 1
+        self.reasons[name] = reason
+        index = self.strategies[name](self.arr, target)
+        if index != -1:
+            # Plain mean over the first hits, then an exponentially decayed one
+            self.hits += 1
+            weight = max(1 / self.hits, self.POSITION_DECAY)
+            self.position_mean += (index / self.n - self.position_mean) * weight
+        return index
+
+    def search_batch(self, targets):
+        """Search for every target; returns a list of indices."""
+        return [self.search(target) for target in targets]
+
+    def report(self):
+        """Return the sampled statistics, per-strategy counters and reasons."""
+        return {
+            "stats": dict(self.stats),
+            "default": self.strategy,
+            "counters": dict(self.counters),
+            "reasons": dict(self.reasons),
+        }
 
 
 # ✅ Example Execution
@@ -122,5 +317,11 @@ if __name__ == "__main__":
     print("Binary Search (Iterative) Index:", binary_search_iterative(arr, target))
     print("Binary Search (Recursive) Index:", binary_search_recursive(arr, target, 0, len(arr) - 1))
     print("Ternary Search Index:", ternary_search(arr, target, 0, len(arr) - 1))
+    print("Ternary Search (Iterative) Index:", ternary_search_iterative(arr, target))
     print("Jump Search Index:", jump_search(arr, target))
     print("Exponential Search Index:", exponential_search(arr, target))
+    print("Interpolation Search Index:", interpolation_search(arr, target))
+
+    dispatcher = AdaptiveSearch(arr)
+    print("Adaptive Search Index:", dispatcher.search(target))
+    print("Adaptive Search Report:", dispatcher.report())
@@ -0,0 +1,130 @@
+import math
+from array import array
+
+from Searching_Algorithms.fibonacci_search import _fibonacciRange
+from Searching_Algorithms.interpolation_search import _interpolationRange
+from Searching_Algorithms.range_search import gallop
+
+
+# Batch entry points for the searching algorithms.
+#
+# Every function takes the searched array plus a batch of queries (a list,
+# an ``array.array`` or a NumPy array) and returns an ``array('q')`` holding
+# the index of each query, or -1 when it is not present. NumPy callers can
+# wrap the result without a copy with ``numpy.frombuffer(result, "int64")``.
+#
+# The sorted-array variants visit the queries in key order and keep a shared
+# cursor: because the next key is never smaller than the current one, its
+# search starts where the previous one stopped, so the whole batch is
+# answered in a single left-to-right pass over ``arr``.
+
+
+def _asList(queries):
+    # NumPy arrays and array.array both know how to unbox themselves
+    if hasattr(queries, "tolist"):
+        return queries.tolist()
+    return list(queries)
+
+
+def _asIndexable(values):
+    # array.array is indexed in place; unboxing 1e8 keys into a list costs GBs
+    if isinstance(values, array):
+        return values
+    return _asList(values)
+
+
+def _sweep(queries, step):
+    """Answer queries in key order, threading a cursor through ``step``.
+
+    ``step(x, cursor)`` returns ``(index, cursor)`` where the new cursor is a
+    position no larger than the first element >= x.
+    """
+    queries = _asList(queries)
+    result = array("q", [-1]) * len(queries)
+
+    order = range(len(queries))
+    if any(queries[i] > queries[i + 1] for i in range(len(queries) - 1)):
+        order = sorted(order, key=queries.__getitem__)
+
+    cursor = 0
+    for i in order:
+        result[i], cursor = step(queries[i], cursor)
+    return result
+
+
+def _gallop(arr, x, cursor, n):
+    # Gallop forward from the cursor to bracket x, then bisect the bracket
+    pos = gallop(arr, x, cursor, n)
+    if pos < n and arr[pos] == x:
+        return pos, pos
+    return -1, pos
+
+
+def binarySearchBatch(arr, queries):
+    n = len(arr)
+    return _sweep(queries, lambda x, cursor: _gallop(arr, x, cursor, n))
+
+
+def jumpSearchBatch(arr, queries, n=None):
+    if n is None:
+        n = len(arr)
+    step_size = max(int(math.sqrt(n)), 1)
+
+    def step(x, cursor):
+        # Jump whole blocks from the cursor, then scan the block linearly
+        prev = cursor
+        while prev < n and arr[min(prev + step_size, n) - 1] < x:
+            prev += step_size
+        end = min(prev + step_size, n)
+        for i in range(prev, end):
+            if arr[i] >= x:
+                return (i if arr[i] == x else -1), i
+        return -1, end
+
+    return _sweep(queries, step)
+
+
+def fibonacciSearchBatch(arr, queries):
+    n = len(arr)
+
+    def step(x, cursor):
+        index, offset = _fibonacciRange(arr, x, cursor, n)
+        if index != -1:
+            return index, index
+        return -1, offset + 1
+
+    return _sweep(queries, step)
+
+
+def interpolationSearchBatch(arr, queries):
+    high = len(arr) - 1
+
+    def step(x, cursor):
+        return _interpolationRange(arr, cursor, high, x)
+
+    return _sweep(queries, step)
+
+
+def linearSearchBatch(arr, queries):
+    # The array is unsorted, so instead of a cursor we make one pass over it
+    # and record the first position of every key that was asked for.
+    queries = _asList(queries)
+    pending = set(queries)
+    first = {}
+    for i, value in enumerate(arr):
+        if not pending:
+            break
+        if value in pending:
+            first[value] = i
+            pending.discard(value)
+    return array("q", [first.get(x, -1) for x in queries])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    arr = [2, 3, 4, 10, 40]
+    queries = [40, 3, 11, 10]
+    print("binary:", binarySearchBatch(arr, queries).tolist())
+    print("jump:", jumpSearchBatch(arr, queries).tolist())
+    print("fibonacci:", fibonacciSearchBatch(arr, queries).tolist())
+    print("interpolation:", interpolationSearchBatch(arr, queries).tolist())
+    print("linear:", linearSearchBatch(arr, queries).tolist())
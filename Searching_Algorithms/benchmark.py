@@ -0,0 +1,643 @@
+"""Benchmark harness for the searching algorithms.
+
+Runs every algorithm from this package and from
+``Searching-Algorithms/searching_algorithms.py`` over sorted arrays of
+several sizes and key distributions, timing hit and miss lookups
+separately. For every run it reports nanoseconds per lookup and key
+comparisons per lookup, writes the results as JSON and can compare them
+against a stored baseline, failing when a run got slower.
+
+Besides the default ``lookup`` suite, ``--suite parallel`` times the
+shared-memory parallel linear search on unsorted arrays for several
+worker counts and chunk sizes, ``--suite prefix`` times prefix range
+queries over a sorted word corpus and ``--suite mixed`` measures the
+throughput of interleaved lookups, inserts and deletes.
+
+Usage (from the repository root)::
+
+    python -m Searching_Algorithms.benchmark --sizes 1e3,1e5 --output bench.json
+    python -m Searching_Algorithms.benchmark --baseline bench.json
+    python -m Searching_Algorithms.benchmark --suite parallel --sizes 1e7 --workers 1,4,16
+    python -m Searching_Algorithms.benchmark --suite prefix --sizes 1e7
+    python -m Searching_Algorithms.benchmark --suite mixed --sizes 1e6 --write-ratios 0.1,0.5
+"""
+
+import argparse
+import bisect
+import importlib.util
+import json
+import math
+import platform
+import random
+import sys
+import time
+from array import array
+from pathlib import Path
+
+from Searching_Algorithms.batch_search import (
+    binarySearchBatch,
+    fibonacciSearchBatch,
+    interpolationSearchBatch,
+    jumpSearchBatch,
+)
+from Searching_Algorithms.binary_search import binarySearch
+from Searching_Algorithms.block_list import SortedBlockList
+from Searching_Algorithms.exponential_search import exponentialSearch
+from Searching_Algorithms.eytzinger_search import EytzingerIndex
+from Searching_Algorithms.fibonacci_search import FibonacciSearch, fibonacciSearch
+from Searching_Algorithms.interpolation_search import interpolationSearch
+from Searching_Algorithms.jump_search import jumpSearch
+from Searching_Algorithms.learned_index import LearnedIndex
+from Searching_Algorithms.linear_search import linearSearch
+from Searching_Algorithms.parallel_linear_search import SharedArraySearch
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent / "Searching-Algorithms"
+SCRIPT_PATH = SCRIPT_DIR / "searching_algorithms.py"
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+DISTRIBUTIONS = ["uniform", "zipf", "exponential", "clustered", "duplicates"]
+
+
+# --- KEY GENERATION ---
+
+def generateKeys(distribution, n, rng):
+    """Return ``n`` sorted integer keys drawn from ``distribution``."""
+    keys = array("q")
+    if distribution == "uniform":
+        # Evenly spread keys: small random gaps
+        value = 0
+        for _ in range(n):
+            value += rng.randint(1, 4)
+            keys.append(value)
+    elif distribution == "zipf":
+        # Heavy-tailed gaps: most keys are dense, a few jumps are huge
+        value = 0
+        for _ in range(n):
+            value += min(int(rng.paretovariate(1.1)), 1 << 40)
+            keys.append(value)
+    elif distribution == "exponential":
+        # Keys crowd towards zero and thin out exponentially
+        scale = 4 * n
+        keys.extend(sorted(int(rng.expovariate(1.0) * scale) for _ in range(n)))
+    elif distribution == "clustered":
+        # Dense runs separated by wide empty stretches
+        value = 0
+        cluster = max(int(math.sqrt(n)), 1)
+        for i in range(n):
+            value += rng.randint(1, 2) if i % cluster else rng.randint(n, 4 * n)
+            keys.append(value)
+    elif distribution == "duplicates":
+        # Few distinct keys, each repeated many times
+        distinct = max(n // 50, 1)
+        keys.extend(sorted(rng.randrange(distinct) for _ in range(n)))
+    else:
+        raise ValueError(f"unknown distribution: {distribution}")
+    return keys
+
+
+def makeQueries(arr, count, rng):
+    """Return ``(hits, misses)``: keys present in ``arr`` and keys that are not."""
+    n = len(arr)
+    hits = [arr[rng.randrange(n)] for _ in range(count)]
+
+    misses = []
+    low, high = arr[0] - 10, arr[-1] + 10
+    # Try in-range values first; fall back to keys outside the array when the
+    # key space is saturated (e.g. the duplicate-heavy distribution).
+    for _ in range(count * 20):
+        if len(misses) == count:
+            break
+        value = rng.randint(low, high)
+        pos = bisect.bisect_left(arr, value)
+        if pos == n or arr[pos] != value:
+            misses.append(value)
+    while len(misses) < count:
+        misses.append(high + len(misses))
+    return hits, misses
+
+
+# --- COMPARISON COUNTING ---
+
+class CountingKey:
+    """Query key that counts how often it is compared with array elements."""
+
+    comparisons = 0
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def _compare(self, other, op):
+        if isinstance(other, CountingKey):
+            other = other.value
+        else:
+            CountingKey.comparisons += 1
+        return op(self.value, other)
+
+    def __eq__(self, other):
+        return self._compare(other, lambda a, b: a == b)
+
+    def __ne__(self, other):
+        return self._compare(other, lambda a, b: a != b)
+
+    def __lt__(self, other):
+        return self._compare(other, lambda a, b: a < b)
+
+    def __le__(self, other):
+        return self._compare(other, lambda a, b: a <= b)
+
+    def __gt__(self, other):
+        return self._compare(other, lambda a, b: a > b)
+
+    def __ge__(self, other):
+        return self._compare(other, lambda a, b: a >= b)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    # Interpolation search does arithmetic on the key
+    def __sub__(self, other):
+        return self.value - other
+
+    def __rsub__(self, other):
+        return other - self.value
+
+
+# --- ALGORITHM REGISTRY ---
+
+class Algorithm:
+    """A named lookup strategy.
+
+    ``prepare(arr)`` returns a callable: ``lookup(x) -> index`` for single
+    lookups, or ``lookup(queries) -> indices`` when ``batch`` is true.
+    """
+
+    def __init__(self, name, prepare, batch=False, max_size=None, source="Searching_Algorithms"):
+        self.name = name
+        self.prepare = prepare
+        self.batch = batch
+        self.max_size = max_size
+        self.source = source
+
+
+def _loadScript(path=SCRIPT_PATH):
+    if not path.exists():  # pragma: no cover
+        return None
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def defaultAlgorithms(linear_limit=10 ** 4, index_limit=10 ** 7):
+    """Return the registry of every algorithm the harness knows about.
+
+    ``index_limit`` caps the prebuilt indexes: their construction is a
+    Python loop over every key, and the Eytzinger layout holds another
+    16 bytes per key next to the array.
+    """
+    algorithms = [
+        Algorithm("binarySearch", lambda arr: lambda x: binarySearch(arr, x)),
+        Algorithm("jumpSearch", lambda arr: lambda x: jumpSearch(arr, x, len(arr))),
+        Algorithm("fibonacciSearch", lambda arr: lambda x: fibonacciSearch(arr, x)),
+        Algorithm("exponentialSearch", lambda arr: lambda x: exponentialSearch(arr, x)),
+        Algorithm("interpolationSearch", lambda arr: lambda x: interpolationSearch(arr, 0, len(arr) - 1, x)),
+        Algorithm("linearSearch", lambda arr: lambda x: linearSearch(arr, x), max_size=linear_limit),
+        Algorithm("binarySearchBatch", lambda arr: lambda q: binarySearchBatch(arr, q), batch=True),
+        Algorithm("jumpSearchBatch", lambda arr: lambda q: jumpSearchBatch(arr, q), batch=True),
+        Algorithm("fibonacciSearchBatch", lambda arr: lambda q: fibonacciSearchBatch(arr, q), batch=True),
+        Algorithm("interpolationSearchBatch", lambda arr: lambda q: interpolationSearchBatch(arr, q), batch=True),
+        Algorithm("EytzingerIndex", lambda arr: EytzingerIndex(arr).search, max_size=index_limit),
+        Algorithm("EytzingerIndexBatch", lambda arr: EytzingerIndex(arr).search_batch, batch=True,
+                  max_size=index_limit),
+        Algorithm("LearnedIndex", lambda arr: LearnedIndex(arr).search, max_size=index_limit),
+        Algorithm("LearnedIndexBatch", lambda arr: LearnedIndex(arr).search_batch, batch=True,
+                  max_size=index_limit),
+        Algorithm("FibonacciSearch", lambda arr: FibonacciSearch(arr).search),
+        Algorithm("FibonacciSearchBatch", lambda arr: FibonacciSearch(arr).search_batch, batch=True),
+    ]
+
+    script = _loadScript()
+    if script is not None:
+        source = "Searching-Algorithms"
+        algorithms += [
+            Algorithm("linear_search", lambda arr: lambda x: script.linear_search(arr, x),
+                      max_size=linear_limit, source=source),
+            Algorithm("binary_search_iterative", lambda arr: lambda x: script.binary_search_iterative(arr, x),
+                      source=source),
+            Algorithm("binary_search_recursive",
+                      lambda arr: lambda x: script.binary_search_recursive(arr, x, 0, len(arr) - 1),
+                      source=source),
+            Algorithm("ternary_search", lambda arr: lambda x: script.ternary_search(arr, x, 0, len(arr) - 1),
+                      source=source),
+            Algorithm("ternary_search_iterative", lambda arr: lambda x: script.ternary_search_iterative(arr, x),
+                      source=source),
+            Algorithm("jump_search", lambda arr: lambda x: script.jump_search(arr, x), source=source),
+            Algorithm("exponential_search", lambda arr: lambda x: script.exponential_search(arr, x),
+                      source=source),
+            Algorithm("interpolation_search", lambda arr: lambda x: script.interpolation_search(arr, x),
+                      source=source),
+            Algorithm("AdaptiveSearch", lambda arr: script.AdaptiveSearch(arr).search, source=source),
+        ]
+    return algorithms
+
+
+# --- MEASUREMENT ---
+
+def _time(lookup, queries, batch):
+    start = time.perf_counter_ns()
+    if batch:
+        lookup(queries)
+    else:
+        for x in queries:
+            lookup(x)
+    return time.perf_counter_ns() - start
+
+
+def _count(lookup, queries, batch):
+    CountingKey.comparisons = 0
+    keys = [CountingKey(x) for x in queries]
+    if batch:
+        lookup(keys)
+    else:
+        for key in keys:
+            lookup(key)
+    return CountingKey.comparisons
+
+
+def measure(algorithm, arr, hits, misses, count_sample=200):
+    """Time one algorithm on one array; return a result row per query kind."""
+    lookup = algorithm.prepare(arr)
+    rows = []
+    for kind, queries in (("hit", hits), ("miss", misses)):
+        row = {
+            "algorithm": algorithm.name,
+            "source": algorithm.source,
+            "kind": kind,
+            "lookups": len(queries),
+        }
+        try:
+            elapsed = _time(lookup, queries, algorithm.batch)
+            sample = queries[:count_sample]
+            comparisons = _count(lookup, sample, algorithm.batch)
+        except (RecursionError, TypeError, IndexError, ZeroDivisionError) as exc:
+            row["error"] = f"{type(exc).__name__}: {exc}"
+        else:
+            row["ns_per_lookup"] = elapsed / max(len(queries), 1)
+            row["comparisons_per_lookup"] = comparisons / max(len(sample), 1)
+        rows.append(row)
+    return rows
+
+
+def runBenchmark(sizes=None, distributions=None, algorithms=None, queries=1000, seed=0, log=None):
+    """Run every algorithm on every (size, distribution) pair."""
+    sizes = sizes or DEFAULT_SIZES
+    distributions = distributions or DISTRIBUTIONS
+    algorithms = algorithms if algorithms is not None else defaultAlgorithms()
+
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            rng = random.Random(f"{seed}-{distribution}-{size}")
+            arr = generateKeys(distribution, size, rng)
+            hits, misses = makeQueries(arr, queries, rng)
+            for algorithm in algorithms:
+                if algorithm.max_size is not None and size > algorithm.max_size:
+                    continue
+                for row in measure(algorithm, arr, hits, misses):
+                    row["size"] = size
+                    row["distribution"] = distribution
+                    results.append(row)
+                    if log is not None:
+                        log(_formatRow(row))
+    return results
+
+
+def runParallelBenchmark(sizes=None, workers=None, chunk_sizes=None, queries=10, seed=0,
+                         linear_limit=10 ** 4, log=None):
+    """Time the parallel linear search on unsorted arrays.
+
+    Every (workers, chunk size) pair answers the same first-match hits,
+    misses and find-all lookups; plain ``linearSearch`` is timed as a
+    single-core reference up to ``linear_limit`` elements.
+    """
+    sizes = sizes or [10 ** 6]
+    workers = workers or [1, 2, 4]
+    chunk_sizes = chunk_sizes or [None]
+
+    results = []
+
+    def record(row):
+        results.append(row)
+        if log is not None:
+            log(_formatRow(row))
+
+    for size in sizes:
+        rng = random.Random(f"{seed}-unsorted-{size}")
+        arr = array("q", (rng.getrandbits(40) for _ in range(size)))
+        # Hits are spread over the whole array; misses force a full scan
+        hits = [arr[rng.randrange(size)] for _ in range(queries)]
+        misses = [-1 - i for i in range(queries)]
+        base = {"size": size, "distribution": "unsorted"}
+
+        if size <= linear_limit:
+            for kind, batch in (("hit", hits), ("miss", misses)):
+                elapsed = _time(lambda x: linearSearch(arr, x), batch, False)
+                record({**base, "algorithm": "linearSearch", "kind": kind,
+                        "lookups": len(batch), "ns_per_lookup": elapsed / len(batch)})
+
+        for count in workers:
+            for chunk in chunk_sizes:
+                with SharedArraySearch(arr, workers=count, chunk_size=chunk) as search:
+                    search.find(-1)  # start the pool before timing
+                    name = f"parallelLinearSearch[w={count},chunk={search.chunk_size}]"
+                    for kind, lookup, batch in (
+                        ("hit", search.find, hits),
+                        ("miss", search.find, misses),
+                        ("all", search.find_all, hits),
+                    ):
+                        elapsed = _time(lookup, batch, False)
+                        record({**base, "algorithm": name, "kind": kind, "lookups": len(batch),
+                                "workers": count, "chunk_size": search.chunk_size,
+                                "ns_per_lookup": elapsed / len(batch)})
+    return results
+
+
+def generateWords(n, rng):
+    """Return ``n`` distinct sorted lowercase words of 3 to 12 letters."""
+    # Skewed letter frequencies give the shared prefixes of a real corpus
+    letters = "etaoinshrdlcumwfgypbvkjxqz"
+    weights = [1 / (rank + 1) for rank in range(len(letters))]
+    words = set()
+    while len(words) < n:
+        length = rng.randint(3, 12)
+        words.add("".join(rng.choices(letters, weights, k=length)))
+    return sorted(words)
+
+
+def runPrefixBenchmark(sizes=None, queries=1000, block_sizes=None, seed=0, log=None):
+    """Time prefix range queries on a sorted word corpus.
+
+    ``PrefixIndex`` (front-coded blocks) is compared with two ``bisect``
+    calls on the plain sorted list; every row also reports the bytes the
+    structure holds.
+    """
+    sizes = sizes or [10 ** 5]
+    block_sizes = block_sizes or [16, 64]
+    prefix_module = _loadScript(SCRIPT_DIR / "prefix_index.py")
+
+    results = []
+
+    def record(row):
+        results.append(row)
+        if log is not None:
+            log(_formatRow(row))
+
+    for size in sizes:
+        rng = random.Random(f"{seed}-words-{size}")
+        words = generateWords(size, rng)
+        hits = [rng.choice(words)[:rng.randint(1, 6)] for _ in range(queries)]
+        # Upper case never occurs in the corpus
+        misses = [rng.choice(words)[:rng.randint(0, 5)] + "Q" for _ in range(queries)]
+        base = {"size": size, "distribution": "words"}
+
+        def bisectRange(prefix):
+            end = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            return bisect.bisect_left(words, prefix), bisect.bisect_left(words, end)
+
+        list_bytes = sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+        structures = [("bisect(list)", bisectRange, list_bytes)]
+        for block_size in block_sizes:
+            index = prefix_module.PrefixIndex(words, block_size)
+            structures.append((f"PrefixIndex[block={block_size}]", index.prefix_range, index.memory_usage()))
+
+        for name, lookup, size_bytes in structures:
+            for kind, batch in (("hit", hits), ("miss", misses)):
+                elapsed = _time(lookup, batch, False)
+                record({**base, "algorithm": name, "kind": kind, "lookups": len(batch),
+                        "bytes": size_bytes, "ns_per_lookup": elapsed / len(batch)})
+    return results
+
+
+def _sortedListOps(arr, lookup):
+    def add(x):
+        bisect.insort(arr, x)
+
+    def discard(x):
+        i = bisect.bisect_left(arr, x)
+        if i < len(arr) and arr[i] == x:
+            del arr[i]
+
+    return lookup, add, discard
+
+
+def runMixedBenchmark(sizes=None, operations=10000, write_ratios=None, seed=0, log=None):
+    """Time mixed read/write workloads on dynamic sorted containers.
+
+    Each workload interleaves lookups with inserts and deletes (half each)
+    in the proportion given by the write ratio. ``SortedBlockList`` is
+    compared with a plain sorted list updated by ``bisect.insort``, with
+    lookups by ``binarySearch`` and by ``jumpSearch``.
+    """
+    sizes = sizes or [10 ** 5]
+    write_ratios = write_ratios or [0.1, 0.5, 0.9]
+
+    results = []
+
+    def record(row):
+        results.append(row)
+        if log is not None:
+            log(_formatRow(row))
+
+    structures = {
+        "SortedBlockList": lambda keys: (
+            lambda values: (values.search, values.add, values.discard)
+        )(SortedBlockList(keys)),
+        "insort+binarySearch": lambda keys: (
+            lambda arr: _sortedListOps(arr, lambda x: binarySearch(arr, x))
+        )(list(keys)),
+        "insort+jumpSearch": lambda keys: (
+            lambda arr: _sortedListOps(arr, lambda x: jumpSearch(arr, x, len(arr)))
+        )(list(keys)),
+    }
+
+    for size in sizes:
+        rng = random.Random(f"{seed}-mixed-{size}")
+        keys = sorted(rng.getrandbits(40) for _ in range(size))
+        for ratio in write_ratios:
+            # The same operation sequence is replayed on every structure
+            ops = []
+            for _ in range(operations):
+                draw = rng.random()
+                if draw >= ratio:
+                    ops.append((0, rng.choice(keys)))
+                elif draw < ratio / 2:
+                    ops.append((1, rng.getrandbits(40)))
+                else:
+                    ops.append((2, rng.choice(keys)))
+
+            for name, build in structures.items():
+                handlers = build(keys)
+                start = time.perf_counter()
+                for op, x in ops:
+                    handlers[op](x)
+                elapsed = (time.perf_counter() - start) * 1e9
+                record({"size": size, "distribution": "mixed", "algorithm": name,
+                        "kind": f"w={ratio:g}", "operations": len(ops), "write_ratio": ratio,
+                        "ns_per_lookup": elapsed / len(ops),
+                        "ops_per_sec": len(ops) / (elapsed / 1e9) if elapsed else 0.0})
+    return results
+
+
+def _formatRow(row):
+    label = f"{row['algorithm']:<26} n={row['size']:<10} {row['distribution']:<12} {row['kind']:<5}"
+    if "error" in row:
+        return f"{label} ERROR {row['error']}"
+    line = f"{label} {row['ns_per_lookup']:>12.1f} ns/lookup"
+    if "comparisons_per_lookup" in row:
+        line += f" {row['comparisons_per_lookup']:>8.1f} cmp/lookup"
+    if "bytes" in row:
+        line += f" {row['bytes'] / 2 ** 20:>10.1f} MiB"
+    return line
+
+
+# --- BASELINE COMPARISON ---
+
+def _key(row):
+    return (row["algorithm"], row["size"], row["distribution"], row["kind"])
+
+
+def compareToBaseline(results, baseline, tolerance=0.25):
+    """Return a description of every run that regressed past ``tolerance``.
+
+    A run regresses when its ns/lookup exceeds the baseline by more than the
+    tolerance ratio, when it needs more comparisons than before, or when it
+    now fails where the baseline succeeded.
+    """
+    previous = {_key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get(_key(row))
+        if old is None or "error" in old:
+            continue
+        name = "/".join(str(part) for part in _key(row))
+        if "error" in row:
+            regressions.append(f"{name}: now fails with {row['error']}")
+            continue
+        if row["ns_per_lookup"] > old["ns_per_lookup"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: {row['ns_per_lookup']:.1f} ns/lookup vs baseline {old['ns_per_lookup']:.1f}"
+            )
+        if "comparisons_per_lookup" not in row or "comparisons_per_lookup" not in old:
+            continue
+        if row["comparisons_per_lookup"] > old["comparisons_per_lookup"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: {row['comparisons_per_lookup']:.1f} cmp/lookup "
+                f"vs baseline {old['comparisons_per_lookup']:.1f}"
+            )
+    return regressions
+
+
+def _parseSizes(text):
+    return [int(float(part)) for part in text.split(",") if part]
+
+
+def _parseChunks(text):
+    return [int(float(part)) if part != "auto" else None for part in text.split(",") if part]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", choices=["lookup", "parallel", "prefix", "mixed"], default="lookup")
+    parser.add_argument("--sizes", type=_parseSizes,
+                        help="comma separated array sizes, e.g. 1e3,1e6,1e8")
+    parser.add_argument("--distributions", default=",".join(DISTRIBUTIONS),
+                        help="comma separated key distributions")
+    parser.add_argument("--algorithms", default="",
+                        help="comma separated algorithm names (default: all)")
+    parser.add_argument("--queries", type=int,
+                        help="hit and miss lookups per run (default: 1000, parallel suite: 10, "
+                             "mixed suite: operations per workload, 10000)")
+    parser.add_argument("--linear-limit", type=int, default=10 ** 4,
+                        help="largest array size for the O(n) linear searches")
+    parser.add_argument("--index-limit", type=lambda text: int(float(text)), default=10 ** 7,
+                        help="largest array size for EytzingerIndex and LearnedIndex")
+    parser.add_argument("--workers", type=_parseSizes, default=[1, 2, 4],
+                        help="parallel suite: comma separated worker counts")
+    parser.add_argument("--chunk-sizes", type=_parseChunks, default=[None],
+                        help="parallel suite: comma separated chunk sizes ('auto' for the default)")
+    parser.add_argument("--block-sizes", type=_parseSizes, default=[16, 64],
+                        help="prefix suite: comma separated front-coding block sizes")
+    parser.add_argument("--write-ratios", type=lambda text: [float(part) for part in text.split(",") if part],
+                        default=[0.1, 0.5, 0.9],
+                        help="mixed suite: comma separated fractions of inserts and deletes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown ratio before a run counts as a regression")
+    args = parser.parse_args(argv)
+
+    if args.suite == "parallel":
+        results = runParallelBenchmark(
+            sizes=args.sizes,
+            workers=args.workers,
+            chunk_sizes=args.chunk_sizes,
+            queries=args.queries or 10,
+            seed=args.seed,
+            linear_limit=args.linear_limit,
+            log=print,
+        )
+    elif args.suite == "prefix":
+        results = runPrefixBenchmark(
+            sizes=args.sizes,
+            queries=args.queries or 1000,
+            block_sizes=args.block_sizes,
+            seed=args.seed,
+            log=print,
+        )
+    elif args.suite == "mixed":
+        results = runMixedBenchmark(
+            sizes=args.sizes,
+            operations=args.queries or 10000,
+            write_ratios=args.write_ratios,
+            seed=args.seed,
+            log=print,
+        )
+    else:
+        algorithms = defaultAlgorithms(args.linear_limit, args.index_limit)
+        if args.algorithms:
+            wanted = set(args.algorithms.split(","))
+            algorithms = [algorithm for algorithm in algorithms if algorithm.name in wanted]
+
+        results = runBenchmark(
+            sizes=args.sizes,
+            distributions=args.distributions.split(","),
+            algorithms=algorithms,
+            queries=args.queries or 1000,
+            seed=args.seed,
+            log=print,
+        )
+    report = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "suite": args.suite,
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["results"]
+        regressions = compareToBaseline(results, baseline, args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -1,6 +1,7 @@
-def binarySearch(arr, x):
-    low = 0
-    high = len(arr) - 1
+def binarySearch(arr, x, low=0, high=None):
+    # Optional bounds restrict the search to arr[low..high]
+    if high is None:
+        high = len(arr) - 1
     while low <= high:
 
         mid = low + (high - low) // 2
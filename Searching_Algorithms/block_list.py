@@ -0,0 +1,199 @@
+import bisect
+import math
+
+# Smallest target block length, so tiny containers are not split into
+# blocks of one or two values
+MIN_LOAD = 32
+
+
+class SortedBlockList:
+    """Sorted container that supports inserts and deletes, built on jump search.
+
+    Jump search splits a sorted array into blocks of about sqrt(n) values,
+    finds the block that can hold x, then searches inside it. Here the
+    blocks are stored as separate lists next to a directory holding the
+    largest value of every block. A lookup searches the directory for the
+    first block whose maximum is not smaller than x, then searches that
+    block. An insert or delete only shifts values inside one block instead
+    of the whole array.
+
+    Blocks are rebalanced as the container grows and shrinks. A block
+    longer than twice the target length (sqrt(n), at least ``MIN_LOAD``)
+    is split in two, and a block shorter than half of it is merged into a
+    neighbour. Pass ``load`` to fix the target length instead.
+
+    Global positions come from a Fenwick tree over the block lengths, so
+    ``search(x)`` returns the index of the first x in sorted order (or -1)
+    in O(log n) like the other searches of this package.
+    """
+
+    def __init__(self, iterable=(), load=None):
+        self._fixed_load = load
+        self._blocks = []
+        self._maxes = []
+        # Fenwick tree over the block lengths, rebuilt when blocks split
+        # or merge and updated in place by single inserts and deletes
+        self._tree = [0]
+        self._n = 0
+        self._rebuild(sorted(iterable))
+
+    def _load(self):
+        if self._fixed_load:
+            return self._fixed_load
+        return max(math.isqrt(self._n), MIN_LOAD)
+
+    def _rebuild(self, values):
+        self._n = len(values)
+        load = self._load()
+        self._blocks = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._build_tree()
+
+    def _build_tree(self):
+        tree = [0] + [len(block) for block in self._blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _update(self, b, delta):
+        tree = self._tree
+        i = b + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, b):
+        """Global index of the first value of block b."""
+        tree = self._tree
+        total = 0
+        while b:
+            total += tree[b]
+            b -= b & -b
+        return total
+
+    def _locate(self, x):
+        """Return ``(block, position)`` of the lower bound of x."""
+        b = bisect.bisect_left(self._maxes, x)
+        if b == len(self._blocks):
+            return b, 0
+        return b, bisect.bisect_left(self._blocks[b], x)
+
+    def __len__(self):
+        return self._n
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, x):
+        b, i = self._locate(x)
+        return b < len(self._blocks) and self._blocks[b][i] == x
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("SortedBlockList index out of range")
+        # Descend the Fenwick tree to the block holding the index
+        tree = self._tree
+        b = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            if b + step < len(tree) and tree[b + step] <= index:
+                b += step
+                index -= tree[b]
+            step >>= 1
+        return self._blocks[b][index]
+
+    def search(self, x):
+        b, i = self._locate(x)
+        if b == len(self._blocks) or self._blocks[b][i] != x:
+            return -1
+        return self._offset(b) + i
+
+    def lower_bound(self, x):
+        """Number of values smaller than x."""
+        b, i = self._locate(x)
+        if b == len(self._blocks):
+            return self._n
+        return self._offset(b) + i
+
+    def add(self, x):
+        """Insert x, keeping the values sorted."""
+        if not self._blocks:
+            self._rebuild([x])
+            return
+
+        b, i = self._locate(x)
+        if b == len(self._blocks):
+            # Larger than everything: append to the last block
+            b -= 1
+            i = len(self._blocks[b])
+            self._maxes[b] = x
+        self._blocks[b].insert(i, x)
+        self._n += 1
+        self._update(b, 1)
+
+        if len(self._blocks[b]) > 2 * self._load():
+            self._split(b)
+
+    def remove(self, x):
+        """Remove one occurrence of x; raise ValueError if it is missing."""
+        if not self.discard(x):
+            raise ValueError(f"{x!r} not in SortedBlockList")
+
+    def discard(self, x):
+        """Remove one occurrence of x if present; return whether it was."""
+        b, i = self._locate(x)
+        if b == len(self._blocks) or self._blocks[b][i] != x:
+            return False
+
+        block = self._blocks[b]
+        del block[i]
+        self._n -= 1
+        if not block:
+            del self._blocks[b], self._maxes[b]
+            self._build_tree()
+            return True
+        self._update(b, -1)
+        self._maxes[b] = block[-1]
+
+        if len(block) < self._load() // 2 and len(self._blocks) > 1:
+            self._merge(b)
+        return True
+
+    def _split(self, b):
+        block = self._blocks[b]
+        half = len(block) // 2
+        self._blocks[b:b + 1] = [block[:half], block[half:]]
+        self._maxes[b:b + 1] = [block[half - 1], block[-1]]
+        self._build_tree()
+
+    def _merge(self, b):
+        # Fold the short block into its left neighbour (the right one for
+        # block 0) and split again if the result became too long
+        if b == 0:
+            b = 1
+        left = self._blocks[b - 1]
+        left.extend(self._blocks[b])
+        del self._blocks[b], self._maxes[b]
+        self._maxes[b - 1] = left[-1]
+        if len(left) > 2 * self._load():
+            self._split(b - 1)
+        else:
+            self._build_tree()
+
+    def block_lengths(self):
+        """Length of every block, for inspecting the current layout."""
+        return [len(block) for block in self._blocks]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    values = SortedBlockList([40, 10, 30, 20], load=2)
+    values.add(25)
+    values.remove(10)
+    print("Values:", list(values))
+    print("Index of 30:", values.search(30))
+    print("Blocks:", values.block_lengths())
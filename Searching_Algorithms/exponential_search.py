@@ -0,0 +1,25 @@
+from Searching_Algorithms.binary_search import binarySearch
+
+
+def exponentialSearch(arr, x, low=0, high=None):
+    # Optional bounds restrict the search to arr[low..high]
+    if high is None:
+        high = len(arr) - 1
+    if low > high:
+        return -1
+    if arr[low] == x:
+        return low
+
+    # Double the step until we overshoot x, then
+    # binary search the last doubling interval
+    bound = 1
+    while low + bound <= high and arr[low + bound] <= x:
+        bound *= 2
+
+    return binarySearch(arr, x, low + bound // 2, min(low + bound, high))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    arr = [1, 4, 7, 10, 14, 18, 21, 25, 29, 33, 37]
+    x = 18
+    print("Element found at index", exponentialSearch(arr, x))
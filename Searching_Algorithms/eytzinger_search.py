@@ -0,0 +1,89 @@
+from array import array
+
+from Searching_Algorithms.batch_search import _asIndexable, _asList
+
+
+def _typecodeFor(values):
+    # Pack numbers into a contiguous typed buffer; anything else stays a list
+    if all(type(v) is int and -(1 << 63) <= v < (1 << 63) for v in values):
+        return "q"
+    if all(type(v) is float for v in values):
+        return "d"
+    return None
+
+
+class EytzingerIndex:
+    """Search index that stores a sorted array in Eytzinger (BFS) order.
+
+    Slot ``k`` holds a node whose children live at ``2k`` and ``2k + 1``, so
+    the first levels of every search share the same few cache lines instead
+    of jumping across the whole array like ``binarySearch`` does.
+
+    ``search(x)`` follows the ``binarySearch`` contract: it returns the
+    position of x in the input array, or -1. With duplicate keys the first
+    occurrence is returned. The input does not have to be sorted; results
+    always refer to positions in the array that was passed in.
+    """
+
+    def __init__(self, arr):
+        values = _asIndexable(arr)
+        n = len(values)
+
+        # Sort positions by key, unless the input already is sorted
+        order = range(n)
+        if any(values[i] > values[i + 1] for i in range(n - 1)):
+            order = sorted(order, key=values.__getitem__)
+
+        typecode = values.typecode if isinstance(values, array) else _typecodeFor(values)
+        # Slot 0 is unused, so reuse the smallest key as filler
+        filler = values[order[0]] if n else 0
+        if typecode is None:
+            self.keys = [filler] * (n + 1)
+        else:
+            self.keys = array(typecode, [filler]) * (n + 1)
+        self.positions = array("q", [-1]) * (n + 1)
+        self.n = n
+
+        # In-order walk of the implicit tree hands out the sorted keys
+        i = 0
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            self.keys[k] = values[order[i]]
+            self.positions[k] = order[i]
+            i += 1
+            k = 2 * k + 1
+
+    def __len__(self):
+        return self.n
+
+    def search(self, x):
+        keys = self.keys
+        n = self.n
+        k = 1
+        # Descend without an equality test: go right whenever the node is
+        # smaller than x. The path spells out the lower bound in binary.
+        while k <= n:
+            k = 2 * k + (keys[k] < x)
+
+        # Undo the trailing right turns plus the last left turn
+        k >>= ((~k) & (k + 1)).bit_length()
+        if k and keys[k] == x:
+            return self.positions[k]
+        return -1
+
+    def search_batch(self, queries):
+        search = self.search
+        return array("q", [search(x) for x in _asList(queries)])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    arr = [2, 3, 4, 10, 40]
+    index = EytzingerIndex(arr)
+    print("Layout:", list(index.keys[1:]))
+    print("Index of 10:", index.search(10))
+    print("Batch:", index.search_batch([40, 11, 2]).tolist())
@@ -1,62 +1,130 @@
+import bisect
+from array import array
+
+
+def _fibonacciTable(limit):
+    """Fibonacci numbers F(0), F(1), ... up to the first one >= limit."""
+    table = [0, 1, 1]
+    while table[-1] < limit:
+        table.append(table[-1] + table[-2])
+    return tuple(table)
+
+
+# Built once at import (94 numbers, enough for any length below 2**63) and
+# never changed, so concurrent searches can share it
+_FIBONACCI = _fibonacciTable(1 << 63)
+
+
 # Returns index of x if present, else returns -1
 def fibonacciSearch(arr, x):
-    n = len(arr)
-
-    if n == 0:
-        return -1 
-
-    # initialize first three fibonacci numbers
-    a =  0
-    b = 1
-    c = 1
- 
-    # iterate while c is smaller than n
-    # c stores the smallest Fibonacci 
-    # number greater than or equal to n
-    while c < n:
-        a = b
-        b = c
-        c = a + b
- 
+    return _fibonacciRange(arr, x, 0, len(arr))[0]
+
+
+def _fibonacciRange(arr, x, start, n):
+    """Fibonacci search restricted to arr[start:n].
+
+    Returns ``(index, offset)`` where ``index`` is the position of x (or -1)
+    and ``offset`` is the last position known to hold a value smaller than x.
+    Batch lookups use the offset to resume the next search.
+    """
+    if n - start <= 0:
+        return -1, start - 1
+    return _fibonacciWalk(arr, x, start, n, _fibonacciIndex(n - start))
+
+
+def _fibonacciIndex(size):
+    """Index k of the smallest Fibonacci number F(k) >= size (at least 2)."""
+    if size > _FIBONACCI[-1]:
+        raise OverflowError("array too large for the Fibonacci table")
+    return bisect.bisect_left(_FIBONACCI, size, 2)
+
+
+def _fibonacciWalk(arr, x, start, n, k):
+    """Search arr[start:n] for x, starting from the Fibonacci number F(k)."""
+    fib = _FIBONACCI
+
     # marks the eliminated range from front
-    offset = -1
- 
-    # while there are elements to be inspected
-    # Note that we compare arr[a] with x. 
-    # When c becomes 1, a becomes 08
-    while c > 1:
+    offset = start - 1
+
+    # F(k) plays the part of the classic c, F(k-1) of b and F(k-2) of a:
+    # while there are elements to be inspected (c > 1), compare arr[a]
+    while k > 2:
 
         # check if a is a valid location
-        i = min(offset + a, n - 1)
- 
+        i = min(offset + fib[k - 2], n - 1)
+
         # if x is greater than the value at index a,
-        # cut the subarray array from offset to i 
+        # cut the subarray array from offset to i
         if arr[i] < x:
-            c = b
-            b = a
-            a = c - b
+            k -= 1
             offset = i
- 
-        # else if x is greater than the value at 
-        # index a,cut the subarray after i+1
+
+        # else if x is smaller than the value at
+        # index a, cut the subarray after i+1
         elif arr[i] > x:
-            c = a
-            b = b - a
-            a = c - b
- 
+            k -= 2
+
         # else if element found, return index
         else:
-            return i
- 
+            return i, offset
+
     # comparing the last element with x
-    if b and arr[offset + 1] == x:
-        return offset + 1
- 
+    if fib[k - 1] and offset + 1 < n and arr[offset + 1] == x:
+        return offset + 1, offset
+
     # element not found, return -1
-    return -1
+    return -1, offset
+
+
+def _asKeys(arr):
+    # array('q'), array('d') and NumPy arrays are searched in place through
+    # a memoryview; anything else (lists, strings) is used as it is
+    try:
+        view = memoryview(arr)
+    except TypeError:
+        return arr
+    if view.ndim == 1 and view.format in ("b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "f", "d"):
+        return view
+    # Non-native byte order or a structured dtype: unbox once instead
+    return arr.tolist()
+
+
+class FibonacciSearch:
+    """Fibonacci search over one sorted array, for repeated lookups.
+
+    The Fibonacci number the search starts from depends only on the array
+    length, so it is found once here instead of on every call. Typed
+    arrays (``array('q')``, ``array('d')``, NumPy arrays) are read through
+    the buffer protocol without being converted to a list.
+
+    ``search(x)`` returns the same index as ``fibonacciSearch(arr, x)``.
+    """
+
+    def __init__(self, arr):
+        self.keys = _asKeys(arr)
+        self.n = len(self.keys)
+        self._k = _fibonacciIndex(self.n)
+
+    def __len__(self):
+        return self.n
+
+    def search(self, x):
+        if self.n == 0:
+            return -1
+        return _fibonacciWalk(self.keys, x, 0, self.n, self._k)[0]
+
+    def search_batch(self, queries):
+        """Look up a batch of keys; returns an ``array('q')`` of indices."""
+        if hasattr(queries, "tolist"):
+            queries = queries.tolist()
+        if self.n == 0:
+            return array("q", [-1]) * len(queries)
+        keys, n, k = self.keys, self.n, self._k
+        return array("q", [_fibonacciWalk(keys, x, 0, n, k)[0] for x in queries])
 
 
 if __name__ == "__main__": # pragma: no cover
     arr = [2, 3, 4, 10, 40]
     x = 10
     print(fibonacciSearch(arr, x))
+    print(FibonacciSearch(array("q", arr)).search_batch([40, 3, 11]).tolist())
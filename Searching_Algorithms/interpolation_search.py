@@ -1,33 +1,58 @@
 def interpolationSearch(arr, low, high, x):
-    # Since array is sorted, an element present
-    # in array must be in range defined by corner
-    if (low <= high and x >= arr[low] and x <= arr[high]):
-        if arr[high] == arr[low]:
-            return low if arr[low] == x else -1
-
-        # Probing the position with keeping
-        # uniform distribution in mind.
-        pos = low + ((high - low) // (arr[high] - arr[low]) * (x - arr[low]))
-
-        # This guard is defensive; for the integer formula and the
-        # outer if-condition pos will always be inside [low, high].
-        # Mark as no cover to avoid unreachable-code coverage failures.
-        if pos < low or pos > high:
-            return -1  # pragma: no cover
+    return _interpolationRange(arr, low, high, x)[0]
 
+
+def _interpolationRange(arr, low, high, x):
+    """Iterative interpolation search over arr[low..high].
+
+    Returns ``(index, cursor)`` where ``index`` is the position of x (or -1)
+    and every element before ``cursor`` is known to be smaller than x.
+
+    Interpolation alone needs O(n) probes on skewed keys, so whenever a
+    probe fails to halve the remaining range the next probe bisects it.
+    Every two probes therefore at least halve the range, which bounds the
+    worst case by O(log n) while uniform keys keep the fast average case.
+    """
+    bisect_next = False
+    while low <= high:
+        lowest = arr[low]
+        highest = arr[high]
+
+        # Since array is sorted, an element present
+        # in array must be in range defined by corner
+        if x < lowest:
+            return -1, low
+        if x > highest:
+            return -1, high + 1
+        if highest == lowest:
+            return low, low
+
+        if bisect_next:
+            pos = low + (high - low) // 2
+        else:
+            # Probing the position with keeping
+            # uniform distribution in mind.
+            pos = low + int((x - lowest) * (high - low) // (highest - lowest))
+            # Float keys can round the probe just outside the range
+            pos = min(max(pos, low), high)
+
+        size = high - low
         # Condition of target found
         if arr[pos] == x:
-            return pos
+            return pos, pos
         # If x is larger, x is in right subarray
         elif arr[pos] < x:
-            return interpolationSearch(arr, pos + 1, high, x)
+            low = pos + 1
         # If x is smaller, x is in left subarray
         else:
-            return interpolationSearch(arr, low, pos - 1, x)
+            high = pos - 1
+
+        # Poor progress: fall back to bisection for the next probe
+        bisect_next = not bisect_next and high - low > size // 2
+
+    return -1, low
 
-    return -1
 
-  
 if __name__ == "__main__":  # pragma: no cover
     arr = [10, 12, 13, 16, 18, 19, 20, 21,
            22, 23, 24, 33, 35, 42, 47]
@@ -37,4 +62,3 @@ if __name__ == "__main__":  # pragma: no cover
         print("Element found at index", index)
     else:
         print("Element not found")
-        
@@ -2,22 +2,23 @@ import math
 from typing import List, Union
 
 
-def jumpSearch(arr: List[Union[int, float, str]], x: Union[int, float, str], n: int) -> int:
+def jumpSearch(arr: List[Union[int, float, str]], x: Union[int, float, str], n: int, start: int = 0) -> int:
+    # Only arr[start:n] is searched; by default the whole array
     # Handle edge case: empty array
-    if n == 0:
+    if n - start <= 0:
         return -1
 
     # If target is smaller than the first element, fail fast
-    if arr[0] > x:
+    if arr[start] > x:
         return -1
 
     # Determine block size to jump
-    step = int(math.sqrt(n))
+    step = int(math.sqrt(n - start))
     if step <= 0:
         step = 1
 
     # Find the block where element may exist
-    prev = 0
+    prev = start
     while prev < n:
         next_idx = min(prev + step, n) - 1
         if arr[next_idx] >= x:
@@ -0,0 +1,126 @@
+import bisect
+import math
+import sys
+from array import array
+
+from Searching_Algorithms.batch_search import _asIndexable, _asList
+from Searching_Algorithms.binary_search import binarySearch
+from Searching_Algorithms.jump_search import jumpSearch
+
+
+def fitSegments(keys, max_error):
+    """Fit a piecewise-linear model mapping sorted keys to positions.
+
+    Uses the greedy shrinking-cone method: a segment starts at a key and is
+    extended for as long as one slope keeps every key of the segment within
+    ``max_error`` positions of its first occurrence. Returns three parallel
+    lists: first key, first position and slope of every segment.
+    """
+    first_keys, starts, slopes = [], [], []
+    n = len(keys)
+    i = 0
+    while i < n:
+        k0 = keys[i]
+        lowest, highest = -math.inf, math.inf
+        j = i + 1
+        while j < n:
+            # Only the first occurrence of a duplicate run is modelled
+            if keys[j] == keys[j - 1]:
+                j += 1
+                continue
+            dk = keys[j] - k0
+            low = max(lowest, (j - max_error - i) / dk)
+            high = min(highest, (j + max_error - i) / dk)
+            if low > high:
+                break
+            lowest, highest = low, high
+            j += 1
+
+        first_keys.append(k0)
+        starts.append(i)
+        slopes.append((lowest + highest) / 2 if highest != math.inf else 0.0)
+        i = j
+    return first_keys, starts, slopes
+
+
+class LearnedIndex:
+    """Read-only learned index over a sorted array of numbers.
+
+    A small piecewise-linear model predicts where a key lives, with at most
+    ``max_error`` positions of error. The lookup then only searches that
+    window of the array with ``binarySearch`` (or ``jumpSearch``).
+
+    ``search(x)`` returns an index of x in ``arr`` or -1, like
+    ``binarySearch``.
+    """
+
+    def __init__(self, arr, max_error=32, local_search="binary"):
+        if local_search not in ("binary", "jump"):
+            raise ValueError(f"unknown local search: {local_search}")
+        self.arr = arr
+        self.n = len(arr)
+        self.max_error = max_error
+        self.local_search = local_search
+
+        keys = _asIndexable(arr)
+        first_keys, starts, slopes = fitSegments(keys, max_error)
+        typecode = "q" if all(type(k) is int for k in first_keys) else "d"
+        self.first_keys = array(typecode, first_keys)
+        self.starts = array("q", starts)
+        self.slopes = array("d", slopes)
+
+    def __len__(self):
+        return self.n
+
+    def predict(self, x):
+        """Return ``(segment, position)`` predicted for x, or ``(-1, -1)``."""
+        segment = bisect.bisect_right(self.first_keys, x) - 1
+        if segment < 0:
+            return -1, -1
+        start = self.starts[segment]
+        position = start + int(self.slopes[segment] * (x - self.first_keys[segment]))
+        return segment, position
+
+    def search(self, x):
+        segment, position = self.predict(x)
+        if segment < 0:
+            return -1
+        # One extra slot on each side absorbs float rounding of the model
+        low = max(position - self.max_error - 1, self.starts[segment])
+        high = min(position + self.max_error + 1, self.n - 1)
+        if low > high:
+            return -1
+        if self.local_search == "jump":
+            return jumpSearch(self.arr, x, high + 1, low)
+        return binarySearch(self.arr, x, low, high)
+
+    def search_batch(self, queries):
+        search = self.search
+        return array("q", [search(x) for x in _asList(queries)])
+
+    def memory_usage(self):
+        """Report the size of the model next to the size of the keys."""
+        model = sum(
+            part.buffer_info()[1] * part.itemsize
+            for part in (self.first_keys, self.starts, self.slopes)
+        )
+        if hasattr(self.arr, "nbytes"):
+            keys = self.arr.nbytes
+        elif isinstance(self.arr, array):
+            keys = self.arr.buffer_info()[1] * self.arr.itemsize
+        else:
+            keys = sys.getsizeof(self.arr) + sum(sys.getsizeof(k) for k in self.arr)
+        return {
+            "segments": len(self.starts),
+            "model_bytes": model,
+            "keys_bytes": keys,
+            "bytes_per_key": model / self.n if self.n else 0.0,
+        }
+
+
+if __name__ == "__main__":  # pragma: no cover
+    arr = [i * i for i in range(1000)]
+    index = LearnedIndex(arr, max_error=8)
+    print("Index of 144:", index.search(144))
+    print("Index of 145:", index.search(145))
+    print("Memory:", index.memory_usage())
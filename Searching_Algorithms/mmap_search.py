@@ -0,0 +1,160 @@
+import bisect
+import mmap
+import os
+from array import array
+
+from Searching_Algorithms.batch_search import _gallop, _sweep
+from Searching_Algorithms.binary_search import binarySearch
+from Searching_Algorithms.exponential_search import exponentialSearch
+from Searching_Algorithms.jump_search import jumpSearch
+
+# Fixed-width key formats, named like NumPy dtypes
+TYPECODES = {"int64": "q", "float64": "d", "q": "q", "d": "d"}
+
+
+def writeKeys(path, keys, dtype="int64"):
+    """Write sorted keys as a flat binary file of fixed-width values.
+
+    Values use the machine's native byte order, the same layout that
+    ``array.tofile`` and ``numpy.ndarray.tofile`` produce.
+    """
+    with open(path, "wb") as f:
+        array(TYPECODES[dtype], keys).tofile(f)
+
+
+class MappedSortedArray:
+    """Sorted array of int64/float64 keys searched straight from disk.
+
+    The file is memory-mapped read-only, so only the pages a search touches
+    are read in; the array itself is never loaded. ``keys`` is a
+    ``memoryview`` over the mapping and can be handed to any function of
+    this package that takes a sorted sequence.
+
+    With ``sparse_every=k`` every k-th key is copied into a small in-memory
+    index. A lookup bisects that index first and then touches a single
+    k-key block of the file instead of probing pages all over it.
+    """
+
+    def __init__(self, path, dtype="int64", sparse_every=None):
+        if dtype not in TYPECODES:
+            raise ValueError(f"unsupported dtype: {dtype}")
+        typecode = TYPECODES[dtype]
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size % array(typecode).itemsize:
+            self._file.close()
+            raise ValueError(f"{path} is not a whole number of {dtype} values")
+
+        if size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.keys = memoryview(self._map).cast(typecode)
+        else:
+            # An empty file cannot be mapped
+            self._map = None
+            self.keys = memoryview(b"").cast(typecode)
+
+        self.sparse_every = sparse_every
+        self.sparse = None
+        if sparse_every:
+            self.sparse = array(typecode, self.keys[::sparse_every])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.keys.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def _window(self, x):
+        # Bounds of the only block that can hold x, as (low, high)
+        n = len(self.keys)
+        if self.sparse is None:
+            return 0, n - 1
+        block = bisect.bisect_right(self.sparse, x) - 1
+        if block < 0:
+            return 0, -1
+        low = block * self.sparse_every
+        return low, min(low + self.sparse_every, n) - 1
+
+    def _lower_window(self, x):
+        # Bounds [low, high) that hold the lower bound of x: the block whose
+        # first key is the last one below x, plus the next block's first slot
+        n = len(self.keys)
+        if self.sparse is None:
+            return 0, n
+        block = bisect.bisect_left(self.sparse, x) - 1
+        if block < 0:
+            return 0, min(1, n)
+        low = block * self.sparse_every
+        return low, min(low + self.sparse_every + 1, n)
+
+    def binary_search(self, x):
+        low, high = self._window(x)
+        return binarySearch(self.keys, x, low, high)
+
+    def exponential_search(self, x):
+        low, high = self._window(x)
+        return exponentialSearch(self.keys, x, low, high)
+
+    def jump_search(self, x):
+        low, high = self._window(x)
+        return jumpSearch(self.keys, x, high + 1, low)
+
+    search = binary_search
+
+    def search_batch(self, queries):
+        """Look up a batch of keys in one forward pass over the file.
+
+        Queries are answered in key order. Each gallop starts from the
+        later of the previous answer and the query's sparse block, so a
+        batch spread over a large file only touches the blocks it needs.
+        Like ``binarySearchBatch``, the first occurrence of a key is
+        returned.
+        """
+        keys = self.keys
+
+        def step(x, cursor):
+            low, high = self._lower_window(x)
+            return _gallop(keys, x, max(cursor, low), high)
+
+        return _sweep(queries, step)
+
+    def search_sorted_stream(self, queries):
+        """Yield the index (or -1) of every key of an ascending query stream.
+
+        The stream is consumed lazily, so it may be larger than memory. Each
+        search gallops forward from the previous result, which keeps page
+        accesses sequential. A key smaller than its predecessor restarts
+        from its sparse block (or the start of the file).
+        """
+        keys = self.keys
+        n = len(keys)
+        cursor = 0
+        previous = None
+        for x in queries:
+            if previous is not None and x < previous:
+                cursor = self._window(x)[0]
+            index, cursor = _gallop(keys, x, cursor, n)
+            previous = x
+            yield index
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "keys.bin")
+        writeKeys(path, range(0, 2_000_000, 2))
+        with MappedSortedArray(path, sparse_every=4096) as keys:
+            print("binary:", keys.binary_search(123456))
+            print("exponential:", keys.exponential_search(123456))
+            print("jump:", keys.jump_search(123457))
+            print("stream:", list(keys.search_sorted_stream([0, 10, 11, 1999998])))
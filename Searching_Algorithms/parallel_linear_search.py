@@ -0,0 +1,203 @@
+import math
+import multiprocessing
+import os
+import struct
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+# Elements a worker scans between two checks of the cancellation bound
+BLOCK = 1 << 16
+
+# Per-process state of the pool workers, set up by _attach
+_shm = None
+_raw = None
+_best = None
+
+
+def _asBuffer(arr):
+    """Return ``(bytes view, typecode)`` for an int64 or float64 array."""
+    try:
+        view = memoryview(arr)
+    except TypeError:
+        view = None
+    if view is not None and view.ndim == 1 and view.itemsize == 8 and view.c_contiguous:
+        # Only native byte order can be matched against the native patterns
+        # of _patterns; "<", ">" and "!" arrays are unboxed below instead
+        fmt = view.format[1:] if view.format[:1] in ("@", "=") else view.format
+        if fmt in ("q", "l"):
+            return view.cast("B"), "q"
+        if fmt == "d":
+            return view.cast("B"), "d"
+
+    # Anything else (lists, other dtypes) is packed into a typed array
+    values = arr.tolist() if hasattr(arr, "tolist") else list(arr)
+    typecode = "q" if all(type(v) is int for v in values) else "d"
+    return memoryview(array(typecode, values)).cast("B"), typecode
+
+
+def _patterns(x, typecode):
+    """Byte patterns of the stored values equal to x (none if x can't match)."""
+    if typecode == "q":
+        if isinstance(x, float):
+            if not x.is_integer():
+                return []
+            x = int(x)
+        if not isinstance(x, int) or not -(1 << 63) <= x < (1 << 63):
+            return []
+        return [struct.pack("q", x)]
+
+    try:
+        value = float(x)
+    except (TypeError, ValueError, OverflowError):
+        return []
+    if value != x or value != value:
+        # Not exactly representable, or NaN which equals nothing
+        return []
+    if value == 0.0:
+        return [struct.pack("d", 0.0), struct.pack("d", -0.0)]
+    return [struct.pack("d", value)]
+
+
+def _scan(start, stop, patterns, first_only):
+    """Indices in [start, stop) whose stored bytes match one of the patterns."""
+    data = bytes(_raw[start * 8:stop * 8])
+    found = []
+    for pattern in patterns:
+        pos = data.find(pattern)
+        while pos != -1:
+            # Only matches on an element boundary count
+            if pos % 8 == 0:
+                found.append(start + pos // 8)
+                if first_only:
+                    break
+                pos = data.find(pattern, pos + 8)
+            else:
+                pos = data.find(pattern, pos + 1)
+    found.sort()
+    return found
+
+
+def _attach(name, best):
+    global _shm, _raw, _best
+    _shm = shared_memory.SharedMemory(name=name)
+    _raw = _shm.buf
+    _best = best
+
+
+def _findFirst(start, stop, patterns):
+    for low in range(start, stop, BLOCK):
+        # Early cancellation: a match before this block was already found
+        if _best.value <= low:
+            return -1
+        found = _scan(low, min(low + BLOCK, stop), patterns, True)
+        if found:
+            with _best.get_lock():
+                if found[0] < _best.value:
+                    _best.value = found[0]
+            return found[0]
+    return -1
+
+
+def _findAll(start, stop, patterns):
+    return _scan(start, stop, patterns, False)
+
+
+class SharedArraySearch:
+    """Parallel linear search over an unsorted int64/float64 array.
+
+    The array is copied once into ``multiprocessing.shared_memory``. A
+    persistent process pool attaches to it, so lookups only send the key
+    and chunk bounds to the workers, never the data. Each worker scans its
+    chunks with ``bytes.find`` over the raw values.
+
+    ``find(x)`` returns the first index of x (or -1). Workers share the
+    lowest match found so far and abandon chunks that start after it.
+    ``find_all(x)`` returns every index of x in order.
+    """
+
+    def __init__(self, arr, workers=None, chunk_size=None):
+        raw, self.typecode = _asBuffer(arr)
+        self.n = len(raw) // 8
+        self.workers = workers or os.cpu_count() or 1
+        # Several chunks per worker keep the pool busy when early chunks finish
+        self.chunk_size = chunk_size or min(max(math.ceil(self.n / (self.workers * 4)), BLOCK), max(self.n, 1))
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(len(raw), 1))
+        self._shm.buf[:len(raw)] = raw
+        context = multiprocessing.get_context()
+        self._best = context.Value("q", self.n)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=_attach,
+            initargs=(self._shm.name, self._best),
+        )
+
+    def __len__(self):
+        return self.n
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._pool.shutdown()
+        self._shm.close()
+        self._shm.unlink()
+
+    def _chunks(self):
+        return [(start, min(start + self.chunk_size, self.n)) for start in range(0, self.n, self.chunk_size)]
+
+    def find(self, x):
+        patterns = _patterns(x, self.typecode)
+        if not patterns or self.n == 0:
+            return -1
+        self._best.value = self.n
+        pending = {
+            self._pool.submit(_findFirst, start, stop, patterns): start
+            for start, stop in self._chunks()
+        }
+        best = self.n
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                index = future.result()
+                if index != -1:
+                    best = min(best, index)
+            if best < self.n:
+                # Chunks after the match can't improve it; drop the queued ones
+                for future, start in list(pending.items()):
+                    if start > best and future.cancel():
+                        del pending[future]
+        return best if best < self.n else -1
+
+    def find_all(self, x):
+        patterns = _patterns(x, self.typecode)
+        result = array("q")
+        if not patterns:
+            return result
+        futures = [self._pool.submit(_findAll, start, stop, patterns) for start, stop in self._chunks()]
+        for future in futures:
+            result.extend(future.result())
+        return result
+
+
+def parallelLinearSearch(arr, x, workers=None, chunk_size=None):
+    with SharedArraySearch(arr, workers, chunk_size) as search:
+        return search.find(x)
+
+
+def parallelLinearSearchAll(arr, x, workers=None, chunk_size=None):
+    with SharedArraySearch(arr, workers, chunk_size) as search:
+        return search.find_all(x)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    arr = array("q", [10, 50, 30, 70, 80, 20, 90, 40, 30])
+    x = 30
+    print("First index:", parallelLinearSearch(arr, x, workers=2, chunk_size=2))
+    print("All indices:", parallelLinearSearchAll(arr, x, workers=2, chunk_size=2).tolist())
@@ -0,0 +1,94 @@
+from Searching_Algorithms.binary_search import binarySearch
+
+
+# Range queries over sorted arrays. Unlike the searches that answer
+# "index of x or -1", these return insertion positions, so they also work
+# for keys that are missing or repeated. Bounds follow the ``bisect``
+# convention: only arr[low:high] is searched and high defaults to len(arr).
+
+
+def lowerBound(arr, x, low=0, high=None):
+    """First position in arr[low:high] whose value is not smaller than x."""
+    if high is None:
+        high = len(arr)
+    while low < high:
+        mid = low + (high - low) // 2
+        if arr[mid] < x:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def upperBound(arr, x, low=0, high=None):
+    """First position in arr[low:high] whose value is greater than x."""
+    if high is None:
+        high = len(arr)
+    while low < high:
+        mid = low + (high - low) // 2
+        if arr[mid] <= x:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def equalRange(arr, x):
+    """Return ``(first, stop)`` such that arr[first:stop] holds every x."""
+    # Any hit splits the array: the run of x lies around it
+    hit = binarySearch(arr, x)
+    if hit == -1:
+        first = lowerBound(arr, x)
+        return first, first
+    return lowerBound(arr, x, 0, hit), upperBound(arr, x, hit + 1)
+
+
+def countInRange(arr, low_key, high_key):
+    """Number of values v with low_key <= v <= high_key."""
+    first = lowerBound(arr, low_key)
+    return max(upperBound(arr, high_key, first) - first, 0)
+
+
+def gallop(arr, x, start=0, high=None):
+    """Lower bound of x in arr[start:high], found by galloping from start.
+
+    Probes start+1, start+2, start+4, ... like exponential search and then
+    bisects the last step, so the cost is O(log d) where d is the distance
+    from start to the answer instead of O(log n).
+    """
+    if high is None:
+        high = len(arr)
+    bound = 1
+    while start + bound < high and arr[start + bound] < x:
+        bound *= 2
+    return lowerBound(arr, x, start + bound // 2, min(start + bound + 1, high))
+
+
+def gallopingIntersect(a, b):
+    """Values present in both sorted arrays, each kept min(count) times.
+
+    Walks the shorter array and gallops through the longer one, so the
+    cost is O(m log(n / m)) instead of the O(n + m) of a plain merge.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    result = []
+    n = len(b)
+    j = 0
+    for x in a:
+        j = gallop(b, x, j)
+        if j == n:
+            break
+        if b[j] == x:
+            result.append(x)
+            j += 1
+    return result
+
+
+if __name__ == "__main__":  # pragma: no cover
+    arr = [1, 2, 2, 2, 3, 5, 8, 8, 13]
+    print("lowerBound(2):", lowerBound(arr, 2))
+    print("upperBound(2):", upperBound(arr, 2))
+    print("equalRange(8):", equalRange(arr, 8))
+    print("countInRange(2, 8):", countInRange(arr, 2, 8))
+    print("gallopingIntersect:", gallopingIntersect(arr, [2, 2, 4, 8, 13, 21]))
@@ -56,6 +56,8 @@ def interpolation_search_arrays():
         "single": [10],
         "out_of_range": [10, 20, 30],
         "go_left": [10, 11, 12, 12, 12],
+        "floats": [0.5, 1.25, 2.0, 3.75, 9.5, 100.0],
+        "exponential": [2 ** i for i in range(2000)],
     }
 
 # --- JUMP SEARCH FIXTURE ---
@@ -76,3 +78,40 @@ def jump_search_arrays():
         "various_types_float": [1.0, 2.5, 3.5],
         "various_types_str": ["a", "b", "c"],
     }
+
+# --- BATCH SEARCH FIXTURE ---
+@pytest.fixture
+def batch_search_arrays():
+    return {
+        "basic": [2, 3, 4, 10, 40],
+        "long": list(range(0, 300, 3)),
+        "single": [5],
+        "empty": [],
+        "duplicates": [1, 2, 2, 2, 3, 3, 7],
+        "negatives": [-20, -10, -5, 0, 5, 10],
+        "floats": [0.5, 1.25, 2.0, 3.75, 9.5],
+    }
+
+# --- EXPONENTIAL SEARCH FIXTURE ---
+@pytest.fixture
+def exponential_search_arrays():
+    return {
+        "basic": [1, 4, 7, 10, 14, 18, 21, 25, 29, 33, 37],
+        "single": [5],
+        "empty": [],
+        "duplicates": [1, 2, 2, 2, 3],
+        "negatives": [-10, -5, 0, 5, 10],
+        "strings": ["apple", "banana", "cherry", "date"],
+    }
+
+# --- RANGE SEARCH FIXTURE ---
+@pytest.fixture
+def range_search_arrays():
+    return {
+        "basic": [2, 3, 4, 10, 40],
+        "duplicates": [1, 2, 2, 2, 3, 5, 8, 8, 13],
+        "all_equal": [7, 7, 7, 7],
+        "single": [5],
+        "empty": [],
+        "strings": ["apple", "banana", "banana", "cherry"],
+    }
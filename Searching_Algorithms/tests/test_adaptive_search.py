@@ -0,0 +1,91 @@
+import pytest
+from Searching_Algorithms import benchmark
+
+script = benchmark._loadScript()
+pytestmark = pytest.mark.skipif(script is None, reason="Searching-Algorithms script not found")
+
+UNIFORM = list(range(0, 30000, 3))
+SKEWED = [2 ** (i // 20) + i for i in range(2000)]
+
+
+@pytest.mark.parametrize(
+    "arr, strategy",
+    [
+        (list(range(10)), "linear"),
+        (UNIFORM, "interpolation"),
+        (SKEWED, "binary"),
+        ([f"key{i:05d}" for i in range(500)], "binary"),
+        (sorted(i // 4 for i in range(2000)), "binary"),
+    ],
+)
+def test_routing(arr, strategy):
+    adaptive = script.AdaptiveSearch(arr)
+    assert adaptive.strategy == strategy
+    for i in (0, len(arr) // 2, len(arr) - 1):
+        assert arr[adaptive.search(arr[i])] == arr[i]
+    assert adaptive.counters[strategy] == 3
+
+
+def test_numpy_arrays_route_like_lists():
+    np = pytest.importorskip("numpy")
+    for arr, strategy in ((np.arange(0, 300000, 3), "interpolation"), (np.array(SKEWED), "binary"),
+                          (np.arange(0, 300000, 3, dtype=np.float64), "interpolation"),
+                          (np.array([False] * 10 + [True] * 30), "binary")):
+        adaptive = script.AdaptiveSearch(arr)
+        assert adaptive.strategy == strategy
+        assert adaptive.stats["numeric"] is (arr.dtype != bool)
+        for i in (0, len(arr) // 3, len(arr) - 1):
+            assert arr[adaptive.search(arr[i])] == arr[i]
+    adaptive = script.AdaptiveSearch(np.arange(0, 300000, 3))
+    assert adaptive.search(4) == -1
+    assert "uniform" in adaptive.reasons["interpolation"]
+
+
+def test_counters_reasons_and_report():
+    adaptive = script.AdaptiveSearch(UNIFORM)
+    assert adaptive.search_batch([3, 4, 29997]) == [1, -1, 9999]
+    report = adaptive.report()
+    assert report["default"] == "interpolation"
+    assert report["counters"] == {"linear": 0, "binary": 0, "interpolation": 3, "exponential": 0}
+    assert "uniform" in report["reasons"]["interpolation"]
+    assert report["stats"]["size"] == len(UNIFORM)
+    assert report["stats"]["numeric"] is True
+    # report() hands out copies
+    report["counters"]["binary"] = 99
+    assert adaptive.counters["binary"] == 0
+
+
+def test_front_heavy_hits_switch_to_exponential():
+    adaptive = script.AdaptiveSearch(SKEWED)
+    front = SKEWED[:20]
+    # No switch before WARMUP hits have been seen
+    for x in (front * 2)[:adaptive.WARMUP]:
+        adaptive.search(x)
+    assert adaptive.counters["exponential"] == 0
+    for x in front:
+        assert SKEWED[adaptive.search(x)] == x
+    assert adaptive.counters["exponential"] > 0
+    assert "O(log i)" in adaptive.reasons["exponential"]
+
+
+def test_never_leaves_linear_for_tiny_arrays():
+    adaptive = script.AdaptiveSearch(list(range(8)))
+    for _ in range(100):
+        adaptive.search(0)
+    assert adaptive.counters == {"linear": 100, "binary": 0, "interpolation": 0, "exponential": 0}
+
+
+def test_routing_recovers_when_access_moves_away_from_the_front():
+    adaptive = script.AdaptiveSearch(SKEWED)
+    for _ in range(200):
+        for x in SKEWED[:10]:
+            adaptive.search(x)
+    assert adaptive._route()[0] == "exponential"
+
+    # A lifetime mean would still sit near the front after 2000 early hits
+    for x in SKEWED[-40:]:
+        adaptive.search(x)
+    assert adaptive._route()[0] == "binary"
+    before = adaptive.counters["binary"]
+    adaptive.search(SKEWED[1000])
+    assert adaptive.counters["binary"] == before + 1
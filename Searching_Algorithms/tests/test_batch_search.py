@@ -0,0 +1,82 @@
+from array import array
+
+import pytest
+from Searching_Algorithms.batch_search import (
+    binarySearchBatch,
+    fibonacciSearchBatch,
+    interpolationSearchBatch,
+    jumpSearchBatch,
+    linearSearchBatch,
+)
+
+SORTED_BATCHES = [
+    binarySearchBatch,
+    jumpSearchBatch,
+    fibonacciSearchBatch,
+    interpolationSearchBatch,
+]
+
+
+def _expected(arr, queries):
+    return [arr.index(x) if x in arr else -1 for x in queries]
+
+
+@pytest.mark.parametrize("batch", SORTED_BATCHES)
+@pytest.mark.parametrize(
+    "arr_key, queries",
+    [
+        ("basic", [2, 3, 4, 10, 40]),
+        ("basic", [40, 1, 10, 11, 2, 41]),
+        ("long", list(range(-5, 310))),
+        ("long", list(range(310, -5, -7))),
+        ("single", [5, 4, 6]),
+        ("empty", [1, 2]),
+        ("negatives", [10, -20, -6, 0, 11]),
+        ("floats", [2.0, 0.5, 9.5, 3.0]),
+    ],
+)
+def test_sorted_batches_match_single_lookups(batch_search_arrays, batch, arr_key, queries):
+    arr = batch_search_arrays[arr_key]
+    assert batch(arr, queries).tolist() == _expected(arr, queries)
+
+
+@pytest.mark.parametrize("batch", SORTED_BATCHES)
+def test_sorted_batches_duplicates(batch_search_arrays, batch):
+    arr = batch_search_arrays["duplicates"]
+    result = batch(arr, [3, 2, 2, 0, 7, 4]).tolist()
+    assert result[0] in (4, 5)
+    assert result[1] in (1, 2, 3)
+    assert result[2] in (1, 2, 3)
+    assert result[3:] == [-1, 6, -1]
+
+
+@pytest.mark.parametrize("batch", SORTED_BATCHES + [linearSearchBatch])
+def test_batches_accept_typed_arrays_and_return_index_array(batch):
+    arr = array("q", range(0, 100, 2))
+    queries = array("q", [98, 0, 51, 50])
+    result = batch(arr, queries)
+    assert isinstance(result, array) and result.typecode == "q"
+    assert result.tolist() == [49, 0, -1, 25]
+
+
+@pytest.mark.parametrize("batch", SORTED_BATCHES + [linearSearchBatch])
+def test_batches_empty_queries(batch_search_arrays, batch):
+    assert batch(batch_search_arrays["basic"], []).tolist() == []
+
+
+def test_jump_search_batch_explicit_length(batch_search_arrays):
+    arr = batch_search_arrays["long"]
+    assert jumpSearchBatch(arr, [3, 297], 10).tolist() == [1, -1]
+
+
+def test_linear_search_batch_unsorted_first_occurrence():
+    arr = [10, 8, 30, 8, 5]
+    assert linearSearchBatch(arr, [8, 5, 7, 10, 8]).tolist() == [1, 4, -1, 0, 1]
+
+
+def test_batches_accept_numpy_queries():
+    np = pytest.importorskip("numpy")
+    arr = list(range(0, 1000, 5))
+    queries = np.array([995, 3, 0, 500], dtype=np.int64)
+    assert binarySearchBatch(arr, queries).tolist() == [199, -1, 0, 100]
+    assert np.frombuffer(linearSearchBatch(arr, queries), dtype=np.int64).tolist() == [199, -1, 0, 100]
@@ -0,0 +1,155 @@
+import json
+import random
+
+import pytest
+from Searching_Algorithms import benchmark
+from Searching_Algorithms.binary_search import binarySearch
+
+
+@pytest.mark.parametrize("distribution", benchmark.DISTRIBUTIONS)
+def test_generated_keys_are_sorted(distribution):
+    keys = benchmark.generateKeys(distribution, 500, random.Random(1))
+    assert len(keys) == 500
+    assert all(a <= b for a, b in zip(keys, keys[1:]))
+
+
+def test_unknown_distribution():
+    with pytest.raises(ValueError):
+        benchmark.generateKeys("gaussian", 10, random.Random(1))
+
+
+@pytest.mark.parametrize("distribution", benchmark.DISTRIBUTIONS)
+def test_queries_split_into_hits_and_misses(distribution):
+    rng = random.Random(2)
+    arr = benchmark.generateKeys(distribution, 300, rng)
+    hits, misses = benchmark.makeQueries(arr, 50, rng)
+    assert len(hits) == len(misses) == 50
+    assert all(x in arr for x in hits)
+    assert not any(x in arr for x in misses)
+
+
+def test_counting_key_counts_element_comparisons():
+    benchmark.CountingKey.comparisons = 0
+    key = benchmark.CountingKey(10)
+    assert binarySearch([2, 3, 4, 10, 40], key) == 3
+    assert benchmark.CountingKey.comparisons > 0
+    before = benchmark.CountingKey.comparisons
+    assert key == benchmark.CountingKey(10)
+    assert benchmark.CountingKey.comparisons == before
+
+
+def test_run_benchmark_reports_every_algorithm():
+    algorithms = benchmark.defaultAlgorithms(linear_limit=100)
+    results = benchmark.runBenchmark(
+        sizes=[64, 200], distributions=["uniform"], algorithms=algorithms, queries=10
+    )
+    names = {row["algorithm"] for row in results}
+    assert {"binarySearch", "ternary_search", "exponential_search"} <= names
+    assert "linearSearch" in {row["algorithm"] for row in results if row["size"] == 64}
+    assert "linearSearch" not in {row["algorithm"] for row in results if row["size"] == 200}
+    for row in results:
+        if "error" not in row:
+            assert row["ns_per_lookup"] > 0
+            assert row["comparisons_per_lookup"] >= 0
+
+
+def test_index_limit_skips_prebuilt_indexes():
+    algorithms = benchmark.defaultAlgorithms(linear_limit=100, index_limit=100)
+    results = benchmark.runBenchmark(
+        sizes=[64, 200], distributions=["uniform"], algorithms=algorithms, queries=10
+    )
+    capped = {"EytzingerIndex", "EytzingerIndexBatch", "LearnedIndex", "LearnedIndexBatch"}
+    assert capped <= {row["algorithm"] for row in results if row["size"] == 64}
+    assert not capped & {row["algorithm"] for row in results if row["size"] == 200}
+
+
+def test_measure_records_errors_instead_of_aborting():
+    def broken(arr):
+        def lookup(x):
+            raise RecursionError("too deep")
+        return lookup
+
+    rows = benchmark.measure(benchmark.Algorithm("broken", broken), [1, 2, 3], [1], [5])
+    assert [row["error"] for row in rows] == ["RecursionError: too deep"] * 2
+
+
+def _row(ns, cmp=10.0, **extra):
+    row = {"algorithm": "a", "size": 10, "distribution": "uniform", "kind": "hit",
+           "ns_per_lookup": ns, "comparisons_per_lookup": cmp}
+    row.update(extra)
+    return row
+
+
+def test_compare_to_baseline():
+    assert benchmark.compareToBaseline([_row(110)], [_row(100)], tolerance=0.25) == []
+    assert len(benchmark.compareToBaseline([_row(200)], [_row(100)], tolerance=0.25)) == 1
+    assert len(benchmark.compareToBaseline([_row(100, cmp=20)], [_row(100)], tolerance=0.25)) == 1
+    assert len(benchmark.compareToBaseline([{**_row(0), "error": "boom"}], [_row(100)])) == 1
+    assert benchmark.compareToBaseline([_row(500)], [{**_row(0), "error": "boom"}]) == []
+
+
+def test_main_writes_report_and_fails_on_regression(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+    argv = ["--sizes", "50", "--distributions", "uniform", "--algorithms", "binarySearch",
+            "--queries", "5", "--output", str(output)]
+    assert benchmark.main(argv) == 0
+    report = json.loads(output.read_text())
+    assert {row["algorithm"] for row in report["results"]} == {"binarySearch"}
+
+    for row in report["results"]:
+        row["ns_per_lookup"] = 1e-6
+    output.write_text(json.dumps(report))
+    assert benchmark.main(argv[:-2] + ["--baseline", str(output)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_compare_to_baseline_without_comparison_counts():
+    row = _row(100)
+    del row["comparisons_per_lookup"]
+    assert benchmark.compareToBaseline([row], [_row(100)]) == []
+    assert len(benchmark.compareToBaseline([{**row, "ns_per_lookup": 300}], [row])) == 1
+
+
+def test_parallel_suite(tmp_path):
+    output = tmp_path / "parallel.json"
+    argv = ["--suite", "parallel", "--sizes", "2000", "--workers", "1,2",
+            "--chunk-sizes", "auto,500", "--queries", "2", "--output", str(output)]
+    assert benchmark.main(argv) == 0
+    report = json.loads(output.read_text())
+    assert report["suite"] == "parallel"
+    rows = report["results"]
+    assert {row["kind"] for row in rows} == {"hit", "miss", "all"}
+    assert {(row.get("workers"), row.get("chunk_size")) for row in rows} == {
+        (None, None), (1, 2000), (1, 500), (2, 2000), (2, 500)
+    }
+
+
+def test_generate_words_sorted_and_distinct():
+    words = benchmark.generateWords(300, random.Random(3))
+    assert len(set(words)) == 300
+    assert words == sorted(words)
+
+
+def test_prefix_suite(tmp_path):
+    output = tmp_path / "prefix.json"
+    argv = ["--suite", "prefix", "--sizes", "500", "--queries", "20",
+            "--block-sizes", "4,16", "--output", str(output)]
+    assert benchmark.main(argv) == 0
+    rows = json.loads(output.read_text())["results"]
+    assert {row["algorithm"] for row in rows} == {
+        "bisect(list)", "PrefixIndex[block=4]", "PrefixIndex[block=16]"
+    }
+    assert all(row["bytes"] > 0 for row in rows)
+
+
+def test_mixed_suite(tmp_path):
+    output = tmp_path / "mixed.json"
+    argv = ["--suite", "mixed", "--sizes", "300", "--queries", "200",
+            "--write-ratios", "0,0.5", "--output", str(output)]
+    assert benchmark.main(argv) == 0
+    rows = json.loads(output.read_text())["results"]
+    assert {row["algorithm"] for row in rows} == {
+        "SortedBlockList", "insort+binarySearch", "insort+jumpSearch"
+    }
+    assert {row["kind"] for row in rows} == {"w=0", "w=0.5"}
+    assert all(row["operations"] == 200 and row["ops_per_sec"] > 0 for row in rows)
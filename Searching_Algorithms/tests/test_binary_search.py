@@ -24,3 +24,10 @@ def test_binary_search(binary_search_arrays, arr_key, target, expected):
         assert result in expected
     else:
         assert result == expected
+
+
+def test_binary_search_bounds(binary_search_arrays):
+    arr = binary_search_arrays["long"]
+    assert binarySearch(arr, 13, 4, 8) == 6
+    assert binarySearch(arr, 3, 4, 8) == -1
+    assert binarySearch(arr, 17, 0, 7) == -1
@@ -0,0 +1,80 @@
+import bisect
+import random
+
+import pytest
+from Searching_Algorithms.block_list import MIN_LOAD, SortedBlockList
+
+
+@pytest.mark.parametrize(
+    "arr_key, target, expected",
+    [
+        ("basic", 10, 3),
+        ("basic", 2, 0),
+        ("basic", 40, 4),
+        ("basic", 99, -1),
+        ("basic", 1, -1),
+        ("empty", 1, -1),
+        ("single", 5, 0),
+        ("single", 6, -1),
+        ("negatives", -5, 1),
+        ("long", 13, 6),
+    ],
+)
+def test_block_list_fixtures(binary_search_arrays, arr_key, target, expected):
+    values = SortedBlockList(binary_search_arrays[arr_key], load=2)
+    assert values.search(target) == expected
+
+
+@pytest.mark.parametrize("load", [None, 1, 3])
+def test_block_list_matches_sorted_list(load):
+    rng = random.Random(load)
+    values = SortedBlockList([rng.randrange(50) for _ in range(100)], load=load)
+    expected = sorted(values)
+    for _ in range(5000):
+        x = rng.randrange(60)
+        draw = rng.random()
+        if draw < 0.45:
+            values.add(x)
+            bisect.insort(expected, x)
+        elif draw < 0.9:
+            assert values.discard(x) == (x in expected)
+            if x in expected:
+                expected.remove(x)
+        else:
+            # Duplicates resolve to the first occurrence
+            first = bisect.bisect_left(expected, x)
+            found = first < len(expected) and expected[first] == x
+            assert values.search(x) == (first if found else -1)
+            assert values.lower_bound(x) == first
+            assert (x in values) == found
+    assert len(values) == len(expected)
+    assert list(values) == expected
+    assert [values[i] for i in range(len(values))] == expected
+
+
+def test_block_list_rebalances():
+    values = SortedBlockList()
+    for x in range(10000):
+        values.add(x)
+    lengths = values.block_lengths()
+    assert sum(lengths) == 10000
+    assert max(lengths) <= 2 * 100
+    for x in range(0, 10000, 2):
+        values.remove(x)
+    lengths = values.block_lengths()
+    assert sum(lengths) == 5000
+    # Only a trailing block may stay below half the target length
+    assert all(length >= MIN_LOAD // 2 for length in lengths[:-1])
+    assert values.search(5001) == 2500
+
+
+def test_block_list_remove_and_index_errors():
+    values = SortedBlockList([3, 1, 2])
+    assert values[-1] == 3
+    with pytest.raises(ValueError):
+        values.remove(4)
+    for x in (1, 2, 3):
+        values.remove(x)
+    assert len(values) == 0 and values.search(1) == -1
+    with pytest.raises(IndexError):
+        values[0]
@@ -0,0 +1,36 @@
+import pytest
+from Searching_Algorithms.exponential_search import exponentialSearch
+
+
+@pytest.mark.parametrize(
+    "arr_key, target, expected",
+    [
+        ("basic", 18, 5),
+        ("basic", 1, 0),
+        ("basic", 37, 10),
+        ("basic", 4, 1),
+        ("basic", 19, -1),
+        ("basic", 0, -1),
+        ("basic", 40, -1),
+        ("single", 5, 0),
+        ("single", 6, -1),
+        ("empty", 1, -1),
+        ("duplicates", 2, [1, 2, 3]),
+        ("negatives", 5, 3),
+        ("strings", "cherry", 2),
+    ],
+)
+def test_exponential_search(exponential_search_arrays, arr_key, target, expected):
+    result = exponentialSearch(exponential_search_arrays[arr_key], target)
+    if isinstance(expected, list):
+        assert result in expected
+    else:
+        assert result == expected
+
+
+def test_exponential_search_bounds(exponential_search_arrays):
+    arr = exponential_search_arrays["basic"]
+    assert exponentialSearch(arr, 18, 3, 7) == 5
+    assert exponentialSearch(arr, 18, 3, 4) == -1
+    assert exponentialSearch(arr, 4, 2) == -1
+    assert exponentialSearch(arr, 4, 5, 4) == -1
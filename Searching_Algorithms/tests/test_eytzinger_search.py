@@ -0,0 +1,67 @@
+from array import array
+
+import pytest
+from Searching_Algorithms.eytzinger_search import EytzingerIndex
+
+
+@pytest.mark.parametrize(
+    "arr_key, target, expected",
+    [
+        ("basic", 10, 3),
+        ("basic", 2, 0),
+        ("basic", 40, 4),
+        ("basic", 99, -1),
+        ("basic", 1, -1),
+        ("empty", 1, -1),
+        ("single", 5, 0),
+        ("single", 1, -1),
+        ("duplicates", 2, 1),
+        ("negatives", -5, 1),
+        ("strings", "cherry", 2),
+        ("long", 13, 6),
+        ("long", 14, -1),
+    ],
+)
+def test_eytzinger_search(binary_search_arrays, arr_key, target, expected):
+    index = EytzingerIndex(binary_search_arrays[arr_key])
+    assert index.search(target) == expected
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 8, 9, 100, 1023, 1024, 1025])
+def test_eytzinger_every_key_and_gap(n):
+    arr = list(range(0, 2 * n, 2))
+    index = EytzingerIndex(arr)
+    assert len(index) == n
+    assert [index.search(x) for x in arr] == list(range(n))
+    assert all(index.search(x) == -1 for x in range(-1, 2 * n + 1, 2))
+
+
+def test_eytzinger_uses_typed_buffers():
+    assert EytzingerIndex([1, 2, 3]).keys.typecode == "q"
+    assert EytzingerIndex([1.5, 2.5]).keys.typecode == "d"
+    assert isinstance(EytzingerIndex(["a", "b"]).keys, list)
+    assert isinstance(EytzingerIndex([1, 2.5]).keys, list)
+
+
+def test_eytzinger_maps_unsorted_input_to_original_positions():
+    arr = [40, 3, 10, 2, 4, 3]
+    index = EytzingerIndex(arr)
+    assert index.search(40) == 0
+    assert index.search(2) == 3
+    assert index.search(3) == 1
+    assert index.search(5) == -1
+
+
+def test_eytzinger_batch(batch_search_arrays):
+    arr = batch_search_arrays["long"]
+    index = EytzingerIndex(array("q", arr))
+    queries = [297, 0, 1, 150, -3]
+    assert index.search_batch(queries).tolist() == [99, 0, -1, 50, -1]
+
+
+def test_eytzinger_reads_typed_arrays_in_place():
+    arr = array("q", [40, 2, 10, 3, 4])
+    index = EytzingerIndex(arr)
+    assert index.keys.typecode == "q"
+    assert [index.search(x) for x in (2, 3, 4, 10, 40, 5)] == [1, 3, 4, 2, 0, -1]
+    assert EytzingerIndex(array("d", [0.5, 1.5])).search(1.5) == 1
@@ -1,5 +1,10 @@
+import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from Searching_Algorithms.fibonacci_search import fibonacciSearch
+from Searching_Algorithms import fibonacci_search
+from Searching_Algorithms.fibonacci_search import FibonacciSearch, fibonacciSearch
 
 @pytest.mark.parametrize(
     "arr_key, target, expected",
@@ -20,3 +25,56 @@ def test_fibonacci_search(fibonacci_search_arrays, arr_key, target, expected):
     arr = fibonacci_search_arrays[arr_key]
     result = fibonacciSearch(arr, target)
     assert result == expected
+    assert FibonacciSearch(arr).search(target) == expected
+
+
+@pytest.mark.parametrize("typecode", ["q", "d"])
+def test_fibonacci_search_object_on_typed_arrays(typecode):
+    rng = random.Random(7)
+    for n in (0, 1, 2, 3, 8, 100, 1000):
+        keys = sorted(rng.sample(range(3 * n + 5), n))
+        index = FibonacciSearch(array(typecode, keys))
+        assert isinstance(index.keys, memoryview)
+        queries = list(range(-2, 3 * n + 7))
+        expected = [fibonacciSearch(keys, x) for x in queries]
+        assert [index.search(x) for x in queries] == expected
+        assert index.search_batch(queries).tolist() == expected
+
+
+def test_fibonacci_search_object_on_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    keys = np.arange(0, 3000, 3)
+    index = FibonacciSearch(keys)
+    assert isinstance(index.keys, memoryview)
+    assert len(index) == 1000
+    assert index.search(2997) == 999
+    assert index.search_batch(np.array([3, 4, 0])).tolist() == [1, -1, 0]
+    # Big-endian data can't be indexed through a memoryview and is unboxed
+    swapped = FibonacciSearch(keys.astype(">i8"))
+    assert swapped.search(30) == 10
+
+
+def test_fibonacci_table_is_complete_and_fixed():
+    table = fibonacci_search._FIBONACCI
+    assert isinstance(table, tuple)
+    assert all(table[k] == table[k - 1] + table[k - 2] for k in range(2, len(table)))
+    assert table[-2] < 1 << 63 <= table[-1]
+    for size in (1, 2, 3, 4, 5, 6, 100, 10 ** 6, (1 << 63) - 1, 1 << 63):
+        k = fibonacci_search._fibonacciIndex(size)
+        assert table[k] >= size and (k == 2 or table[k - 1] < size)
+    with pytest.raises(OverflowError):
+        fibonacci_search._fibonacciIndex(table[-1] + 1)
+
+
+def test_concurrent_searches_agree():
+    keys = list(range(0, 30000, 3))
+    queries = list(range(-3, 30003, 7))
+    expected = [x // 3 if 0 <= x < 30000 and x % 3 == 0 else -1 for x in queries]
+    sizes = [random.Random(i).randint(1, len(keys)) for i in range(64)]
+
+    def run(size):
+        return [fibonacciSearch(keys[:size], x) for x in queries[:200]]
+
+    with ThreadPoolExecutor(8) as pool:
+        for size, result in zip(sizes, pool.map(run, sizes)):
+            assert result == [e if e < size else -1 for e in expected[:200]]
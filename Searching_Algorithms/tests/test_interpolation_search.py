@@ -48,3 +48,41 @@ def test_go_left_branch_recursion(interpolation_search_arrays):
     arr = interpolation_search_arrays["go_left"]
     result = interpolationSearch(arr, 0, len(arr) - 1, 11)
     assert result == 1
+
+
+def test_float_keys(interpolation_search_arrays):
+    arr = interpolation_search_arrays["floats"]
+    for i, x in enumerate(arr):
+        assert interpolationSearch(arr, 0, len(arr) - 1, x) == i
+    assert interpolationSearch(arr, 0, len(arr) - 1, 3.0) == -1
+    assert interpolationSearch(arr, 0, len(arr) - 1, 0.25) == -1
+
+
+def test_skewed_keys_do_not_recurse(interpolation_search_arrays):
+    arr = interpolation_search_arrays["exponential"]
+    high = len(arr) - 1
+    assert interpolationSearch(arr, 0, high, arr[7]) == 7
+    assert interpolationSearch(arr, 0, high, arr[-2]) == high - 1
+    assert interpolationSearch(arr, 0, high, 3) == -1
+
+
+def test_skewed_keys_probe_count_is_logarithmic(interpolation_search_arrays):
+    from Searching_Algorithms.benchmark import CountingKey
+
+    arr = interpolation_search_arrays["exponential"]
+    high = len(arr) - 1
+    # two probes per halving plus the corner checks of each round
+    limit = 4 * 2 * (high.bit_length() + 1)
+    for target in (arr[1], arr[100], arr[1000], arr[1998], 5):
+        CountingKey.comparisons = 0
+        interpolationSearch(arr, 0, high, CountingKey(target))
+        assert CountingKey.comparisons <= limit
+
+
+def test_uniform_keys_need_few_probes():
+    from Searching_Algorithms.benchmark import CountingKey
+
+    arr = list(range(0, 300000, 3))
+    CountingKey.comparisons = 0
+    assert interpolationSearch(arr, 0, len(arr) - 1, CountingKey(123456)) == 41152
+    assert CountingKey.comparisons <= 8
@@ -71,3 +71,13 @@ def test_step_zero_condition(monkeypatch):
     arr = [1, 2, 3]
     result = jump_search_module.jumpSearch(arr, 2, len(arr))
     assert result == 1
+
+
+# --- START OFFSET ---
+def test_start_offset(jump_search_arrays):
+    """Only arr[start:n] is searched."""
+    arr = jump_search_arrays["block_boundary"]
+    assert jumpSearch(arr, 9, len(arr), 3) == 6
+    assert jumpSearch(arr, 2, len(arr), 3) == -1
+    assert jumpSearch(arr, 9, 5, 2) == -1
+    assert jumpSearch(arr, 9, 3, 3) == -1
@@ -0,0 +1,96 @@
+import random
+from array import array
+
+import pytest
+from Searching_Algorithms.learned_index import LearnedIndex, fitSegments
+
+
+def _sortedKeys(n, seed, duplicates=False):
+    rng = random.Random(seed)
+    if duplicates:
+        return sorted(rng.randrange(n // 4) for _ in range(n))
+    return sorted(rng.sample(range(n * 20), n))
+
+
+@pytest.mark.parametrize("max_error", [1, 4, 32])
+def test_model_error_is_bounded(max_error):
+    keys = _sortedKeys(2000, 1)
+    first_keys, starts, slopes = fitSegments(keys, max_error)
+    assert starts[0] == 0 and first_keys[0] == keys[0]
+    segment = 0
+    for position, key in enumerate(keys):
+        while segment + 1 < len(starts) and starts[segment + 1] <= position:
+            segment += 1
+        predicted = starts[segment] + slopes[segment] * (key - first_keys[segment])
+        assert abs(predicted - position) <= max_error + 1e-9
+
+
+def test_linear_keys_need_one_segment():
+    first_keys, starts, slopes = fitSegments(list(range(0, 3000, 3)), 2)
+    assert len(starts) == 1
+    assert slopes[0] == pytest.approx(1 / 3)
+
+
+@pytest.mark.parametrize("local_search", ["binary", "jump"])
+@pytest.mark.parametrize("duplicates", [False, True])
+def test_learned_index_matches_linear_scan(local_search, duplicates):
+    keys = _sortedKeys(3000, 2, duplicates)
+    index = LearnedIndex(keys, max_error=8, local_search=local_search)
+    for x in range(-5, max(keys) + 5, 7):
+        result = index.search(x)
+        if x in keys:
+            assert keys[result] == x
+        else:
+            assert result == -1
+
+
+@pytest.mark.parametrize(
+    "arr_key, target, expected",
+    [
+        ("basic", 10, 3),
+        ("basic", 2, 0),
+        ("basic", 40, 4),
+        ("basic", 99, -1),
+        ("basic", 1, -1),
+        ("empty", 1, -1),
+        ("single", 5, 0),
+        ("single", 6, -1),
+        ("negatives", -5, 1),
+        ("long", 13, 6),
+    ],
+)
+def test_learned_index_fixtures(binary_search_arrays, arr_key, target, expected):
+    assert LearnedIndex(binary_search_arrays[arr_key], max_error=1).search(target) == expected
+
+
+def test_learned_index_float_keys():
+    keys = [i * 0.37 for i in range(500)]
+    index = LearnedIndex(keys, max_error=2)
+    assert index.first_keys.typecode == "d"
+    assert index.search(keys[123]) == 123
+    assert index.search(0.5) == -1
+
+
+def test_learned_index_batch_and_memory():
+    keys = array("q", range(0, 200000, 2))
+    index = LearnedIndex(keys, max_error=16)
+    assert len(index) == 100000
+    assert index.search_batch([0, 3, 199998, 1000]).tolist() == [0, -1, 99999, 500]
+    usage = index.memory_usage()
+    assert usage["segments"] == 1
+    assert usage["keys_bytes"] == 800000
+    assert usage["model_bytes"] < usage["keys_bytes"] / 1000
+    assert LearnedIndex([1, 2, 3]).memory_usage()["keys_bytes"] > 0
+    assert LearnedIndex([]).memory_usage()["bytes_per_key"] == 0.0
+
+
+def test_learned_index_rejects_unknown_local_search():
+    with pytest.raises(ValueError):
+        LearnedIndex([1, 2, 3], local_search="ternary")
+
+
+def test_learned_index_reads_typed_arrays_in_place():
+    keys = _sortedKeys(3000, 7)
+    index = LearnedIndex(array("q", keys), max_error=8)
+    assert index.search_batch(keys[::50]).tolist() == list(range(0, 3000, 50))
+    assert index.search(keys[-1] + 1) == -1
@@ -0,0 +1,81 @@
+import pytest
+from Searching_Algorithms.mmap_search import MappedSortedArray, writeKeys
+
+KEYS = list(range(0, 20000, 2))
+
+
+@pytest.fixture
+def key_file(tmp_path):
+    path = tmp_path / "keys.bin"
+    writeKeys(path, KEYS)
+    return path
+
+
+@pytest.mark.parametrize("sparse_every", [None, 1, 64, 100, 50000])
+@pytest.mark.parametrize("method", ["binary_search", "exponential_search", "jump_search"])
+def test_mapped_search(key_file, sparse_every, method):
+    with MappedSortedArray(key_file, sparse_every=sparse_every) as mapped:
+        assert len(mapped) == len(KEYS)
+        search = getattr(mapped, method)
+        for x in (0, 2, 4242, 19998, 9000):
+            assert search(x) == x // 2
+        for x in (-2, 1, 4243, 20000):
+            assert search(x) == -1
+
+
+def test_mapped_float_keys(tmp_path):
+    path = tmp_path / "keys.f64"
+    writeKeys(path, [0.5, 1.5, 2.25, 8.0], dtype="float64")
+    with MappedSortedArray(path, dtype="float64", sparse_every=2) as mapped:
+        assert mapped.search(2.25) == 2
+        assert mapped.search(2.0) == -1
+
+
+def test_mapped_batch_and_stream(key_file):
+    with MappedSortedArray(key_file, sparse_every=128) as mapped:
+        assert mapped.search_batch([19998, 3, 0, 500]).tolist() == [9999, -1, 0, 250]
+        stream = iter([0, 6, 7, 19998, 10, 20000])
+        assert list(mapped.search_sorted_stream(stream)) == [0, 3, -1, 9999, 5, -1]
+        assert list(mapped.search_sorted_stream([8, -4, 4])) == [4, -1, 2]
+
+
+@pytest.mark.parametrize("sparse_every", [None, 1, 3, 16, 1000])
+def test_mapped_batch_matches_binary_search_batch(tmp_path, sparse_every):
+    import random
+
+    from Searching_Algorithms.batch_search import binarySearchBatch
+
+    rng = random.Random(sparse_every)
+    # Runs of duplicates cross block boundaries
+    keys = sorted(rng.randrange(300) for _ in range(900))
+    path = tmp_path / "dups.bin"
+    writeKeys(path, keys)
+    queries = [rng.randrange(-5, 305) for _ in range(400)]
+    with MappedSortedArray(path, sparse_every=sparse_every) as mapped:
+        assert mapped.search_batch(queries).tolist() == binarySearchBatch(keys, queries).tolist()
+        assert mapped.search_batch(sorted(queries)).tolist() == binarySearchBatch(keys, sorted(queries)).tolist()
+
+
+def test_mapped_keys_view_works_with_plain_functions(key_file):
+    from Searching_Algorithms.fibonacci_search import fibonacciSearch
+
+    with MappedSortedArray(key_file) as mapped:
+        assert fibonacciSearch(mapped.keys, 4242) == 2121
+
+
+def test_mapped_empty_file(tmp_path):
+    path = tmp_path / "empty.bin"
+    writeKeys(path, [])
+    with MappedSortedArray(path, sparse_every=4) as mapped:
+        assert len(mapped) == 0
+        assert mapped.search(1) == -1
+        assert mapped.search_batch([1]).tolist() == [-1]
+
+
+def test_mapped_rejects_bad_files(tmp_path):
+    path = tmp_path / "odd.bin"
+    path.write_bytes(b"\x00" * 12)
+    with pytest.raises(ValueError):
+        MappedSortedArray(path)
+    with pytest.raises(ValueError):
+        MappedSortedArray(path, dtype="int32")
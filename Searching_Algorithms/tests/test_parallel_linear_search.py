@@ -0,0 +1,105 @@
+import multiprocessing
+from array import array
+
+import pytest
+from Searching_Algorithms import parallel_linear_search as pls
+from Searching_Algorithms.parallel_linear_search import (
+    SharedArraySearch,
+    parallelLinearSearch,
+    parallelLinearSearchAll,
+)
+
+
+@pytest.fixture(scope="module")
+def search():
+    arr = array("q", [7, 3, 9, 3, -1, 0, 9, 12, 3, 5] * 3)
+    with SharedArraySearch(arr, workers=2, chunk_size=4) as shared:
+        yield shared
+
+
+@pytest.mark.parametrize(
+    "target, expected",
+    [
+        (7, 0),
+        (3, 1),
+        (12, 7),
+        (5, 9),
+        (-1, 4),
+        (0, 5),
+        (4, -1),
+        (3.0, 1),
+        (3.5, -1),
+        ("3", -1),
+        (1 << 70, -1),
+    ],
+)
+def test_find_first(search, target, expected):
+    assert search.find(target) == expected
+
+
+def test_find_all(search):
+    assert len(search) == 30
+    assert search.find_all(3).tolist() == [1, 3, 8, 11, 13, 18, 21, 23, 28]
+    assert search.find_all(42).tolist() == []
+    assert search.find_all("x").tolist() == []
+
+
+def test_matches_only_on_element_boundaries():
+    # 256 packs to bytes that also occur inside the neighbouring values
+    arr = array("q", [1 << 16, 1 << 8, 256])
+    assert parallelLinearSearch(arr, 256, workers=1) == 1
+    assert parallelLinearSearchAll(arr, 256, workers=1).tolist() == [1, 2]
+    assert parallelLinearSearch(arr, 1, workers=1) == -1
+
+
+def test_float_arrays():
+    arr = [2.5, -0.0, 1e300, 2.5, float("nan")]
+    assert parallelLinearSearch(arr, 0, workers=2, chunk_size=2) == 1
+    assert parallelLinearSearch(arr, 1e300, workers=2, chunk_size=2) == 2
+    assert parallelLinearSearchAll(arr, 2.5, workers=2, chunk_size=2).tolist() == [0, 3]
+    assert parallelLinearSearch(arr, float("nan"), workers=1) == -1
+    assert parallelLinearSearch(arr, (1 << 60) + 1, workers=1) == -1
+    assert parallelLinearSearch(arr, None, workers=1) == -1
+
+
+def test_empty_array():
+    assert parallelLinearSearch([], 1, workers=1) == -1
+    assert parallelLinearSearchAll([], 1, workers=1).tolist() == []
+
+
+def test_numpy_array():
+    np = pytest.importorskip("numpy")
+    arr = np.array([5, 1, 4, 1], dtype=np.int64)
+    assert parallelLinearSearch(arr, 1, workers=2, chunk_size=1) == 1
+    assert parallelLinearSearch(np.array([0.5, 1.5]), 1.5, workers=1) == 1
+    assert parallelLinearSearch(np.array([3, 4], dtype=np.int32), 4, workers=1) == 1
+
+
+@pytest.mark.parametrize("dtype", [">i8", "<i8", ">f8", "<f8"])
+def test_numpy_byte_order(dtype):
+    np = pytest.importorskip("numpy")
+    arr = np.array([5, 3, 7, 3], dtype=dtype)
+    assert parallelLinearSearch(arr, 3, workers=2, chunk_size=1) == 1
+    assert parallelLinearSearchAll(arr, 3, workers=2, chunk_size=1).tolist() == [1, 3]
+    assert parallelLinearSearch(arr, 4, workers=1) == -1
+
+
+def test_workers_stop_after_an_earlier_match():
+    arr = array("q", range(100))
+    shm = pls.shared_memory.SharedMemory(create=True, size=800)
+    try:
+        shm.buf[:800] = memoryview(arr).cast("B")
+        best = multiprocessing.Value("q", 100)
+        pls._attach(shm.name, best)
+        patterns = pls._patterns(60, "q")
+        assert pls._findFirst(50, 100, patterns) == 60
+        assert best.value == 60
+        # A chunk starting after the known match is abandoned unscanned
+        assert pls._findFirst(70, 100, pls._patterns(80, "q")) == -1
+        best.value = 100
+        assert pls._findFirst(70, 100, pls._patterns(80, "q")) == 80
+    finally:
+        pls._raw = None
+        pls._shm.close()
+        shm.close()
+        shm.unlink()
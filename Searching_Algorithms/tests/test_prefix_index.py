@@ -0,0 +1,93 @@
+import bisect
+import random
+
+import pytest
+from Searching_Algorithms import benchmark
+
+prefix_module = benchmark._loadScript(benchmark.SCRIPT_DIR / "prefix_index.py")
+pytestmark = pytest.mark.skipif(prefix_module is None, reason="prefix_index.py not found")
+
+ALPHABET = "abcé日ßz😀"
+
+
+def _words(n, seed):
+    rng = random.Random(seed)
+    words = {"".join(rng.choice(ALPHABET[:rng.randint(2, len(ALPHABET))]) for _ in range(rng.randint(1, 6)))
+             for _ in range(n)}
+    return sorted(words)
+
+
+def _oracle(words, prefix):
+    # bisect to the first candidate, then walk while the prefix still matches
+    start = stop = bisect.bisect_left(words, prefix)
+    while stop < len(words) and words[stop].startswith(prefix):
+        stop += 1
+    return start, stop
+
+
+def _prefixes(words, seed):
+    rng = random.Random(seed)
+    prefixes = {"", "a", "ab", "é", "日", "😀", "ß", "zz", "x", "\U0010ffff", words[-1] + "a", words[0][:-1]}
+    for word in rng.sample(words, min(len(words), 60)):
+        prefixes.add(word[:rng.randint(1, len(word))])
+    return sorted(prefixes)
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 4, 16, 1000])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_prefix_range_matches_bisect(block_size, seed):
+    words = _words(600, seed)
+    index = prefix_module.PrefixIndex(words, block_size)
+    assert len(index) == len(words)
+    for prefix in _prefixes(words, seed):
+        start, stop = _oracle(words, prefix)
+        assert index.prefix_range(prefix) == (start, stop), prefix
+        assert index.count(prefix) == stop - start
+        assert index.with_prefix(prefix) == words[start:stop]
+
+
+def test_matches_cross_block_boundaries():
+    words = sorted([f"car{i:03d}" for i in range(50)] + ["apple", "cat", "dog"])
+    index = prefix_module.PrefixIndex(words, block_size=4)
+    start, stop = index.prefix_range("car")
+    assert (start, stop) == (1, 51)
+    # The range covers more than a dozen blocks and starts mid-block
+    assert start % 4 and stop // 4 - start // 4 > 10
+    assert index.with_prefix("car") == words[1:51]
+    assert index.with_prefix("car04") == [f"car04{i}" for i in range(10)]
+
+
+def test_empty_prefix_and_keys_past_the_end():
+    words = ["alpha", "beta", "gamma"]
+    index = prefix_module.PrefixIndex(words, block_size=2)
+    assert index.prefix_range("") == (0, 3)
+    assert index.with_prefix("") == words
+    assert index.prefix_range("zeta") == (3, 3)
+    assert index.with_prefix("gammas") == []
+    assert index.prefix_range("0") == (0, 0)
+
+
+def test_empty_index():
+    index = prefix_module.PrefixIndex([])
+    assert len(index) == 0
+    assert index.prefix_range("") == (0, 0)
+    assert index.with_prefix("a") == []
+
+
+def test_utf8_round_trip_and_indexing():
+    words = sorted(["naïve", "naïveté", "nación", "日本", "日本語", "😀", "😀😀"])
+    index = prefix_module.PrefixIndex(words, block_size=3)
+    assert list(index) == words
+    assert [index[i] for i in range(-len(words), len(words))] == words + words
+    assert index.with_prefix("naï") == ["naïve", "naïveté"]
+    assert index.with_prefix("日本") == ["日本", "日本語"]
+    assert index.with_prefix("😀") == ["😀", "😀😀"]
+    with pytest.raises(IndexError):
+        index[len(words)]
+
+
+def test_rejects_unsorted_words_and_bad_block_size():
+    with pytest.raises(ValueError):
+        prefix_module.PrefixIndex(["b", "a"])
+    with pytest.raises(ValueError):
+        prefix_module.PrefixIndex(["a"], block_size=0)
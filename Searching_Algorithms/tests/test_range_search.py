@@ -0,0 +1,84 @@
+import bisect
+import random
+
+import pytest
+from Searching_Algorithms.range_search import (
+    countInRange,
+    equalRange,
+    gallop,
+    gallopingIntersect,
+    lowerBound,
+    upperBound,
+)
+
+KEYS = ["basic", "duplicates", "all_equal", "single", "empty"]
+
+
+@pytest.mark.parametrize("arr_key", KEYS)
+def test_bounds_match_bisect(range_search_arrays, arr_key):
+    arr = range_search_arrays[arr_key]
+    for x in range(-1, 45):
+        assert lowerBound(arr, x) == bisect.bisect_left(arr, x)
+        assert upperBound(arr, x) == bisect.bisect_right(arr, x)
+        assert equalRange(arr, x) == (bisect.bisect_left(arr, x), bisect.bisect_right(arr, x))
+
+
+def test_bounds_with_limits(range_search_arrays):
+    arr = range_search_arrays["duplicates"]
+    assert lowerBound(arr, 2, 2) == 2
+    assert upperBound(arr, 2, 0, 3) == 3
+    assert lowerBound(arr, 8, 0, 4) == 4
+
+
+@pytest.mark.parametrize(
+    "arr_key, low, high, expected",
+    [
+        ("duplicates", 2, 8, 7),
+        ("duplicates", 2, 2, 3),
+        ("duplicates", 4, 4, 0),
+        ("duplicates", 8, 2, 0),
+        ("duplicates", -10, 100, 9),
+        ("all_equal", 7, 7, 4),
+        ("empty", 0, 10, 0),
+        ("strings", "b", "c", 2),
+    ],
+)
+def test_count_in_range(range_search_arrays, arr_key, low, high, expected):
+    assert countInRange(range_search_arrays[arr_key], low, high) == expected
+
+
+def test_strings_equal_range(range_search_arrays):
+    assert equalRange(range_search_arrays["strings"], "banana") == (1, 3)
+
+
+def test_gallop_from_start(range_search_arrays):
+    arr = range_search_arrays["duplicates"]
+    for start in range(len(arr) + 1):
+        for x in range(0, 15):
+            assert gallop(arr, x, start) == max(bisect.bisect_left(arr, x), start)
+
+
+def _multisetIntersection(a, b):
+    rest = list(b)
+    result = []
+    for x in a:
+        if x in rest:
+            rest.remove(x)
+            result.append(x)
+    return sorted(result)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_galloping_intersect(seed):
+    rng = random.Random(seed)
+    a = sorted(rng.randrange(50) for _ in range(rng.randrange(1, 40)))
+    b = sorted(rng.randrange(50) for _ in range(rng.randrange(1, 200)))
+    assert gallopingIntersect(a, b) == _multisetIntersection(a, b)
+    assert gallopingIntersect(b, a) == _multisetIntersection(a, b)
+
+
+def test_galloping_intersect_edges(range_search_arrays):
+    dup = range_search_arrays["duplicates"]
+    assert gallopingIntersect(dup, []) == []
+    assert gallopingIntersect([100, 200], dup) == []
+    assert gallopingIntersect([2, 2, 4, 8, 13, 21], dup) == [2, 2, 8, 13]
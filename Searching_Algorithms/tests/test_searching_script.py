@@ -0,0 +1,38 @@
+import pytest
+from Searching_Algorithms import benchmark
+
+script = benchmark._loadScript()
+pytestmark = pytest.mark.skipif(script is None, reason="Searching-Algorithms script not found")
+
+ARR = list(range(0, 200, 2))
+
+
+@pytest.mark.parametrize("search", ["ternary_search_iterative", "binary_search_iterative"])
+def test_bounded_search_only_looks_inside_the_bounds(search):
+    search = getattr(script, search)
+    assert all(search(ARR, x) == x // 2 for x in ARR)
+    assert search(ARR, 3) == -1
+    assert search(ARR, 40, 10, 30) == 20
+    assert search(ARR, 20, 10, 30) == 10
+    assert search(ARR, 60, 10, 30) == 30
+    # Present in the array, but outside [left, right]
+    assert search(ARR, 18, 10, 30) == -1
+    assert search(ARR, 62, 10, 30) == -1
+    assert search(ARR, 40, 20, 19) == -1
+    assert search([], 1) == -1
+
+
+def test_ternary_iterative_matches_recursive():
+    arr = sorted({(i * 37) % 1000 for i in range(300)})
+    for x in range(-5, 1005):
+        for left, right in ((0, len(arr) - 1), (17, 250), (40, 41), (5, 5)):
+            assert (script.ternary_search_iterative(arr, x, left, right)
+                    == script.ternary_search(arr, x, left, right))
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 8, 9, 100, 1025])
+def test_exponential_search_uses_the_bounded_binary_search(n):
+    arr = list(range(0, 3 * n, 3))
+    assert [script.exponential_search(arr, x) for x in arr] == list(range(n))
+    assert all(script.exponential_search(arr, x) == -1 for x in (-1, 1, 3 * n))
+    assert script.exponential_search([], 0) == -1